@@ -3,8 +3,12 @@
 """
 import speech_recognition as sr
 import time
+import queue
+import threading
 import numpy as np
 
+from instrumentation import metrics
+
 
 class AudioHandler:
     """오디오 입출력을 담당하는 클래스"""
@@ -35,10 +39,12 @@ class AudioHandler:
         try:
             with self.microphone as source:
                 print("   🔴 듣고 있습니다...")
-                audio = self.recognizer.listen(source, timeout=20, phrase_time_limit=15)
+                with metrics.timer('mic_capture'):
+                    audio = self.recognizer.listen(source, timeout=20, phrase_time_limit=15)
                 print("   ⚫ 녹음 완료! 인식 중...")
 
-            result = self.recognizer.recognize_google(audio, language='ko-KR')
+            with metrics.timer('stt'):
+                result = self.recognizer.recognize_google(audio, language='ko-KR')
             print(f"📝 인식된 한국어: {result}")
             return result
 
@@ -55,8 +61,9 @@ class AudioHandler:
             try:
                 import sounddevice as sd
                 print(f"      🔊 오디오 재생 중... (샘플레이트: {sample_rate}Hz)")
-                sd.play(audio_array, sample_rate)
-                sd.wait()
+                with metrics.timer('playback'):
+                    sd.play(audio_array, sample_rate)
+                    sd.wait()
                 print("      ✅ 오디오 재생 완료")
             except ImportError:
                 print("      ⚠️ sounddevice 없음. 파일로 저장합니다.")
@@ -68,6 +75,76 @@ class AudioHandler:
             except:
                 print("      ❌ 오디오 저장도 실패")
 
+    def play_stream(self, chunks, sample_rate=22050):
+        """오디오 청크를 생성되는 대로 재생 (첫 청크부터 바로 재생 시작)
+
+        chunks는 float32 배열을 내보내는 이터러블(예: synthesize_stream)이며,
+        뒤쪽 문장은 재생 중에 별도 스레드에서 계속 합성됩니다.
+        재생한 전체 샘플 수를 반환합니다.
+        """
+        chunk_queue = queue.Queue(maxsize=8)
+        played = []
+        finished = False
+
+        def produce():
+            try:
+                for chunk in chunks:
+                    chunk_queue.put(chunk)
+            except Exception as e:
+                print(f"      ❌ 오디오 청크 생성 실패: {e}")
+            finally:
+                chunk_queue.put(None)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+
+        try:
+            import sounddevice as sd
+        except ImportError:
+            print("      ⚠️ sounddevice 없음. 파일로 저장합니다.")
+            sd = None
+
+        try:
+            if sd is not None:
+                print(f"      🔊 스트리밍 재생 중... (샘플레이트: {sample_rate}Hz)")
+                playback_time = 0.0  # 합성 대기 시간을 제외한 재생 시간
+                with sd.OutputStream(samplerate=sample_rate, channels=1, dtype='float32') as stream:
+                    while True:
+                        chunk = chunk_queue.get()
+                        if chunk is None:
+                            finished = True
+                            break
+                        chunk = np.asarray(chunk, dtype=np.float32)
+                        write_start = time.perf_counter()
+                        stream.write(chunk.reshape(-1, 1))
+                        playback_time += time.perf_counter() - write_start
+                        played.append(chunk)
+                metrics.observe('playback', playback_time)
+                print("      ✅ 오디오 재생 완료")
+            else:
+                while True:
+                    chunk = chunk_queue.get()
+                    if chunk is None:
+                        finished = True
+                        break
+                    played.append(np.asarray(chunk, dtype=np.float32))
+                if played:
+                    self.save_audio(np.concatenate(played), sample_rate)
+        except Exception as e:
+            print(f"      ❌ 스트리밍 재생 실패: {e}")
+            # 남은 청크까지 모아서 파일로 저장
+            while not finished:
+                chunk = chunk_queue.get()
+                if chunk is None:
+                    finished = True
+                    break
+                played.append(np.asarray(chunk, dtype=np.float32))
+            if played:
+                self.save_audio(np.concatenate(played), sample_rate)
+
+        producer.join()
+        return sum(len(chunk) for chunk in played)
+
     def save_audio(self, audio_array, sample_rate=22050):
         """생성된 오디오를 파일로 저장"""
         try:
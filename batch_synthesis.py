@@ -0,0 +1,223 @@
+"""
+배치 음성 합성 모듈 (Glow-TTS + HiFi-GAN 일괄 추론)
+"""
+import re
+import time
+
+import numpy as np
+import torch
+
+from model_export import SENTENCE_GAP_SAMPLES
+from streaming_vocoder import inference_padding_frames
+
+
+class BatchSynthesizer:
+    """여러 문장을 길이별로 묶어 한 번에 추론하는 클래스
+
+    TTS.utils.synthesizer.Synthesizer 가 이미 로드한 모델과 AudioProcessor를
+    그대로 사용하며, 모델을 다시 로드하지 않습니다.
+    """
+
+    def __init__(self, synthesizer, batch_size=8):
+        self.synthesizer = synthesizer
+        self.batch_size = batch_size
+
+        self.tts_model = synthesizer.tts_model
+        self.tts_config = synthesizer.tts_config
+        self.vocoder_model = synthesizer.vocoder_model
+        self.ap = synthesizer.ap
+        self.vocoder_ap = getattr(synthesizer, 'vocoder_ap', None)
+
+    @property
+    def hop_length(self):
+        """멜 프레임당 샘플 수"""
+        if self.vocoder_ap is not None:
+            return self.vocoder_ap.hop_length
+        return self.ap.hop_length
+
+    def supports_batching(self):
+        """보코더 샘플레이트가 같을 때만 배치 추론 지원 (보간 생략)"""
+        if self.vocoder_model is None or self.vocoder_ap is None:
+            return False
+        return self.vocoder_ap.sample_rate == self.ap.sample_rate
+
+    def text_to_ids(self, text):
+        """정규화된 텍스트를 토큰 ID 배열로 변환"""
+        tokenizer = getattr(self.tts_model, 'tokenizer', None)
+        if tokenizer is not None:
+            return np.asarray(tokenizer.text_to_ids(text), dtype=np.int64)
+
+        from TTS.tts.utils.synthesis import text_to_seqvec
+        return np.asarray(text_to_seqvec(text, self.tts_config), dtype=np.int64)
+
+    def make_buckets(self, token_lengths):
+        """토큰 길이순으로 정렬한 뒤 batch_size 단위로 묶은 인덱스 목록 반환"""
+        order = sorted(range(len(token_lengths)), key=lambda i: token_lengths[i])
+        return [order[i:i + self.batch_size] for i in range(0, len(order), self.batch_size)]
+
+    @torch.no_grad()
+    def text_to_mels(self, token_ids):
+        """토큰 배치를 Glow-TTS로 추론하여 (멜 목록, 프레임 길이 목록) 반환
+
+        각 멜은 보코더 입력용으로 정규화된 [채널, 프레임] numpy 배열입니다.
+        """
+        lengths = torch.tensor([len(ids) for ids in token_ids], dtype=torch.long)
+        inputs = torch.zeros(len(token_ids), int(lengths.max()), dtype=torch.long)
+        for i, ids in enumerate(token_ids):
+            inputs[i, :len(ids)] = torch.from_numpy(ids)
+
+        outputs = self.run_glowtts(inputs, lengths)
+        model_outputs = outputs['model_outputs']  # [B, T, C]
+        mel_lengths = self.predicted_mel_lengths(outputs, lengths, model_outputs.shape[1])
+
+        mels = []
+        for i, mel_length in enumerate(mel_lengths):
+            # 예측된 길이만큼 잘라낸 뒤 보코더 정규화로 변환
+            mel = model_outputs[i, :mel_length].cpu().numpy()
+            mel = self.ap.denormalize(mel.T).T
+            mels.append(self.vocoder_ap.normalize(mel.T))
+        return mels, mel_lengths
+
+    def run_glowtts(self, inputs, lengths):
+        """TTS 버전에 따라 다른 Glow-TTS inference 시그니처 처리"""
+        try:
+            return self.tts_model.inference(inputs, aux_input={'x_lengths': lengths})
+        except TypeError:
+            return self.tts_model.inference(inputs, cond_input={'x_lengths': lengths})
+
+    def predicted_mel_lengths(self, outputs, lengths, max_frames):
+        """예측 지속시간으로 문장별 멜 프레임 수 계산
+
+        GlowTTS.inference의 durations_log는 length_scale과 올림을 적용한 토큰별 프레임 수 w_ceil에 대해
+        log(1 + w_ceil) 이므로, 멜 길이는 GlowTTS.inference의 y_lengths와 같이 clamp_min(sum(w_ceil), 1) 입니다.
+        """
+        durations_log = outputs.get('durations_log')
+        if durations_log is not None:
+            durations_log = durations_log.reshape(len(lengths), -1)
+            mask = torch.arange(durations_log.shape[1])[None, :] < lengths[:, None]
+            durations = torch.round(torch.exp(durations_log) - 1) * mask
+            mel_lengths = durations.sum(dim=1).clamp(min=1, max=max_frames)
+            return [int(length) for length in mel_lengths]
+
+        # 지속시간이 없으면 정렬 행렬에서 유효 프레임 수 계산
+        alignments = outputs['alignments']  # [B, T_de, T_en]
+        return [int(length) for length in (alignments.sum(dim=2) > 0).sum(dim=1)]
+
+    @torch.no_grad()
+    def vocode(self, mels):
+        """패딩된 멜 배치를 HiFi-GAN으로 변환 후 문장별로 잘라 반환
+
+        문장마다 혼자 추론할 때와 같이 inference 복제 패딩 출력까지 포함하도록,
+        짧은 문장 뒤에는 마지막 프레임을 패딩 길이만큼 복제한 뒤 무음에 가까운 값으로 채웁니다.
+        """
+        padding = inference_padding_frames(self.vocoder_model)
+        max_frames = max(mel.shape[1] for mel in mels)
+        pad_value = float(min(mel.min() for mel in mels))
+
+        batch = np.full((len(mels), mels[0].shape[0], max_frames), pad_value, dtype=np.float32)
+        for i, mel in enumerate(mels):
+            batch[i, :, :mel.shape[1]] = mel
+            batch[i, :, mel.shape[1]:mel.shape[1] + padding] = mel[:, -1:]
+
+        waveforms = self.vocoder_model.inference(torch.from_numpy(batch))
+        waveforms = waveforms.reshape(len(mels), -1).cpu().numpy()
+
+        return [waveforms[i, :(mel.shape[1] + 2 * padding) * self.hop_length].astype(np.float32)
+                for i, mel in enumerate(mels)]
+
+    def split_into_sentences(self, text):
+        """Synthesizer.tts와 같은 문장 분리 (Synthesizer에 분리기가 없으면 문장부호 기준)"""
+        split = getattr(self.synthesizer, 'split_into_sentences', None)
+        if split is not None:
+            return split(text)
+        return [s.strip() for s in re.findall(r'[^.!?]*[.!?]|[^.!?]+$', text) if s.strip()]
+
+    def trim_silence(self, wav):
+        """Synthesizer.tts와 같이 설정의 do_trim_silence가 켜져 있으면 문장 끝 무음 제거"""
+        audio_config = self.tts_config['audio'] if 'audio' in self.tts_config else None
+        if audio_config is not None and 'do_trim_silence' in audio_config and audio_config['do_trim_silence']:
+            return wav[:self.ap.find_endpoint(wav)]
+        return wav
+
+    def synthesize_batch(self, normalized_texts):
+        """정규화된 문장 목록을 일괄 합성하여 입력 순서대로 파형 반환
+
+        Synthesizer.tts와 같이 입력마다 문장을 나누고 문장 뒤에 무음을 붙이므로,
+        같은 텍스트는 순차 합성과 같은 길이/구성의 파형이 됩니다 (합성 캐시를 함께 사용).
+        """
+        sentences = []
+        owners = []
+        for index, text in enumerate(normalized_texts):
+            for sentence in self.split_into_sentences(text):
+                sentences.append(sentence)
+                owners.append(index)
+
+        sentence_wavs = [None] * len(sentences)
+        token_ids = [self.text_to_ids(sentence) for sentence in sentences]
+        for bucket in self.make_buckets([len(ids) for ids in token_ids]):
+            mels, _ = self.text_to_mels([token_ids[i] for i in bucket])
+            for index, wav in zip(bucket, self.vocode(mels)):
+                sentence_wavs[index] = self.trim_silence(wav)
+
+        gap = np.zeros(SENTENCE_GAP_SAMPLES, dtype=np.float32)
+        pieces = [[] for _ in normalized_texts]
+        for index, wav in zip(owners, sentence_wavs):
+            pieces[index] += [wav, gap]
+        return [np.concatenate(wavs) if wavs else np.zeros(0, dtype=np.float32) for wavs in pieces]
+
+
+def benchmark_batch_synthesis(loader, texts, repeats=3, batch_size=8):
+    """순차 합성 대비 배치 합성 처리량 비교"""
+    normalized_texts = [loader.normalize_text(text) for text in texts]
+    batcher = BatchSynthesizer(loader.synthesizer, batch_size=batch_size)
+
+    def measure(fn):
+        best = float('inf')
+        total_samples = 0
+        for _ in range(repeats):
+            start = time.perf_counter()
+            wavs = fn()
+            best = min(best, time.perf_counter() - start)
+            total_samples = sum(len(wav) for wav in wavs)
+        return best, total_samples
+
+    sequential_time, sequential_samples = measure(
+        lambda: [loader.synthesizer.tts(text, None, None) for text in normalized_texts])
+    batch_time, batch_samples = measure(lambda: batcher.synthesize_batch(normalized_texts))
+
+    sample_rate = loader.synthesizer.output_sample_rate
+    result = {
+        'sentences': len(texts),
+        'batch_size': batch_size,
+        'sequential_sec': sequential_time,
+        'batch_sec': batch_time,
+        'sequential_sentences_per_sec': len(texts) / sequential_time,
+        'batch_sentences_per_sec': len(texts) / batch_time,
+        'sequential_rtf': sequential_time / (sequential_samples / sample_rate),
+        'batch_rtf': batch_time / (batch_samples / sample_rate),
+        'speedup': sequential_time / batch_time,
+    }
+
+    print("📊 배치 합성 벤치마크")
+    print(f"   순차: {result['sequential_sec']:.3f}초 ({result['sequential_sentences_per_sec']:.2f} 문장/초)")
+    print(f"   배치: {result['batch_sec']:.3f}초 ({result['batch_sentences_per_sec']:.2f} 문장/초)")
+    print(f"   속도 향상: {result['speedup']:.2f}배")
+    return result
+
+
+if __name__ == "__main__":
+    import sys
+    from tts_model_loader import TTSModelLoader
+
+    tts_loader = TTSModelLoader(sys.argv[1] if len(sys.argv) > 1 else "data", use_cache=False)
+    if tts_loader.load_models():
+        benchmark_batch_synthesis(tts_loader, [
+            "안녕하세요.",
+            "오늘 날씨가 정말 좋네요.",
+            "간장 공장 공장장은 강 공장장이고 된장 공장 공장장은 공 공장장이다.",
+            "저는 음성 합성 시스템입니다.",
+            "내일 다시 만나요!",
+            "경찰청 철창살은 외철창살이냐 쌍철창살이냐.",
+            "감사합니다.",
+            "이 문장은 배치 추론 처리량을 측정하기 위한 조금 더 긴 문장입니다.",
+        ])
@@ -0,0 +1,5 @@
+"""
+오프라인 벤치마크 모음 (정규화 / 발음 변환 / 합성 RTF·메모리)
+
+실행: python -m bench.run_benchmarks --data-path data
+"""
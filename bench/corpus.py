@@ -0,0 +1,83 @@
+"""
+벤치마크용 고정 문장 모음 (결과 비교를 위해 내용을 바꾸면 CORPUS_VERSION을 올림)
+"""
+
+CORPUS_VERSION = 1
+
+# 한국어 입력 (inference_demo.py의 학습 미사용 문장 포함)
+KOREAN = {
+    'short': [
+        "안녕하세요.",
+        "감사합니다.",
+        "내일 다시 만나요!",
+        "오늘 날씨가 정말 좋네요.",
+        "저는 음성 합성 시스템입니다.",
+        "잠시만 기다려 주세요.",
+    ],
+    'medium': [
+        "서울특별시 특허허가과 허가과장 허과장.",
+        "경찰청 철창살은 외철창살이고 검찰청 철창살은 쌍철창살이다.",
+        "지향을 지양으로 오기하는 일을 지양하는 언어 습관을 지향해야 한다.",
+        "간장 공장 공장장은 강 공장장이고 된장 공장 공장장은 공 공장장이다.",
+    ],
+    'long': [
+        "그러니까 외계인이 우리 생각을 읽고 우리 생각을 우리가 다시 생각토록 해서 "
+        "그 생각이 마치 우리가 생각한 것인 것처럼 속였다는 거냐?",
+        "안 촉촉한 초코칩 나라에 살던 안 촉촉한 초코칩이 촉촉한 초코칩 나라의 촉촉한 초코칩을 보고 "
+        "촉촉한 초코칩이 되고 싶어서 촉촉한 초코칩 나라에 갔는데 촉촉한 초코칩 나라의 촉촉한 문지기가 "
+        "넌 촉촉한 초코칩이 아니고 안 촉촉한 초코칩이니까 안 촉촉한 초코칩 나라에서 살라고 해서 "
+        "안 촉촉한 초코칩은 촉촉한 초코칩이 되는 것을 포기하고 안 촉촉한 눈물을 흘리며 "
+        "안 촉촉한 초코칩 나라로 돌아갔다.",
+    ],
+}
+
+# 영어 알파벳이 섞인 한국어 입력 (정규화에서 알파벳 읽기 변환 발생)
+MIXED = {
+    'short': [
+        "USB 꽂아 주세요.",
+        "PDF 파일을 보냈어요.",
+        "CPU 사용률이 높아요.",
+        "TV 좀 꺼 줄래?",
+    ],
+    'medium': [
+        "회의 자료는 PPT로 만들고 최종본은 PDF로 공유해 주세요.",
+        "GPU 메모리가 부족하면 batch 크기를 줄이고 다시 시도하세요.",
+        "AI 스피커에게 BTS 노래를 틀어 달라고 했어요, 그런데 볼륨이 너무 컸어요.",
+    ],
+    'long': [
+        "이번 분기 KPI 보고서에는 API 응답 시간, DB 쿼리 수, CDN 캐시 적중률이 포함되어야 하며 "
+        "QA 팀은 iOS와 Android 빌드를 모두 확인한 뒤 PM에게 결과를 공유해야 합니다.",
+        "NASA와 ESA가 공동으로 진행한 JWST 프로젝트는 IR 관측으로 초기 은하를 촬영했고, "
+        "연구진은 ML 모델을 이용해 TB 단위의 데이터를 분석했다고 CNN과 BBC가 보도했습니다.",
+    ],
+}
+
+# 영어 입력 (발음 변환기 테스트 문장 포함)
+ENGLISH = {
+    'short': [
+        "Hello, how are you today?",
+        "Thank you very much.",
+        "See you tomorrow!",
+        "I'm fine.",
+        "Good morning.",
+        "What time is it?",
+    ],
+    'medium': [
+        "I'm going to the store to buy some food.",
+        "She's working on her computer right now.",
+        "We'll meet at the restaurant at seven o'clock.",
+        "Can you help me with this difficult problem?",
+        "The children are playing in the beautiful garden.",
+        "I'd like to order a hamburger and french fries, please.",
+    ],
+    'long': [
+        "Technology is changing our lives very quickly, and we don't always notice how much "
+        "our daily habits have shifted until we look back at the way things used to be.",
+        "If you can't find the train station, ask someone at the information desk near the "
+        "main entrance, and they'll show you the fastest way to get there before it leaves.",
+        "Happy birthday! I hope you have a wonderful day with your family and friends, and "
+        "that the coming year brings you everything you've been wishing for.",
+    ],
+}
+
+CATEGORIES = ('short', 'medium', 'long')
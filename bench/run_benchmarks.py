@@ -0,0 +1,347 @@
+"""
+오프라인 벤치마크 실행 모듈 (정규화 처리량, 발음 변환 처리량, 합성 RTF / 메모리)
+
+    python -m bench.run_benchmarks --data-path data
+    python -m bench.run_benchmarks --standin --baseline bench/results/<이전 결과>.json
+
+실제 체크포인트가 없으면 작은 무작위 초기화 대체 모델로 합성을 측정합니다.
+결과는 호스트 정보, git 커밋, 스레드 수와 함께 JSON 파일로 저장되어 이후 실행과 비교할 수 있습니다.
+"""
+import os
+import gc
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+
+import numpy as np
+import torch
+
+from bench.corpus import CORPUS_VERSION, CATEGORIES, KOREAN, MIXED, ENGLISH
+from bench.standin_model import attach_standin, model_parameter_bytes
+
+SUITES = ('normalize', 'pronunciation', 'synthesis')
+DEFAULT_OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+# 비교 시 값이 클수록 좋은 지표 (나머지는 작을수록 좋음)
+HIGHER_IS_BETTER = ('_per_sec',)
+
+
+def time_repeats(fn, repeats, warmup=1):
+    """fn 실행 시간(초) 목록 (워밍업 제외)"""
+    for _ in range(warmup):
+        fn()
+    timings = []
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def timing_summary(timings):
+    return {'median_sec': statistics.median(timings), 'best_sec': min(timings), 'repeats': len(timings)}
+
+
+def current_memory():
+    """현재 프로세스 RSS와 최대 RSS (바이트, 측정할 수 없으면 None)"""
+    from worker_pool import process_memory
+
+    memory = process_memory(os.getpid()) or {}
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        memory['peak_rss'] = peak if sys.platform == 'darwin' else peak * 1024
+    except ImportError:
+        memory['peak_rss'] = None
+    return {'rss': memory.get('rss'), 'peak_rss': memory.get('peak_rss')}
+
+
+def bench_normalization(loader, repeats, iterations=200):
+    """TTSModelLoader.normalize_text 처리량 (한국어 / 영어 혼합 입력)"""
+    results = {}
+    for corpus_name, corpus in (('korean', KOREAN), ('mixed', MIXED)):
+        for category in CATEGORIES:
+            texts = corpus[category]
+            chars = sum(len(text) for text in texts) * iterations
+
+            def run():
+                for _ in range(iterations):
+                    for text in texts:
+                        loader.normalize_text(text)
+
+            summary = timing_summary(time_repeats(run, repeats))
+            seconds = summary['median_sec']
+            results[f"{corpus_name}_{category}"] = dict(
+                summary,
+                sentences_per_sec=len(texts) * iterations / seconds,
+                chars_per_sec=chars / seconds,
+            )
+    return results
+
+
+def bench_pronunciation(repeats, iterations=20):
+    """EnglishToKoreanPronunciation 생성 시간과 convert_text 처리량 (영어 입력)"""
+    from pronunciation_converter import EnglishToKoreanPronunciation
+
+    start = time.perf_counter()
+    converter = EnglishToKoreanPronunciation()
+    results = {'init': {'seconds': time.perf_counter() - start}}
+
+    for category in CATEGORIES:
+        texts = ENGLISH[category]
+        words = sum(len(text.split()) for text in texts) * iterations
+
+        def run():
+            for _ in range(iterations):
+                for text in texts:
+                    converter.convert_text(text)
+
+        summary = timing_summary(time_repeats(run, repeats))
+        seconds = summary['median_sec']
+        results[f"english_{category}"] = dict(
+            summary,
+            sentences_per_sec=len(texts) * iterations / seconds,
+            words_per_sec=words / seconds,
+        )
+
+    if hasattr(converter, 'convert_batch'):
+        # 전체 영어 문장을 한 배치로 변환 (배치 내 고유 단어는 한 번만 변환)
+        texts = [text for category in CATEGORIES for text in ENGLISH[category]] * iterations
+        words = sum(len(text.split()) for text in texts)
+        summary = timing_summary(time_repeats(lambda: converter.convert_batch(texts), repeats))
+        results['english_batch'] = dict(
+            summary,
+            sentences_per_sec=len(texts) / summary['median_sec'],
+            words_per_sec=words / summary['median_sec'],
+        )
+
+    if hasattr(converter, 'trace_corpus'):
+        # 변환 + 단어별 규칙/신뢰도 추적을 한 번에 계산하는 발음 QA 보고서
+        texts = [text for category in CATEGORIES for text in ENGLISH[category]] * iterations
+        words = sum(len(text.split()) for text in texts)
+        summary = timing_summary(time_repeats(lambda: converter.trace_corpus(texts), repeats))
+        results['english_report'] = dict(
+            summary,
+            sentences_per_sec=len(texts) / summary['median_sec'],
+            words_per_sec=words / summary['median_sec'],
+        )
+
+    if hasattr(converter, 'get_word_cache_stats'):
+        results['word_cache'] = converter.get_word_cache_stats()
+    return results
+
+
+def bench_synthesis(loader, repeats):
+    """문장 길이별 합성 RTF(합성 시간 / 오디오 길이)와 메모리 (캐시 미사용)"""
+    sample_rate = loader.synthesizer.output_sample_rate
+    results = {'model_parameter_bytes': model_parameter_bytes(loader.synthesizer),
+               'memory_before': current_memory()}
+
+    for corpus_name, corpus in (('korean', KOREAN), ('mixed', MIXED)):
+        for category in CATEGORIES:
+            texts = corpus[category]
+            samples = []
+
+            def run():
+                samples[:] = [len(loader.synthesize(text)) for text in texts]
+
+            summary = timing_summary(time_repeats(run, repeats))
+            audio_seconds = sum(samples) / sample_rate
+            results[f"{corpus_name}_{category}"] = dict(
+                summary,
+                audio_sec=audio_seconds,
+                rtf=summary['median_sec'] / audio_seconds,
+                best_rtf=summary['best_sec'] / audio_seconds,
+            )
+
+    results['memory_after'] = current_memory()
+    return results
+
+
+def load_benchmark_loader(data_path, standin=False, seed=0):
+    """체크포인트가 있으면 실제 모델, 없거나 standin이면 대체 모델을 연결한 로더 반환"""
+    from tts_model_loader import TTSModelLoader
+
+    loader = TTSModelLoader(data_path, use_cache=False, apply_threads=False)
+    if not standin and data_path and os.path.isdir(data_path) and loader.load_models():
+        return loader, 'checkpoint'
+
+    print("🧪 실제 체크포인트 없이 대체 모델로 합성을 측정합니다 (음질 무관, 연산량 추세 비교용)")
+    return attach_standin(loader, seed), 'standin'
+
+
+def git_commit():
+    try:
+        process = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                 cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        return process.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run_benchmarks(data_path=None, suites=SUITES, repeats=5, standin=False, seed=0, threads=None):
+    """선택한 벤치마크를 실행하고 결과 dict 반환"""
+    from thread_tuner import host_profile, profile_key
+
+    if threads:
+        torch.set_num_threads(threads)
+    torch.manual_seed(seed)
+    np.random.seed(seed)
+
+    profile = host_profile()
+    results = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'git_commit': git_commit(),
+            'profile': profile,
+            'profile_key': profile_key(profile),
+            'python': platform.python_version(),
+            'torch_threads': torch.get_num_threads(),
+            'corpus_version': CORPUS_VERSION,
+            'repeats': repeats,
+            'seed': seed,
+            'model': None,
+        },
+    }
+
+    loader = None
+    if 'normalize' in suites or 'synthesis' in suites:
+        if 'synthesis' in suites:
+            loader, results['meta']['model'] = load_benchmark_loader(data_path, standin, seed)
+        else:
+            from tts_model_loader import TTSModelLoader
+            loader = TTSModelLoader(data_path, use_cache=False, apply_threads=False)
+
+    if 'normalize' in suites:
+        print("⏱️ 정규화 처리량 측정 중...")
+        results['normalize'] = bench_normalization(loader, repeats)
+    if 'pronunciation' in suites:
+        print("⏱️ 발음 변환 처리량 측정 중...")
+        results['pronunciation'] = bench_pronunciation(repeats)
+    if 'synthesis' in suites:
+        print(f"⏱️ 합성 RTF 측정 중... ({results['meta']['model']})")
+        results['synthesis'] = bench_synthesis(loader, repeats)
+    return results
+
+
+def save_results(results, output_dir=DEFAULT_OUTPUT_DIR):
+    """<시각>_<호스트 프로필>_<모델>.json 으로 저장하고 경로 반환"""
+    os.makedirs(output_dir, exist_ok=True)
+    meta = results['meta']
+    filename = f"{time.strftime('%Y%m%d-%H%M%S')}_{meta['profile_key']}_{meta['model'] or 'text'}.json"
+    path = os.path.join(output_dir, filename)
+
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    os.replace(temp_path, path)
+    return path
+
+
+def comparable_metrics(results):
+    """비교 대상 지표 {(모음, 항목, 지표): 값}"""
+    metrics = {}
+    for suite in SUITES:
+        for case, values in results.get(suite, {}).items():
+            if not isinstance(values, dict):
+                continue
+            for name in ('sentences_per_sec', 'chars_per_sec', 'words_per_sec', 'rtf'):
+                if values.get(name) is not None:
+                    metrics[(suite, case, name)] = values[name]
+    return metrics
+
+
+def compare_results(results, baseline, threshold=0.10):
+    """이전 결과와 지표별 변화율 출력, threshold보다 나빠진 지표 목록 반환"""
+    if results['meta'].get('profile_key') != baseline['meta'].get('profile_key'):
+        print("⚠️ 기준 결과와 호스트 프로필이 달라 비교 결과가 정확하지 않을 수 있습니다.")
+    if results['meta'].get('model') != baseline['meta'].get('model'):
+        print(f"⚠️ 합성 모델이 다릅니다: {baseline['meta'].get('model')} → {results['meta'].get('model')}")
+
+    current = comparable_metrics(results)
+    previous = comparable_metrics(baseline)
+    regressions = []
+
+    print(f"📊 기준 결과 대비 ({baseline['meta'].get('git_commit')} → {results['meta'].get('git_commit')})")
+    for key in sorted(current.keys() & previous.keys()):
+        before, after = previous[key], current[key]
+        if not before:
+            continue
+        change = (after - before) / before
+        higher_is_better = key[2].endswith(HIGHER_IS_BETTER)
+        worse = -change if higher_is_better else change
+        status = "❌" if worse > threshold else ("✅" if worse < -threshold else "  ")
+        print(f"   {status} {key[0]:>13} {key[1]:<14} {key[2]:<17} {before:14.2f} → {after:14.2f} "
+              f"({change * 100:+.1f}%)")
+        if worse > threshold:
+            regressions.append({'metric': '/'.join(key), 'before': before, 'after': after, 'change': change})
+    return regressions
+
+
+def print_results(results):
+    meta = results['meta']
+    print(f"\n📊 벤치마크 결과 (커밋 {meta['git_commit']}, 스레드 {meta['torch_threads']}, 모델 {meta['model']})")
+
+    for case, values in results.get('normalize', {}).items():
+        print(f"   정규화 {case:<14}: {values['sentences_per_sec']:10.0f} 문장/초, "
+              f"{values['chars_per_sec']:12.0f} 글자/초")
+
+    pronunciation = results.get('pronunciation', {})
+    if pronunciation:
+        print(f"   발음 변환기 생성: {pronunciation['init']['seconds'] * 1000:.1f}ms")
+    for case, values in pronunciation.items():
+        if 'words_per_sec' in values:
+            print(f"   발음 변환 {case:<12}: {values['sentences_per_sec']:10.0f} 문장/초, "
+                  f"{values['words_per_sec']:12.0f} 단어/초")
+    if 'word_cache' in pronunciation:
+        print(f"   단어 캐시 적중률: {pronunciation['word_cache']['hit_rate'] * 100:.1f}% "
+              f"({pronunciation['word_cache']['entries']}개 단어)")
+
+    synthesis = results.get('synthesis', {})
+    for case, values in synthesis.items():
+        if isinstance(values, dict) and 'rtf' in values:
+            print(f"   합성 {case:<16}: RTF {values['rtf']:.3f} (최선 {values['best_rtf']:.3f}), "
+                  f"오디오 {values['audio_sec']:.1f}초")
+    if synthesis:
+        after = synthesis['memory_after']
+        if after.get('rss') is not None:
+            print(f"   메모리: 모델 {synthesis['model_parameter_bytes'] / 1024 / 1024:.1f}MB, "
+                  f"RSS {after['rss'] / 1024 / 1024:.0f}MB, 최대 RSS {after['peak_rss'] / 1024 / 1024:.0f}MB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="오프라인 텍스트 → 파형 벤치마크")
+    parser.add_argument('--data-path', default="data", help="체크포인트 데이터 경로 (없으면 대체 모델 사용)")
+    parser.add_argument('--suite', action='append', choices=SUITES,
+                        help="실행할 벤치마크 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--threads', type=int, default=None, help="torch intra-op 스레드 수 고정")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--standin', action='store_true', help="체크포인트가 있어도 대체 모델 사용")
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument('--baseline', help="비교할 이전 결과 JSON")
+    parser.add_argument('--threshold', type=float, default=0.10, help="회귀로 판단할 변화율")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.data_path, tuple(args.suite or SUITES), args.repeats,
+                             args.standin, args.seed, args.threads)
+    print_results(results)
+    path = save_results(results, args.output_dir)
+    print(f"📁 결과 저장: {path}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare_results(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"❌ 성능 회귀 {len(regressions)}건")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+"""
+벤치마크용 대체 모델 (실제 체크포인트가 없을 때 사용하는 작은 무작위 초기화 Glow-TTS / HiFi-GAN 형태 모델)
+
+학습된 모델이 아니므로 음질은 의미가 없고, 합성 경로의 연산량/메모리 추세 비교에만 사용합니다.
+TTS.utils.synthesizer.Synthesizer 와 같은 속성(tts_model, vocoder_model, ap, vocoder_ap,
+output_sample_rate)과 tts(text, speaker, wav) 메서드를 제공하여 TTSModelLoader에 그대로 연결됩니다.
+"""
+import re
+import math
+
+import numpy as np
+import torch
+from torch import nn
+
+STANDIN_SAMPLE_RATE = 22050
+STANDIN_HOP_LENGTH = 256
+STANDIN_NUM_MELS = 80
+
+
+class StandInTokenizer:
+    """문자 코드 기반 토큰화 (실제 문자 집합 대신 고정 크기 어휘로 매핑)"""
+
+    def __init__(self, num_tokens=256):
+        self.num_tokens = num_tokens
+
+    def text_to_ids(self, text):
+        return [1 + ord(char) % (self.num_tokens - 1) for char in text]
+
+
+class StandInAudioProcessor:
+    """정규화를 하지 않는 AudioProcessor 대체"""
+
+    def __init__(self, sample_rate=STANDIN_SAMPLE_RATE, hop_length=STANDIN_HOP_LENGTH, num_mels=STANDIN_NUM_MELS):
+        self.sample_rate = sample_rate
+        self.hop_length = hop_length
+        self.num_mels = num_mels
+
+    def normalize(self, spectrogram):
+        return spectrogram
+
+    def denormalize(self, spectrogram):
+        return spectrogram
+
+
+def sequence_mask(lengths, max_length=None):
+    """[B] 길이 → [B, T] 마스크"""
+    if max_length is None:
+        max_length = lengths.max()
+    return torch.arange(max_length, device=lengths.device)[None, :] < lengths[:, None]
+
+
+def generate_path(duration, mask):
+    """토큰별 프레임 수 [B, T_en] → 단조 정렬 행렬 [B, T_en, T_de] (TTS.tts.utils.helpers.generate_path와 동일)"""
+    b, t_x, t_y = mask.shape
+    cum_duration = torch.cumsum(duration, 1)
+    path = sequence_mask(cum_duration.view(b * t_x), t_y).to(mask.dtype).view(b, t_x, t_y)
+    path = path - nn.functional.pad(path, (0, 0, 1, 0, 0, 0))[:, :-1]
+    return path * mask
+
+
+class StandInGlowTTSEncoder(nn.Module):
+    """Glow-TTS 인코더와 같은 입출력 (토큰 → 평균, 로그 스케일, 로그 지속시간, 마스크)"""
+
+    def __init__(self, num_tokens, hidden_channels, num_mels, layers, frames_per_token):
+        super().__init__()
+        self.embedding = nn.Embedding(num_tokens, hidden_channels)
+        self.convs = nn.ModuleList(
+            nn.Conv1d(hidden_channels, hidden_channels, 5, padding=2) for _ in range(layers))
+        self.proj_mean = nn.Conv1d(hidden_channels, num_mels, 1)
+        self.proj_log_scale = nn.Conv1d(hidden_channels, num_mels, 1)
+        self.duration_proj = nn.Conv1d(hidden_channels, 1, 1)
+
+        # 무작위 가중치에서도 토큰당 프레임 수가 실제 모델과 비슷하도록 지속시간 출력 고정
+        # (GlowTTS.inference는 exp(o_dur_log) - 1 을 프레임 수로 사용)
+        nn.init.zeros_(self.duration_proj.weight)
+        nn.init.constant_(self.duration_proj.bias, math.log(frames_per_token + 1))
+
+    def forward(self, x, x_lengths, g=None):
+        x_mask = sequence_mask(x_lengths, x.size(1)).unsqueeze(1).float()
+        h = self.embedding(x).transpose(1, 2) * x_mask
+        for conv in self.convs:
+            h = torch.relu(conv(h)) * x_mask + h
+        o_mean = self.proj_mean(h) * x_mask
+        o_log_scale = self.proj_log_scale(h) * 0.1 * x_mask
+        o_dur_log = self.duration_proj(h) * x_mask
+        return o_mean, o_log_scale, o_dur_log, x_mask
+
+
+class StandInGlowTTSDecoder(nn.Module):
+    """Glow-TTS 디코더와 같은 입출력 (잠재 변수, 마스크 → 멜, logdet), 역변환 대신 합성곱"""
+
+    def __init__(self, num_mels, hidden_channels, layers):
+        super().__init__()
+        self.pre = nn.Conv1d(num_mels, hidden_channels, 1)
+        self.convs = nn.ModuleList(
+            nn.Conv1d(hidden_channels, hidden_channels, 5, padding=2) for _ in range(layers))
+        self.post = nn.Conv1d(hidden_channels, num_mels, 1)
+
+    def forward(self, z, y_mask, g=None, reverse=True):
+        y = self.pre(z * y_mask) * y_mask
+        for conv in self.convs:
+            y = torch.relu(conv(y)) * y_mask + y
+        return self.post(y) * y_mask, None
+
+
+class StandInGlowTTS(nn.Module):
+    """Glow-TTS 형태 모델 (encoder/decoder 속성, length_scale, inference 출력이 GlowTTS와 같음)"""
+
+    def __init__(self, num_tokens=256, hidden_channels=96, num_mels=STANDIN_NUM_MELS,
+                 encoder_layers=3, decoder_layers=4, frames_per_token=5,
+                 length_scale=1.0, inference_noise_scale=0.33):
+        super().__init__()
+        self.tokenizer = StandInTokenizer(num_tokens)
+        self.encoder = StandInGlowTTSEncoder(num_tokens, hidden_channels, num_mels, encoder_layers,
+                                             frames_per_token)
+        self.decoder = StandInGlowTTSDecoder(num_mels, hidden_channels, decoder_layers)
+        self.length_scale = length_scale
+        self.inference_noise_scale = inference_noise_scale
+
+    @torch.no_grad()
+    def inference(self, x, aux_input=None, cond_input=None):
+        """x: [B, T] 토큰 → {'model_outputs': [B, T_mel, C], 'durations_log': [B, 1, T], 'alignments': [B, T_mel, T]}
+
+        지속시간/정렬/출력 계산은 sce-tts 포크의 GlowTTS.inference와 같습니다.
+        """
+        x_lengths = (aux_input or cond_input or {}).get('x_lengths')
+        if x_lengths is None:
+            x_lengths = torch.full((x.shape[0],), x.shape[1], dtype=torch.long)
+
+        o_mean, o_log_scale, o_dur_log, x_mask = self.encoder(x, x_lengths, g=None)
+
+        # 출력 지속시간 계산
+        w = (torch.exp(o_dur_log) - 1) * x_mask * self.length_scale
+        w_ceil = torch.ceil(w)
+        y_lengths = torch.clamp_min(torch.sum(w_ceil, [1, 2]), 1).long()
+        y_mask = sequence_mask(y_lengths).unsqueeze(1).to(x_mask.dtype)
+        attn_mask = torch.unsqueeze(x_mask, -1) * torch.unsqueeze(y_mask, 2)
+        attn = generate_path(w_ceil.squeeze(1), attn_mask.squeeze(1)).unsqueeze(1)
+
+        # 정렬로 평균/스케일 확장
+        y_mean = torch.matmul(attn.squeeze(1).transpose(1, 2), o_mean.transpose(1, 2)).transpose(1, 2)
+        y_log_scale = torch.matmul(attn.squeeze(1).transpose(1, 2), o_log_scale.transpose(1, 2)).transpose(1, 2)
+        o_attn_dur = torch.log(1 + torch.sum(attn, -1)) * x_mask
+
+        z = (y_mean + torch.exp(y_log_scale) * torch.randn_like(y_mean) * self.inference_noise_scale) * y_mask
+        y, _ = self.decoder(z, y_mask, g=None, reverse=True)
+        attn = attn.squeeze(1).permute(0, 2, 1)
+        return {'model_outputs': y.transpose(1, 2), 'durations_log': o_attn_dur, 'alignments': attn}
+
+
+class StandInHiFiGAN(nn.Module):
+    """업샘플링 합성곱 + 잔차 블록으로 구성된 HiFi-GAN 형태 보코더 (총 업샘플 = hop_length)"""
+
+    def __init__(self, num_mels=STANDIN_NUM_MELS, channels=128, upsample_factors=(8, 8, 2, 2),
+                 inference_padding=5):
+        super().__init__()
+        self.inp_pad = inference_padding  # TTS HifiganGenerator와 같은 속성 이름
+        self.conv_pre = nn.Conv1d(num_mels, channels, 7, padding=3)
+
+        self.ups = nn.ModuleList()
+        self.resblocks = nn.ModuleList()
+        for factor in upsample_factors:
+            self.ups.append(nn.ConvTranspose1d(channels, channels // 2, factor * 2, factor,
+                                               padding=factor // 2 + factor % 2, output_padding=factor % 2))
+            channels //= 2
+            self.resblocks.append(nn.ModuleList(
+                nn.Conv1d(channels, channels, 3, padding=dilation, dilation=dilation) for dilation in (1, 3)))
+        self.conv_post = nn.Conv1d(channels, 1, 7, padding=3)
+
+    def forward(self, c):
+        x = self.conv_pre(c)
+        for up, resblock in zip(self.ups, self.resblocks):
+            x = up(nn.functional.leaky_relu(x, 0.1))
+            for conv in resblock:
+                x = x + conv(nn.functional.leaky_relu(x, 0.1))
+        return torch.tanh(self.conv_post(nn.functional.leaky_relu(x)))
+
+    def inference(self, c):
+        """HiFi-GAN inference와 같이 입력 양끝을 복제 패딩한 뒤 추론"""
+        c = nn.functional.pad(c, (self.inp_pad, self.inp_pad), 'replicate')
+        return self.forward(c)
+
+
+class StandInSynthesizer:
+    """TTS Synthesizer 대체 (문장 분리 후 문장마다 10000 샘플 무음을 붙이는 동작까지 동일)"""
+
+    def __init__(self, seed=0):
+        torch.manual_seed(seed)
+        self.tts_model = StandInGlowTTS().eval()
+        self.vocoder_model = StandInHiFiGAN().eval()
+        self.tts_config = {}
+        self.ap = StandInAudioProcessor()
+        self.vocoder_ap = StandInAudioProcessor()
+        self.output_sample_rate = STANDIN_SAMPLE_RATE
+
+    def split_into_sentences(self, text):
+        return [sentence.strip() for sentence in re.split(r'(?<=[.!?])\s+', text) if sentence.strip()]
+
+    @torch.no_grad()
+    def tts(self, text, speaker_idx=None, speaker_wav=None):
+        wavs = []
+        for sentence in self.split_into_sentences(text):
+            ids = torch.tensor([self.tts_model.tokenizer.text_to_ids(sentence)], dtype=torch.long)
+            outputs = self.tts_model.inference(ids, aux_input={'x_lengths': torch.tensor([ids.shape[1]])})
+            wav = self.vocoder_model.inference(outputs['model_outputs'].transpose(1, 2))
+            wavs += list(wav.reshape(-1).numpy())
+            wavs += [0] * 10000
+        return wavs
+
+
+def model_parameter_bytes(synthesizer):
+    """Glow-TTS + 보코더 파라미터/버퍼 크기 (바이트)"""
+    total = 0
+    for model in (synthesizer.tts_model, synthesizer.vocoder_model):
+        if isinstance(model, nn.Module):
+            total += sum(t.element_size() * t.nelement() for t in list(model.parameters()) + list(model.buffers()))
+    return total
+
+
+def attach_standin(loader, seed=0):
+    """모델 로드 없이 로더에 대체 모델 연결 (체크포인트가 없을 때 벤치마크용)"""
+    loader.synthesizer = StandInSynthesizer(seed)
+    loader.batch_synthesizer = None
+    loader.streaming_vocoder = None
+    loader.active_inference_mode = 'fp32'
+    loader.models_loaded = True
+    loader.use_synthesizer = True
+    return loader
+
+
+if __name__ == "__main__":
+    synthesizer = StandInSynthesizer()
+    wav = np.asarray(synthesizer.tts("안녕하세요. 반갑습니다."))
+    print(f"대체 모델: 파라미터 {model_parameter_bytes(synthesizer) / 1024 / 1024:.1f}MB, "
+          f"출력 {len(wav)} 샘플 ({len(wav) / STANDIN_SAMPLE_RATE:.2f}초)")
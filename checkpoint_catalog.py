@@ -0,0 +1,139 @@
+"""
+체크포인트 카탈로그 모듈 (학습 실행/스텝 기준 결정적 체크포인트 선택)
+"""
+import os
+import re
+from datetime import datetime
+
+CHECKPOINT_EXTENSIONS = ('.pth', '.pt', '.ckpt', '.pth.tar')
+
+# 예: glowtts-v2-June-18-2025_06+37AM-3aa165a
+RUN_TIMESTAMP_PATTERN = re.compile(r'-([A-Za-z]+-\d{1,2}-\d{4}_\d{1,2}\+\d{2}[AP]M)')
+
+# 예: best_model.pth.tar, best_model_293026.pth.tar, checkpoint_300000.pth.tar
+CHECKPOINT_NAME_PATTERN = re.compile(r'^(best_model|checkpoint)(?:_(\d+))?\.')
+
+
+def parse_run_timestamp(folder_name):
+    """학습 실행 폴더 이름에서 시작 시각 추출 (형식이 다르면 None)"""
+    match = RUN_TIMESTAMP_PATTERN.search(folder_name)
+    if not match:
+        return None
+    try:
+        return datetime.strptime(match.group(1), "%B-%d-%Y_%I+%M%p")
+    except ValueError:
+        return None
+
+
+def parse_checkpoint_name(filename):
+    """체크포인트 파일 이름에서 (종류, 스텝) 추출
+
+    종류는 'best', 'checkpoint', 'other' 중 하나이며 스텝이 없으면 None입니다.
+    """
+    match = CHECKPOINT_NAME_PATTERN.match(filename.lower())
+    if not match:
+        return 'other', None
+    kind = 'best' if match.group(1) == 'best_model' else 'checkpoint'
+    step = int(match.group(2)) if match.group(2) else None
+    return kind, step
+
+
+def is_checkpoint_file(filename):
+    return filename.endswith(CHECKPOINT_EXTENSIONS)
+
+
+def parse_checkpoint_policy(policy):
+    """선택 정책 확인 ('best', 'latest', 스텝 번호; 숫자 문자열은 정수로 변환)
+
+    알 수 없는 정책은 ValueError (오타가 'best'로 조용히 바뀌지 않도록)
+    """
+    if isinstance(policy, int) and not isinstance(policy, bool) and policy >= 0:
+        return policy
+    if isinstance(policy, str):
+        policy = policy.strip()
+        if policy in ('best', 'latest'):
+            return policy
+        if policy.isdigit():
+            return int(policy)
+    raise ValueError(f"알 수 없는 체크포인트 정책: {policy!r} ('best', 'latest' 또는 스텝 번호)")
+
+
+class CheckpointCatalog:
+    """모델 종류별 학습 실행 폴더와 체크포인트 목록
+
+    선택 정책:
+        'best'   - 최신 실행의 best_model (스텝이 가장 큰 것 우선)
+        'latest' - 최신 실행에서 스텝이 가장 큰 체크포인트
+        정수     - 해당 스텝 체크포인트가 있는 가장 최신 실행의 파일 (숫자 문자열도 허용)
+    체크포인트 파일은 열지 않고 이름만으로 선택합니다.
+    """
+
+    def __init__(self, base_dir, prefix, index):
+        self.base_dir = base_dir
+        self.prefix = prefix
+        self.index = index
+
+    def list_runs(self):
+        """학습 실행 폴더 목록 (오래된 순서로 정렬)"""
+        runs = []
+        for dirpath, _ in self.index.walk(self.base_dir):
+            if os.path.dirname(dirpath) != os.path.abspath(self.base_dir):
+                continue
+            name = os.path.basename(dirpath)
+            if not name.startswith(self.prefix):
+                continue
+
+            timestamp = parse_run_timestamp(name)
+            # 시각을 알 수 없는 폴더는 수정 시각으로 정렬, 같으면 이름순
+            sort_time = timestamp.timestamp() if timestamp else os.path.getmtime(dirpath)
+            runs.append({'path': dirpath, 'name': name, 'timestamp': timestamp,
+                         'sort_key': (sort_time, name)})
+
+        runs.sort(key=lambda run: run['sort_key'])
+        return runs
+
+    def list_checkpoints(self, run_path):
+        """실행 폴더 안의 체크포인트 목록"""
+        checkpoints = []
+        for dirpath, filenames in self.index.walk(run_path):
+            for filename, mtime in filenames.items():
+                if not is_checkpoint_file(filename):
+                    continue
+                kind, step = parse_checkpoint_name(filename)
+                checkpoints.append({'path': os.path.join(dirpath, filename), 'name': filename,
+                                    'kind': kind, 'step': step, 'mtime': mtime})
+        return checkpoints
+
+    @staticmethod
+    def select_checkpoint(checkpoints, policy='best'):
+        """정책에 따라 체크포인트 하나 선택 (없으면 None, 알 수 없는 정책은 ValueError)"""
+        policy = parse_checkpoint_policy(policy)
+        if not checkpoints:
+            return None
+
+        def step_key(checkpoint):
+            # 스텝이 없으면 수정 시각 기준, 마지막으로 이름순으로 결정
+            step = checkpoint['step'] if checkpoint['step'] is not None else -1
+            return step, checkpoint['mtime'] or 0, checkpoint['name']
+
+        if isinstance(policy, int):
+            matches = [c for c in checkpoints if c['step'] == policy]
+            return max(matches, key=lambda c: (c['kind'] == 'best', c['name'])) if matches else None
+
+        if policy == 'latest':
+            return max(checkpoints, key=lambda c: (step_key(c), c['kind'] == 'best'))
+
+        best = [c for c in checkpoints if c['kind'] == 'best']
+        return max(best or checkpoints, key=step_key)
+
+    def select(self, policy='best'):
+        """정책에 맞는 (실행 폴더, 체크포인트) 선택
+
+        체크포인트가 아직 없는 최신 실행(학습 시작 직후 등)은 건너뜁니다.
+        """
+        policy = parse_checkpoint_policy(policy)
+        for run in reversed(self.list_runs()):
+            checkpoint = self.select_checkpoint(self.list_checkpoints(run['path']), policy)
+            if checkpoint is not None:
+                return run, checkpoint
+        return None, None
@@ -0,0 +1,226 @@
+"""
+컴파일된 발음 사전 모듈 (정렬된 키 블롭 + 오프셋 배열을 mmap으로 열어 이진 탐색)
+
+JSON 사전 전체를 파이썬 dict로 올리지 않고, 파일을 메모리 맵으로 열어 조회할 때만 필요한 부분을 읽습니다.
+
+    python compiled_lexicon.py build custom_pronunciation_dict.json lexicon.klex
+    python compiled_lexicon.py lookup lexicon.klex hello world
+"""
+import os
+import sys
+import json
+import mmap
+import time
+import struct
+
+LEXICON_MAGIC = b'KLEX'
+LEXICON_VERSION = 1
+
+# magic, version, 항목 수, 키 블롭 크기, 값 블롭 크기
+HEADER = struct.Struct('<4sIQQQ')
+
+
+class CompiledLexicon:
+    """mmap으로 여는 읽기 전용 영어 → 한글 발음 사전
+
+    파일 구성: 헤더 | 키 오프셋 (항목 수 + 1개, uint64) | 값 오프셋 (항목 수 + 1개, uint64)
+    | 키 블롭 (UTF-8, 바이트 순 정렬) | 값 블롭 (UTF-8)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # 빈 파일
+            self._file.close()
+            raise ValueError(f"컴파일된 사전 파일이 비어 있습니다: {path}")
+
+        magic, version, count, key_blob_size, value_blob_size = HEADER.unpack_from(self._mmap, 0)
+        if magic != LEXICON_MAGIC or version != LEXICON_VERSION:
+            self.close()
+            raise ValueError(f"컴파일된 사전 형식이 아닙니다: {path}")
+
+        self.count = count
+        offsets_size = (count + 1) * 8
+        key_offsets_start = HEADER.size
+        value_offsets_start = key_offsets_start + offsets_size
+        self._key_blob_start = value_offsets_start + offsets_size
+        self._value_blob_start = self._key_blob_start + key_blob_size
+
+        view = memoryview(self._mmap)
+        self._key_offsets = view[key_offsets_start:value_offsets_start].cast('Q')
+        self._value_offsets = view[value_offsets_start:self._key_blob_start].cast('Q')
+
+    def _key_at(self, index):
+        start = self._key_blob_start
+        return self._mmap[start + self._key_offsets[index]:start + self._key_offsets[index + 1]]
+
+    def _value_at(self, index):
+        start = self._value_blob_start
+        return self._mmap[start + self._value_offsets[index]:start + self._value_offsets[index + 1]].decode('utf-8')
+
+    def find(self, word):
+        """단어의 항목 번호 (없으면 -1)"""
+        key = word.encode('utf-8')
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count and self._key_at(low) == key:
+            return low
+        return -1
+
+    def get(self, word, default=None):
+        index = self.find(word)
+        return self._value_at(index) if index >= 0 else default
+
+    def __contains__(self, word):
+        return self.find(word) >= 0
+
+    def __getitem__(self, word):
+        index = self.find(word)
+        if index < 0:
+            raise KeyError(word)
+        return self._value_at(index)
+
+    def __len__(self):
+        return self.count
+
+    def keys(self):
+        for index in range(self.count):
+            yield self._key_at(index).decode('utf-8')
+
+    def items(self):
+        for index in range(self.count):
+            yield self._key_at(index).decode('utf-8'), self._value_at(index)
+
+    def close(self):
+        if getattr(self, '_key_offsets', None) is not None:
+            self._key_offsets.release()
+            self._value_offsets.release()
+            self._key_offsets = self._value_offsets = None
+        if getattr(self, '_mmap', None) is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __getstate__(self):
+        # 프로세스 풀로 전달할 때는 경로만 넘기고 받는 쪽에서 다시 mmap
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
+
+
+def build_lexicon(entries, path):
+    """{영어 단어: 한글 발음} dict를 컴파일된 사전 파일로 저장 (키는 소문자, 중복 시 뒤 항목 우선)
+
+    반환: 저장된 항목 수
+    """
+    normalized = {}
+    for word, pronunciation in entries.items():
+        normalized[word.lower().strip().encode('utf-8')] = str(pronunciation).encode('utf-8')
+    keys = sorted(normalized)
+
+    key_offsets = [0]
+    value_offsets = [0]
+    for key in keys:
+        key_offsets.append(key_offsets[-1] + len(key))
+        value_offsets.append(value_offsets[-1] + len(normalized[key]))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(HEADER.pack(LEXICON_MAGIC, LEXICON_VERSION, len(keys), key_offsets[-1], value_offsets[-1]))
+        f.write(struct.pack(f'<{len(key_offsets)}Q', *key_offsets))
+        f.write(struct.pack(f'<{len(value_offsets)}Q', *value_offsets))
+        for key in keys:
+            f.write(key)
+        for key in keys:
+            f.write(normalized[key])
+    os.replace(temp_path, path)
+    return len(keys)
+
+
+def build_lexicon_from_json(json_path, path):
+    """export_dictionary로 내보낸 JSON 사전을 컴파일된 사전 파일로 변환"""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    return build_lexicon(entries, path)
+
+
+def benchmark_lexicon(num_entries=130000, directory=None, lookups=100000, seed=0):
+    """CMUdict 규모 사전의 JSON dict 로드와 컴파일된 사전 mmap 로드 비교 (로드 시간, 메모리 증가, 조회 속도)"""
+    import random
+    import tempfile
+    import tracemalloc
+
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    syllables = [chr(0xAC00 + i) for i in range(0, 11172, 7)]
+    entries = {}
+    while len(entries) < num_entries:
+        word = ''.join(rng.choice(letters) for _ in range(rng.randint(3, 12)))
+        entries[word] = ''.join(rng.choice(syllables) for _ in range(rng.randint(1, 6)))
+
+    directory = directory or tempfile.mkdtemp(prefix="lexicon-bench-")
+    json_path = os.path.join(directory, "lexicon.json")
+    lexicon_path = os.path.join(directory, "lexicon.klex")
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(entries, f, ensure_ascii=False)
+    build_lexicon_from_json(json_path, lexicon_path)
+
+    queries = [rng.choice(list(entries)) for _ in range(lookups // 2)]
+    queries += [''.join(rng.choice(letters) for _ in range(8)) for _ in range(lookups - len(queries))]
+
+    results = {}
+    for name, load in (('json', lambda: json.load(open(json_path, 'r', encoding='utf-8'))),
+                       ('compiled', lambda: CompiledLexicon(lexicon_path))):
+        tracemalloc.start()
+        start = time.perf_counter()
+        lexicon = load()
+        load_sec = time.perf_counter() - start
+        memory_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for query in queries:
+            lexicon.get(query)
+        lookup_sec = time.perf_counter() - start
+
+        results[name] = {'load_sec': load_sec, 'memory_bytes': memory_bytes,
+                         'lookups_per_sec': len(queries) / lookup_sec}
+        if name == 'compiled':
+            lexicon.close()
+
+    print(f"📊 발음 사전 로드 ({num_entries}개 항목, 파일 {os.path.getsize(lexicon_path) / 1024 / 1024:.1f}MB)")
+    for name, result in results.items():
+        print(f"   {name:>8}: 로드 {result['load_sec'] * 1000:8.1f}ms, "
+              f"파이썬 메모리 {result['memory_bytes'] / 1024 / 1024:7.1f}MB, "
+              f"조회 {result['lookups_per_sec']:10.0f}회/초")
+    return results
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else 'benchmark'
+
+    if command == 'build':
+        count = build_lexicon_from_json(sys.argv[2], sys.argv[3])
+        print(f"✅ 컴파일된 사전 저장: {sys.argv[3]} ({count}개 항목)")
+    elif command == 'lookup':
+        with CompiledLexicon(sys.argv[2]) as compiled:
+            for query in sys.argv[3:]:
+                print(f"{query} -> {compiled.get(query.lower())}")
+    else:
+        benchmark_lexicon()
@@ -0,0 +1,119 @@
+"""
+설정 파일 경로 해석 모듈 (모델 디렉토리에 쓰지 않는 런타임 config 캐시)
+"""
+import os
+import json
+import hashlib
+import threading
+
+from synthesis_cache import DEFAULT_CACHE_DIR
+
+
+def collect_absolute_paths(obj):
+    """설정 안의 절대 경로 문자열 목록"""
+    if isinstance(obj, str):
+        return [obj] if os.path.isabs(obj) else []
+    if isinstance(obj, dict):
+        return [path for value in obj.values() for path in collect_absolute_paths(value)]
+    if isinstance(obj, list):
+        return [path for value in obj for path in collect_absolute_paths(value)]
+    return []
+
+
+def rewritten_paths(source, resolved):
+    """경로 수정으로 원본과 달라진 절대 경로 문자열 목록 (모델/보코더/화자 파일 등)
+
+    원본 그대로인 절대 경로(다른 환경의 오래된 경로 등)는 포함하지 않습니다.
+    """
+    if isinstance(resolved, str):
+        return [resolved] if resolved != source and os.path.isabs(resolved) else []
+    if isinstance(resolved, dict) and isinstance(source, dict):
+        return [path for key, value in resolved.items() for path in rewritten_paths(source.get(key), value)]
+    if isinstance(resolved, list) and isinstance(source, list) and len(resolved) == len(source):
+        return [path for old, new in zip(source, resolved) for path in rewritten_paths(old, new)]
+    return collect_absolute_paths(resolved)  # 구조가 다르면 전체를 확인
+
+
+class ConfigResolver:
+    """원본 config 내용 해시 기준으로 경로가 수정된 config를 캐시
+
+    수정된 config는 모델 폴더가 아닌 사용자 캐시 폴더에 내용 해시 이름으로 저장하므로,
+    읽기 전용/네트워크 모델 저장소에서도 여러 프로세스가 동시에 시작할 수 있습니다.
+    """
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = os.path.join(cache_dir or DEFAULT_CACHE_DIR, "configs")
+        self._resolved = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(source_bytes, model_path):
+        digest = hashlib.sha256(source_bytes)
+        digest.update(b"\0" + os.path.abspath(model_path or "").encode('utf-8'))
+        return digest.hexdigest()[:16]
+
+    def resolve(self, config_path, model_path, fix_paths):
+        """(수정된 config dict, Synthesizer에 넘길 config 파일 경로) 반환
+
+        fix_paths(config, model_path)는 Colab 경로를 로컬 경로로 바꾸는 함수입니다.
+        캐시 폴더에 쓸 수 없으면 경고만 출력하고 원본 config 경로를 돌려줍니다.
+        """
+        with open(config_path, 'rb') as f:
+            source_bytes = f.read()
+
+        key = self.make_key(source_bytes, model_path)
+        resolved_path = os.path.join(self.cache_dir, f"{key}.json")
+
+        # 1단계: 프로세스 내 캐시
+        with self._lock:
+            cached = self._resolved.get(key)
+        if cached is not None:
+            config_json, runtime_path = cached
+            return json.loads(config_json), runtime_path
+
+        # 2단계: 다른 프로세스가 만들어 둔 파일 (수정한 경로가 가리키는 파일이 모두 존재할 때만 사용)
+        source = json.loads(source_bytes.decode('utf-8'))
+        config = self._read_resolved(resolved_path, source)
+
+        # 3단계: 원본에서 경로 수정
+        if config is None:
+            config = fix_paths(source, model_path)
+            if not self._write_resolved(resolved_path, config):
+                resolved_path = config_path
+
+        with self._lock:
+            self._resolved[key] = (json.dumps(config, ensure_ascii=False), resolved_path)
+        return config, resolved_path
+
+    @staticmethod
+    def _read_resolved(path, source):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if all(os.path.exists(p) for p in rewritten_paths(source, config)):
+            return config
+        return None
+
+    def _write_resolved(self, path, config):
+        """임시 파일에 쓴 뒤 원자적으로 교체 (동시 시작한 프로세스와 경합 방지) → 성공 여부"""
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(config, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, path)
+            return True
+        except OSError as e:
+            print(f"   ⚠️ 수정된 config 저장 실패 (원본 config 사용): {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return False
+
+
+# 프로세스 전역 해석기
+config_resolver = ConfigResolver()
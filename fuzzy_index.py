@@ -0,0 +1,187 @@
+"""
+유사 단어 검색 색인 모듈 (SymSpell 방식 삭제 색인 + 제한 편집 거리 검증)
+"""
+import time
+
+
+def edit_distance(a, b, max_distance):
+    """a, b의 편집 거리 (삽입/삭제/치환/인접 문자 교환, OSA)
+
+    max_distance를 넘는 것이 확실해지면 계산을 멈추고 max_distance + 1을 반환합니다.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    if a == b:
+        return 0
+
+    # 공통 접두사/접미사는 거리에 영향이 없으므로 제외 (색인 후보는 대부분 앞부분이 같음)
+    start = 0
+    shorter = min(len(a), len(b))
+    while start < shorter and a[start] == b[start]:
+        start += 1
+    a_end, b_end = len(a), len(b)
+    while a_end > start and b_end > start and a[a_end - 1] == b[b_end - 1]:
+        a_end -= 1
+        b_end -= 1
+    a, b = a[start:a_end], b[start:b_end]
+    if not a or not b:
+        distance = len(a) + len(b)
+        return distance if distance <= max_distance else max_distance + 1
+
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        a_char = a[i - 1]
+        current = [i] * (len(b) + 1)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            value = previous[j - 1] if a_char == b[j - 1] else previous[j - 1] + 1
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if (previous_previous is not None and j > 1 and a_char == b[j - 2] and a[i - 2] == b[j - 1]
+                    and previous_previous[j - 2] + 1 < value):
+                value = previous_previous[j - 2] + 1
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+
+    return previous[-1] if previous[-1] <= max_distance else max_distance + 1
+
+
+class DeletionIndex:
+    """단어 앞부분(prefix_length)에서 최대 max_distance개 문자를 지운 문자열 → 원래 단어 목록 색인
+
+    질의어도 같은 방식으로 지운 문자열을 만들어 색인에서 후보를 찾고, 후보만 편집 거리로 검증하므로
+    사전 크기와 거의 무관하게 빠르게 조회됩니다. 단어는 add로 하나씩 추가할 수 있습니다.
+    """
+
+    def __init__(self, words=(), max_distance=2, prefix_length=7):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.deletes = {}
+        self.words = set()
+        for word in words:
+            self.add(word)
+
+    def _delete_levels(self, word):
+        """word 앞부분에서 0, 1, ..., max_distance개 문자를 지운 문자열 집합 목록 (지운 개수별)"""
+        prefix = word[:self.prefix_length]
+        seen = {prefix}
+        levels = [seen.copy()]
+        for _ in range(self.max_distance):
+            level = set()
+            for text in levels[-1]:
+                for i in range(len(text)):
+                    deleted = text[:i] + text[i + 1:]
+                    if deleted not in seen:
+                        seen.add(deleted)
+                        level.add(deleted)
+            levels.append(level)
+        return levels
+
+    def add(self, word):
+        if word in self.words:
+            return
+        self.words.add(word)
+        for level in self._delete_levels(word):
+            for variant in level:
+                bucket = self.deletes.get(variant)
+                if bucket is None:
+                    self.deletes[variant] = [word]
+                else:
+                    bucket.append(word)
+
+    def __contains__(self, word):
+        return word in self.words
+
+    def __len__(self):
+        return len(self.words)
+
+    def lookup(self, query, k=3, max_distance=None):
+        """편집 거리가 가까운 순서로 최대 k개 [(단어, 거리)] (같은 거리는 길이 차, 단어순)
+
+        거리 d인 단어는 질의어에서 d개 이하를 지운 문자열로 찾아지므로, 지운 개수 순서로 찾다가
+        그 개수 이하 거리의 결과가 k개 모이면 멈추고, k개가 모인 뒤에는 k번째 거리보다 먼 후보를 건너뜁니다.
+        """
+        bound = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        checked = set()
+        matches = []
+        for deleted_count, level in enumerate(self._delete_levels(query)):
+            if deleted_count > bound:
+                break
+            for variant in level:
+                for word in self.deletes.get(variant, ()):
+                    if word in checked:
+                        continue
+                    checked.add(word)
+                    distance = edit_distance(query, word, bound)
+                    if distance <= bound:
+                        matches.append((distance, abs(len(word) - len(query)), word))
+
+            if len(matches) >= k:
+                matches.sort()
+                del matches[k:]
+                bound = matches[-1][0]
+                if bound <= deleted_count:
+                    break
+
+        matches.sort()
+        return [(word, distance) for distance, _, word in matches[:k]]
+
+
+def benchmark_deletion_index(num_words=100000, queries=1000, seed=0):
+    """합성 단어 num_words개 색인의 생성 시간과 조회 지연 (전수 비교 대비)"""
+    import random
+
+    rng = random.Random(seed)
+    letters = 'etaoinshrdlcumwfgypbvkjxqz'
+    words = set()
+    while len(words) < num_words:
+        words.add(''.join(rng.choice(letters[:rng.randint(10, 26)]) for _ in range(rng.randint(3, 12))))
+    words = sorted(words)
+
+    start = time.perf_counter()
+    index = DeletionIndex(words)
+    build_sec = time.perf_counter() - start
+
+    # 사전 단어에 1~2개 편집을 가한 질의
+    samples = []
+    for _ in range(queries):
+        word = list(rng.choice(words))
+        for _ in range(rng.randint(1, 2)):
+            position = rng.randrange(len(word))
+            operation = rng.choice(('insert', 'delete', 'replace'))
+            if operation == 'insert':
+                word.insert(position, rng.choice(letters))
+            elif operation == 'delete' and len(word) > 1:
+                del word[position]
+            else:
+                word[position] = rng.choice(letters)
+        samples.append(''.join(word))
+
+    start = time.perf_counter()
+    results = [index.lookup(sample) for sample in samples]
+    lookup_sec = (time.perf_counter() - start) / len(samples)
+
+    # 정확도 확인용 전수 비교 (일부 질의만)
+    start = time.perf_counter()
+    missed = 0
+    for sample, result in zip(samples[:20], results[:20]):
+        brute = sorted((edit_distance(sample, word, 2), abs(len(word) - len(sample)), word) for word in words)
+        expected = [(word, distance) for distance, _, word in brute if distance <= 2][:3]
+        missed += expected != result
+    brute_sec = (time.perf_counter() - start) / 20
+
+    print(f"📊 유사 단어 색인 ({num_words}단어, 삭제 문자열 {len(index.deletes)}개)")
+    print(f"   생성 {build_sec:.2f}초, 조회 {lookup_sec * 1000:.3f}ms "
+          f"(전수 비교 {brute_sec * 1000:.1f}ms, 결과 불일치 {missed}/20)")
+    return {'build_sec': build_sec, 'lookup_sec': lookup_sec, 'brute_sec': brute_sec, 'missed': missed}
+
+
+if __name__ == "__main__":
+    benchmark_deletion_index()
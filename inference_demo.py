@@ -168,35 +168,19 @@ def split_text(text):
 
     return texts
 
-def alphabet_text(text):
-    text = re.sub(r"(a|A)", "에이", text)
-    text = re.sub(r"(b|B)", "비", text)
-    text = re.sub(r"(c|C)", "씨", text)
-    text = re.sub(r"(d|D)", "디", text)
-    text = re.sub(r"(e|E)", "이", text)
-    text = re.sub(r"(f|F)", "에프", text)
-    text = re.sub(r"(g|G)", "쥐", text)
-    text = re.sub(r"(h|H)", "에이치", text)
-    text = re.sub(r"(i|I)", "아이", text)
-    text = re.sub(r"(j|J)", "제이", text)
-    text = re.sub(r"(k|K)", "케이", text)
-    text = re.sub(r"(l|L)", "엘", text)
-    text = re.sub(r"(m|M)", "엠", text)
-    text = re.sub(r"(n|N)", "엔", text)
-    text = re.sub(r"(o|O)", "오", text)
-    text = re.sub(r"(p|P)", "피", text)
-    text = re.sub(r"(q|Q)", "큐", text)
-    text = re.sub(r"(r|R)", "알", text)
-    text = re.sub(r"(s|S)", "에스", text)
-    text = re.sub(r"(t|T)", "티", text)
-    text = re.sub(r"(u|U)", "유", text)
-    text = re.sub(r"(v|V)", "브이", text)
-    text = re.sub(r"(w|W)", "더블유", text)
-    text = re.sub(r"(x|X)", "엑스", text)
-    text = re.sub(r"(y|Y)", "와이", text)
-    text = re.sub(r"(z|Z)", "지", text)
+ALPHABET_MAP = {
+    'a': '에이', 'b': '비', 'c': '씨', 'd': '디', 'e': '이', 'f': '에프',
+    'g': '쥐', 'h': '에이치', 'i': '아이', 'j': '제이', 'k': '케이', 'l': '엘',
+    'm': '엠', 'n': '엔', 'o': '오', 'p': '피', 'q': '큐', 'r': '알',
+    's': '에스', 't': '티', 'u': '유', 'v': '브이', 'w': '더블유', 'x': '엑스',
+    'y': '와이', 'z': '지'
+}
+ALPHABET_MAP.update({eng.upper(): kor for eng, kor in ALPHABET_MAP.items()})
+ALPHABET_PATTERN = re.compile(r"[a-zA-Z]+")
 
-    return text
+def alphabet_text(text):
+    # 26번의 re.sub 대신 한 번의 스캔으로 변환
+    return ALPHABET_PATTERN.sub(lambda m: "".join([ALPHABET_MAP[c] for c in m.group(0)]), text)
 
 def punctuation_text(text):
     text = re.sub(r"!", "느낌표", text)
@@ -205,60 +189,22 @@ def punctuation_text(text):
 
     return text
 
-def jamo_text(text):
-    text = re.sub(r"ㄱ", "기역", text)
-    text = re.sub(r"ㄴ", "니은", text)
-    text = re.sub(r"ㄷ", "디귿", text)
-    text = re.sub(r"ㄹ", "리을", text)
-    text = re.sub(r"ㅁ", "미음", text)
-    text = re.sub(r"ㅂ", "비읍", text)
-    text = re.sub(r"ㅅ", "시옷", text)
-    text = re.sub(r"ㅇ", "이응", text)
-    text = re.sub(r"ㅈ", "지읒", text)
-    text = re.sub(r"ㅊ", "치읓", text)
-    text = re.sub(r"ㅋ", "키읔", text)
-    text = re.sub(r"ㅌ", "티읕", text)
-    text = re.sub(r"ㅍ", "피읖", text)
-    text = re.sub(r"ㅎ", "히읗", text)
-    text = re.sub(r"ㄲ", "쌍기역", text)
-    text = re.sub(r"ㄸ", "쌍디귿", text)
-    text = re.sub(r"ㅃ", "쌍비읍", text)
-    text = re.sub(r"ㅆ", "쌍시옷", text)
-    text = re.sub(r"ㅉ", "쌍지읒", text)
-    text = re.sub(r"ㄳ", "기역시옷", text)
-    text = re.sub(r"ㄵ", "니은지읒", text)
-    text = re.sub(r"ㄶ", "니은히읗", text)
-    text = re.sub(r"ㄺ", "리을기역", text)
-    text = re.sub(r"ㄻ", "리을미음", text)
-    text = re.sub(r"ㄼ", "리을비읍", text)
-    text = re.sub(r"ㄽ", "리을시옷", text)
-    text = re.sub(r"ㄾ", "리을티읕", text)
-    text = re.sub(r"ㄿ", "리을피읍", text)
-    text = re.sub(r"ㅀ", "리을히읗", text)
-    text = re.sub(r"ㅄ", "비읍시옷", text)
-    text = re.sub(r"ㅏ", "아", text)
-    text = re.sub(r"ㅑ", "야", text)
-    text = re.sub(r"ㅓ", "어", text)
-    text = re.sub(r"ㅕ", "여", text)
-    text = re.sub(r"ㅗ", "오", text)
-    text = re.sub(r"ㅛ", "요", text)
-    text = re.sub(r"ㅜ", "우", text)
-    text = re.sub(r"ㅠ", "유", text)
-    text = re.sub(r"ㅡ", "으", text)
-    text = re.sub(r"ㅣ", "이", text)
-    text = re.sub(r"ㅐ", "애", text)
-    text = re.sub(r"ㅒ", "얘", text)
-    text = re.sub(r"ㅔ", "에", text)
-    text = re.sub(r"ㅖ", "예", text)
-    text = re.sub(r"ㅘ", "와", text)
-    text = re.sub(r"ㅙ", "왜", text)
-    text = re.sub(r"ㅚ", "외", text)
-    text = re.sub(r"ㅝ", "워", text)
-    text = re.sub(r"ㅞ", "웨", text)
-    text = re.sub(r"ㅟ", "위", text)
-    text = re.sub(r"ㅢ", "의", text)
+JAMO_MAP = {
+    'ㄱ': '기역', 'ㄴ': '니은', 'ㄷ': '디귿', 'ㄹ': '리을', 'ㅁ': '미음', 'ㅂ': '비읍',
+    'ㅅ': '시옷', 'ㅇ': '이응', 'ㅈ': '지읒', 'ㅊ': '치읓', 'ㅋ': '키읔', 'ㅌ': '티읕',
+    'ㅍ': '피읖', 'ㅎ': '히읗', 'ㄲ': '쌍기역', 'ㄸ': '쌍디귿', 'ㅃ': '쌍비읍',
+    'ㅆ': '쌍시옷', 'ㅉ': '쌍지읒', 'ㄳ': '기역시옷', 'ㄵ': '니은지읒', 'ㄶ': '니은히읗',
+    'ㄺ': '리을기역', 'ㄻ': '리을미음', 'ㄼ': '리을비읍', 'ㄽ': '리을시옷', 'ㄾ': '리을티읕',
+    'ㄿ': '리을피읍', 'ㅀ': '리을히읗', 'ㅄ': '비읍시옷',
+    'ㅏ': '아', 'ㅑ': '야', 'ㅓ': '어', 'ㅕ': '여', 'ㅗ': '오', 'ㅛ': '요', 'ㅜ': '우',
+    'ㅠ': '유', 'ㅡ': '으', 'ㅣ': '이', 'ㅐ': '애', 'ㅒ': '얘', 'ㅔ': '에', 'ㅖ': '예',
+    'ㅘ': '와', 'ㅙ': '왜', 'ㅚ': '외', 'ㅝ': '워', 'ㅞ': '웨', 'ㅟ': '위', 'ㅢ': '의'
+}
+JAMO_PATTERN = re.compile("[" + "".join(JAMO_MAP) + "]+")
 
-    return text
+def jamo_text(text):
+    # 51번의 re.sub 대신 한 번의 스캔으로 변환
+    return JAMO_PATTERN.sub(lambda m: "".join([JAMO_MAP[c] for c in m.group(0)]), text)
 
 def normalize_multiline_text(long_text):
     texts = split_text(long_text)
@@ -0,0 +1,191 @@
+"""
+계측 모듈 (단계별 지연 시간, 실시간 계수(RTF), 롤링 백분위수, JSON/Prometheus 텍스트 출력)
+"""
+import os
+import json
+import time
+import functools
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+# 파이프라인 단계 (출력 순서)
+STAGES = ('mic_capture', 'stt', 'translation', 'convert_text', 'normalize_text', 'g2p_annotate',
+          'glowtts', 'hifigan', 'synthesis', 'playback')
+
+PERCENTILES = (50, 95, 99)
+
+
+class RollingHistogram:
+    """최근 window개 관측값의 백분위수와 전체 누적 합계/개수"""
+
+    def __init__(self, window=1000):
+        self.values = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value):
+        self.values.append(value)
+        self.count += 1
+        self.total += value
+
+    def percentile(self, q):
+        if not self.values:
+            return None
+        ordered = sorted(self.values)
+        index = min(len(ordered) - 1, max(0, int(round(q / 100 * (len(ordered) - 1)))))
+        return ordered[index]
+
+    def summary(self):
+        summary = {'count': self.count, 'sum': self.total,
+                   'mean': self.total / self.count if self.count else None,
+                   'max': max(self.values) if self.values else None}
+        for q in PERCENTILES:
+            summary[f"p{q}"] = self.percentile(q)
+        return summary
+
+
+class Instrumentation:
+    """프로세스 전역 계측기
+
+    단계별 소요 시간(초)과 발화별 실시간 계수(합성 시간 / 오디오 길이)를 기록합니다.
+    네트워크 없이 JSON 또는 Prometheus 텍스트 형식 파일로 내보낼 수 있습니다.
+    """
+
+    def __init__(self, window=1000):
+        self.window = window
+        self.enabled = os.environ.get('TTS_METRICS', '1') != '0'
+        self._stages = {}
+        self._rtf = RollingHistogram(window)
+        self._audio_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, stage, seconds):
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = RollingHistogram(self.window)
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, stage):
+        """블록 실행 시간을 단계 시간으로 기록 (예외가 나면 기록하지 않음)"""
+        start = time.perf_counter()
+        yield
+        self.observe(stage, time.perf_counter() - start)
+
+    def record_utterance(self, compute_seconds, audio_seconds):
+        """발화 하나의 합성 시간과 오디오 길이로 실시간 계수 기록"""
+        if not self.enabled or audio_seconds <= 0:
+            return
+        with self._lock:
+            self._rtf.observe(compute_seconds / audio_seconds)
+            self._audio_seconds += audio_seconds
+        self.observe('synthesis', compute_seconds)
+
+    def instrument_method(self, obj, method_name, stage):
+        """객체의 메서드 호출 시간을 단계 시간으로 기록하도록 감쌈 (인스턴스 속성으로 지정)"""
+        method = getattr(obj, method_name)
+
+        @functools.wraps(method)
+        def timed_method(*args, **kwargs):
+            with self.timer(stage):
+                return method(*args, **kwargs)
+
+        obj.__dict__[method_name] = timed_method
+        return obj
+
+    def snapshot(self):
+        with self._lock:
+            ordered = [stage for stage in STAGES if stage in self._stages]
+            ordered += sorted(stage for stage in self._stages if stage not in STAGES)
+            return {
+                'stages': {stage: self._stages[stage].summary() for stage in ordered},
+                'rtf': self._rtf.summary(),
+                'audio_seconds': self._audio_seconds,
+                'timestamp': time.time(),
+            }
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+            self._rtf = RollingHistogram(self.window)
+            self._audio_seconds = 0.0
+
+    def to_json(self, path=None):
+        text = json.dumps(self.snapshot(), indent=2, ensure_ascii=False)
+        if path:
+            _write_atomic(path, text)
+        return text
+
+    def to_prometheus(self, path=None):
+        """Prometheus 텍스트 노출 형식 (node_exporter textfile collector 등에서 수집 가능)"""
+        snapshot = self.snapshot()
+        lines = ["# HELP tts_stage_seconds Pipeline stage latency in seconds",
+                 "# TYPE tts_stage_seconds summary"]
+        for stage, summary in snapshot['stages'].items():
+            lines += _summary_lines('tts_stage_seconds', summary, f'stage="{stage}"')
+
+        lines += ["# HELP tts_real_time_factor Synthesis time divided by audio duration per utterance",
+                  "# TYPE tts_real_time_factor summary"]
+        lines += _summary_lines('tts_real_time_factor', snapshot['rtf'])
+
+        lines += ["# HELP tts_audio_seconds_total Total synthesized audio in seconds",
+                  "# TYPE tts_audio_seconds_total counter",
+                  f"tts_audio_seconds_total {snapshot['audio_seconds']:.6f}"]
+
+        text = '\n'.join(lines) + '\n'
+        if path:
+            _write_atomic(path, text)
+        return text
+
+    def dump(self, directory):
+        """metrics.json / metrics.prom 파일로 저장"""
+        os.makedirs(directory, exist_ok=True)
+        self.to_json(os.path.join(directory, "metrics.json"))
+        self.to_prometheus(os.path.join(directory, "metrics.prom"))
+
+    def print_summary(self):
+        snapshot = self.snapshot()
+        if not snapshot['stages']:
+            return
+
+        print("📊 단계별 지연 시간 (ms)")
+        for stage, summary in snapshot['stages'].items():
+            print(f"   {stage:>14}: n={summary['count']:4d}  p50 {_ms(summary['p50'])}  "
+                  f"p95 {_ms(summary['p95'])}  p99 {_ms(summary['p99'])}")
+
+        rtf = snapshot['rtf']
+        if rtf['count']:
+            print(f"   ⏱️ RTF: p50 {rtf['p50']:.3f}  p95 {rtf['p95']:.3f}  p99 {rtf['p99']:.3f} "
+                  f"(발화 {rtf['count']}개, 오디오 {snapshot['audio_seconds']:.1f}초)")
+
+
+def _ms(seconds):
+    return f"{seconds * 1000:8.1f}" if seconds is not None else "       -"
+
+
+def _summary_lines(name, summary, labels=''):
+    separator = ',' if labels else ''
+    lines = []
+    for q in PERCENTILES:
+        value = summary[f"p{q}"]
+        if value is not None:
+            lines.append(f'{name}{{{labels}{separator}quantile="{q / 100}"}} {value:.6f}')
+    suffix = f"{{{labels}}}" if labels else ''
+    lines.append(f"{name}_sum{suffix} {summary['sum']:.6f}")
+    lines.append(f"{name}_count{suffix} {summary['count']}")
+    return lines
+
+
+def _write_atomic(path, text):
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+
+# 프로세스 전역 계측기
+metrics = Instrumentation()
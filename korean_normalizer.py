@@ -0,0 +1,229 @@
+"""
+한국어 정규화 모듈 (g2pK 변환 체인 + 문장 단위 LRU 캐시)
+
+inference_demo.py의 normalize_text와 같은 순서로 변환합니다.
+문장부호 정리 → 자모 읽기 → g2p.idioms → 영어 단어 읽기(convert_eng) → MeCab 품사 주석(annotate)
+→ 숫자 읽기(convert_num) → 알파벳 읽기 → 모델 심볼 외 문자 제거 → 끝 문장부호 보정
+
+정규화 결과는 입력 문장 단위로 캐시하므로 똑같은 문장이 반복될 때만 형태소 분석을 건너뜁니다.
+(절 단위로 나누어 주석하면 문맥이 잘려 결과가 달라질 수 있어 사용하지 않습니다.)
+"""
+import re
+import time
+import threading
+from collections import OrderedDict
+from unicodedata import normalize
+
+from instrumentation import metrics
+from text_transliterator import alphabet_text, jamo_text, punctuation_text
+
+ANNOTATION_TAG_PATTERN = re.compile("/[PJEB]")
+
+
+def remove_duplicated_punctuations(text):
+    """연속된 문장부호 정리"""
+    text = re.sub(r"[.?!]+\?", "?", text)
+    text = re.sub(r"[.?!]+!", "!", text)
+    text = re.sub(r"[.?!]+\.", ".", text)
+    return text
+
+
+class LRUCache:
+    """적중/미스 횟수를 기록하는 스레드 안전 LRU 캐시 (max_entries가 0이면 저장하지 않음)"""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if not self.max_entries:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+            }
+
+
+class KoreanNormalizer:
+    """g2pK 기반 한국어 정규화기
+
+    g2p: 이미 만든 g2pk.G2p (없으면 처음 정규화할 때 생성)
+    symbols: 남길 모델 심볼 (없으면 TTS.tts.utils.text.symbols.symbols, 그것도 없으면 필터링 생략)
+    sentence_cache_size: 입력 문장 → 정규화 결과 캐시 크기
+    """
+
+    def __init__(self, g2p=None, symbols=None, sentence_cache_size=4096):
+        self.g2p = g2p
+        self.g2pk = None
+        self.symbols = set(symbols) if symbols is not None else None
+        self.available = None  # None: 아직 로드 전, False: g2pK 없음
+        self.sentence_cache = LRUCache(sentence_cache_size)
+        self._load_lock = threading.Lock()
+
+    def load(self):
+        """g2pK(와 MeCab) 로드 → 성공 여부 (실패하면 다시 시도하지 않음)"""
+        if self.available is not None:
+            return self.available
+
+        with self._load_lock:
+            if self.available is not None:
+                return self.available
+            try:
+                import g2pk
+                self.g2pk = g2pk
+                if self.g2p is None:
+                    self.g2p = g2pk.G2p()
+
+                if self.symbols is None:
+                    try:
+                        from TTS.tts.utils.text.symbols import symbols
+                        self.symbols = set(symbols)
+                    except ImportError:
+                        print("   ⚠️ TTS 심볼 목록이 없어 문자 필터링을 생략합니다.")
+
+                self.available = True
+                print("   ✅ g2pK 정규화기 로드 완료")
+            except Exception as e:
+                print(f"   ❌ g2pK 정규화기 로드 실패: {e}")
+                self.available = False
+        return self.available
+
+    def normalize(self, text):
+        """문장 하나 정규화 (g2pK를 쓸 수 없으면 None)"""
+        cached = self.sentence_cache.get(text)
+        if cached is not None:
+            return cached
+
+        if not self.load():
+            return None
+
+        normalized = self._normalize_uncached(text)
+        self.sentence_cache.put(text, normalized)
+        return normalized
+
+    def _normalize_uncached(self, text):
+        text = text.strip()
+
+        for c in ",;:":
+            text = text.replace(c, ".")
+        text = remove_duplicated_punctuations(text)
+
+        text = jamo_text(text)
+
+        text = self.g2p.idioms(text)
+        text = self.g2pk.english.convert_eng(text, self.g2p.cmu)
+        text = self.annotate(text)
+        text = self.g2pk.numerals.convert_num(text)
+        text = ANNOTATION_TAG_PATTERN.sub("", text)
+
+        text = alphabet_text(text)
+
+        # 모델이 읽을 수 없는 문자 제거
+        if self.symbols is not None:
+            text = normalize("NFD", text)
+            text = "".join(c for c in text if c in self.symbols)
+            text = normalize("NFC", text)
+
+        text = text.strip()
+        if len(text) == 0:
+            return ""
+
+        # 문장부호만 있는 경우
+        if text in '.!?':
+            return punctuation_text(text)
+
+        # 끝에 문장부호가 없으면 마침표 추가
+        if text[-1] not in '.!?':
+            text += '.'
+
+        return text
+
+    def annotate(self, text):
+        """g2pk.utils.annotate 적용 (MeCab 품사 주석, 소요 시간 계측)"""
+        start = time.perf_counter()
+        annotated = self.g2pk.utils.annotate(text, self.g2p.mecab)
+        metrics.observe('g2p_annotate', time.perf_counter() - start)
+        return annotated
+
+    def clear_cache(self):
+        self.sentence_cache.clear()
+
+    def get_cache_stats(self):
+        """문장 캐시 통계 반환"""
+        return {'sentence': self.sentence_cache.get_stats()}
+
+
+def benchmark_normalizer(repeats=3, overlap_lines=2000, seed=0):
+    """캐시 없는 문장 단위 정규화(inference_demo.py 방식)와 문장 캐시 정규화기의 처리량 및 결과 비교
+
+    벤치마크 문장과, 그 절을 섞어 만든 문장을 입력으로 사용합니다.
+    문장 캐시는 똑같은 입력이 반복될 때만 적중하므로 절이 겹치는 새 문장은 다시 분석합니다.
+    """
+    import random
+
+    from bench.corpus import CATEGORIES, KOREAN, MIXED
+
+    sentences = [text for corpus in (KOREAN, MIXED) for category in CATEGORIES for text in corpus[category]]
+
+    # 자막처럼 같은 절이 다른 문장에 섞여 다시 나오는 입력
+    rng = random.Random(seed)
+    clauses = [clause.strip() for text in sentences for clause in re.split(r'[.,!?]', text) if clause.strip()]
+    lines = sentences + [', '.join(rng.sample(clauses, rng.randint(1, 3))) + rng.choice(['.', '!', '?'])
+                         for _ in range(overlap_lines)]
+
+    uncached = KoreanNormalizer(sentence_cache_size=0)
+    if not uncached.load():
+        return None
+    cached = KoreanNormalizer(g2p=uncached.g2p, symbols=uncached.symbols)
+    cached.load()
+
+    results = {}
+    for name, normalizer in (('uncached', uncached), ('cached', cached)):
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for line in lines:
+                normalizer.normalize(line)
+            best = min(best, time.perf_counter() - start)
+        results[name] = best
+
+    stats = cached.get_cache_stats()
+    mismatches = sum(1 for line in lines if cached.normalize(line) != uncached.normalize(line))
+
+    print(f"📊 g2pK 정규화 ({len(lines)}문장, 반복 {repeats}회)")
+    print(f"   캐시 없음: {len(lines) / results['uncached']:10.0f} 문장/초")
+    print(f"   문장 캐시: {len(lines) / results['cached']:10.0f} 문장/초 "
+          f"(적중률 {stats['sentence']['hit_rate'] * 100:.1f}%, 결과가 다른 문장 {mismatches}개)")
+    return dict(results, stats=stats, mismatches=mismatches)
+
+
+if __name__ == "__main__":
+    benchmark_normalizer()
@@ -9,6 +9,8 @@ from googletrans import Translator
 from pronunciation_converter import EnglishToKoreanPronunciation
 from tts_model_loader import TTSModelLoader
 from audio_handler import AudioHandler
+from translation_pipeline import TranslationPipeline
+from instrumentation import metrics
 
 
 class KoreanVoiceTTSTranslator:
@@ -24,8 +26,8 @@ class KoreanVoiceTTSTranslator:
         # 영어->한글 발음 변환기 초기화
         self.pronunciation_converter = EnglishToKoreanPronunciation()
 
-        # TTS 모델 로더 초기화
-        self.tts_loader = TTSModelLoader(data_path)
+        # TTS 모델 로더 초기화 (TTS_G2P=1이면 g2pK 정규화 사용)
+        self.tts_loader = TTSModelLoader(data_path, use_g2p=os.environ.get('TTS_G2P', '0') == '1')
         self.models_loaded = self.tts_loader.load_models()
 
         # 오디오 핸들러 초기화
@@ -37,7 +39,8 @@ class KoreanVoiceTTSTranslator:
         """한국어를 영어로 번역"""
         try:
             print("🌍 영어로 번역 중...")
-            result = self.translator.translate(korean_text, src='ko', dest='en')
+            with metrics.timer('translation'):
+                result = self.translator.translate(korean_text, src='ko', dest='en')
             english_text = result.text
             print(f"🔤 번역 결과: {english_text}")
             return english_text
@@ -48,7 +51,8 @@ class KoreanVoiceTTSTranslator:
     def convert_english_to_hangul_pronunciation(self, english_text):
         """영어를 한글 발음으로 변환"""
         print("🔄 영어를 한글 발음으로 변환 중...")
-        hangul_pronunciation = self.pronunciation_converter.convert_text(english_text)
+        with metrics.timer('convert_text'):
+            hangul_pronunciation = self.pronunciation_converter.convert_text(english_text)
         print(f"🎵 한글 발음: {hangul_pronunciation}")
         return hangul_pronunciation
 
@@ -63,13 +67,13 @@ class KoreanVoiceTTSTranslator:
                 print(f"🔊 텍스트 출력: {hangul_text}")
                 return
 
-            # TTS 모델로 음성 합성
-            wav = self.tts_loader.synthesize(hangul_text)
+            # TTS 모델로 문장 단위 스트리밍 합성 (첫 문장부터 바로 재생)
+            print("🎵 오디오 출력 중...")
+            chunks = self.tts_loader.synthesize_stream(hangul_text)
+            total_samples = self.audio_handler.play_stream(chunks, 22050)
 
-            if wav is not None:
-                print(f"✅ 음성 합성 완료 (길이: {len(wav)} samples)")
-                print("🎵 오디오 출력 중...")
-                self.audio_handler.play_audio(wav, 22050)
+            if total_samples > 0:
+                print(f"✅ 음성 합성 완료 (길이: {total_samples} samples)")
                 print(f"🔊 음성 합성 완료: {hangul_text}")
             else:
                 print("🎵 TTS 시뮬레이션 모드")
@@ -83,8 +87,9 @@ class KoreanVoiceTTSTranslator:
         """번역 반복 실행"""
         print("\n" + "=" * 60)
         print("🎯 한국어 TTS 번역기")
-        print("1️⃣ 한국어 → 영어 번역 → 한글 발음 → TTS")
-        print("2️⃣ 한국어 직접 → TTS (번역 없이)")
+        print("[Enter] 한국어 → 영어 번역 → 한글 발음 → TTS")
+        print("[k]     한국어 직접 → TTS (번역 없이)")
+        print("[p]     연속 번역 (합성/재생 중에도 다음 문장 인식)")
         print("종료하려면 'quit', 'exit', '종료'라고 말하세요")
         print("=" * 60)
 
@@ -94,6 +99,7 @@ class KoreanVoiceTTSTranslator:
                 print("\n🔤 모드를 선택하세요:")
                 print("   [Enter] - 번역 모드 (한국어 → 영어 번역 → TTS)")
                 print("   'k' + [Enter] - 한국어 모드 (한국어 → 직접 TTS)")
+                print("   'p' + [Enter] - 연속 번역 모드 (파이프라인)")
 
                 mode_input = input("   모드 선택: ").strip().lower()
 
@@ -103,6 +109,11 @@ class KoreanVoiceTTSTranslator:
                     result = self.korean_direct_mode()
                     if result == 'exit':
                         break
+                elif mode_input == 'p':
+                    # 연속 번역 모드 (단계별 파이프라인)
+                    print("\n🔁 연속 번역 모드")
+                    self.pipelined_translation_mode()
+                    break
                 else:
                     # 번역 모드 (기본)
                     print("\n🌍 번역 모드")
@@ -117,6 +128,22 @@ class KoreanVoiceTTSTranslator:
                 print(f"❌ 예상치 못한 오류: {e}")
                 print("💡 계속 진행합니다...")
 
+        self.report_metrics()
+
+    def report_metrics(self):
+        """단계별 지연 시간/RTF 요약 출력 (TTS_METRICS_DIR 지정 시 JSON/Prometheus 파일 저장)"""
+        metrics.print_summary()
+        if self.tts_loader.korean_normalizer is not None:
+            stats = self.tts_loader.korean_normalizer.get_cache_stats()
+            print(f"   📝 정규화 캐시 적중률: 문장 {stats['sentence']['hit_rate'] * 100:.1f}%")
+        metrics_dir = os.environ.get('TTS_METRICS_DIR')
+        if metrics_dir:
+            try:
+                metrics.dump(metrics_dir)
+                print(f"📁 계측 결과 저장: {metrics_dir}")
+            except OSError as e:
+                print(f"⚠️ 계측 결과 저장 실패: {e}")
+
     def korean_direct_mode(self):
         """한국어 직접 TTS 모드"""
         print("🗣️  한국어로 말해주세요 (직접 TTS)...")
@@ -171,6 +198,14 @@ class KoreanVoiceTTSTranslator:
         time.sleep(1)
 
 
+    def pipelined_translation_mode(self):
+        """연속 번역 모드 (인식/번역/발음 변환/합성/재생을 단계별 스레드로 동시 실행)"""
+        print("🗣️  한국어로 계속 말해주세요. 종료하려면 '종료'라고 말하세요...")
+        pipeline = TranslationPipeline(self)
+        pipeline.run()
+        return pipeline.get_stats()
+
+
 def main():
     """메인 실행 함수"""
     try:
@@ -183,6 +218,9 @@ def main():
             print(f"❌ 경로가 존재하지 않습니다: {data_path}")
             return
 
+        # 다른 구성요소를 초기화하는 동안 체크포인트를 백그라운드로 미리 로드
+        TTSModelLoader.preload(data_path)
+
         # 번역기 생성 및 실행
         translator = KoreanVoiceTTSTranslator(data_path)
         translator.run_translation_loop()
@@ -0,0 +1,477 @@
+"""
+모델 내보내기 모듈 (TorchScript / ONNX 그래프 내보내기 및 경량 실행기)
+"""
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import subprocess
+
+import numpy as np
+import torch
+from torch import nn
+
+from synthesis_cache import DEFAULT_CACHE_DIR, fingerprint_model_files
+
+EXPORT_FORMATS = ('torchscript', 'onnx')
+BACKENDS = ('torch',) + EXPORT_FORMATS
+
+GRAPH_EXTENSIONS = {'torchscript': '.pt', 'onnx': '.onnx'}
+GRAPH_NAMES = ('glowtts_encoder', 'glowtts_decoder', 'hifigan')
+
+# Synthesizer.tts가 문장 사이에 넣는 무음 길이 (샘플)
+SENTENCE_GAP_SAMPLES = 10000
+
+
+class GlowTTSEncoderGraph(nn.Module):
+    """Glow-TTS 인코더 (토큰 → 평균/로그 스케일/로그 지속시간/마스크)"""
+
+    def __init__(self, model):
+        super().__init__()
+        self.encoder = model.encoder
+
+    def forward(self, x, x_lengths):
+        o_mean, o_log_scale, o_dur_log, x_mask = self.encoder(x, x_lengths, g=None)
+        return o_mean, o_log_scale, o_dur_log, x_mask
+
+
+class GlowTTSDecoderGraph(nn.Module):
+    """Glow-TTS 디코더 역방향 (잠재 변수 → 멜)"""
+
+    def __init__(self, model):
+        super().__init__()
+        self.decoder = model.decoder
+
+    def forward(self, z, y_mask):
+        y, _ = self.decoder(z, y_mask, g=None, reverse=True)
+        return y
+
+
+class VocoderGraph(nn.Module):
+    """HiFi-GAN 추론 (멜 → 파형)"""
+
+    def __init__(self, vocoder):
+        super().__init__()
+        self.vocoder = vocoder
+
+    def forward(self, mel):
+        return self.vocoder.inference(mel)
+
+
+class TorchModuleGraph:
+    """numpy 입력/출력으로 torch 모듈 실행"""
+
+    def __init__(self, module):
+        self.module = module
+
+    @torch.no_grad()
+    def __call__(self, *inputs):
+        outputs = self.module(*[torch.from_numpy(np.ascontiguousarray(x)) for x in inputs])
+        if torch.is_tensor(outputs):
+            outputs = (outputs,)
+        return [output.cpu().numpy() for output in outputs]
+
+
+class TorchScriptGraph(TorchModuleGraph):
+    def __init__(self, path):
+        super().__init__(torch.jit.load(path, map_location='cpu').eval())
+
+
+class OnnxGraph:
+    """onnxruntime CPU 세션 실행"""
+
+    def __init__(self, path):
+        try:
+            import onnxruntime
+        except ImportError:
+            raise ImportError("ONNX 백엔드를 사용하려면 onnxruntime을 설치하세요: pip install onnxruntime")
+
+        self.session = onnxruntime.InferenceSession(path, providers=['CPUExecutionProvider'])
+        self.input_names = [node.name for node in self.session.get_inputs()]
+
+    def __call__(self, *inputs):
+        return self.session.run(None, dict(zip(self.input_names, inputs)))
+
+
+def _config_get(config, key, default=None):
+    if isinstance(config, dict):
+        return config.get(key, default)
+    return getattr(config, key, default)
+
+
+def fit_mel_transform(ap, vocoder_ap, num_mels):
+    """Glow-TTS 정규화 멜 → 보코더 정규화 멜 변환을 채널별 (기울기, 절편, 최소, 최대)로 근사
+
+    두 AudioProcessor의 정규화는 모두 (채널별) 선형 변환 + 클리핑이므로
+    그래프 실행 시 AudioProcessor 없이 같은 변환을 적용할 수 있습니다.
+    """
+    max_norm = float(_config_get(ap, 'max_norm', 4.0) or 4.0)
+    grid = np.linspace(-1.5 * max_norm, 1.5 * max_norm, 65, dtype=np.float32)
+    inputs = np.tile(grid, (num_mels, 1))
+    outputs = vocoder_ap.normalize(ap.denormalize(inputs.copy())).astype(np.float32)
+
+    # 클리핑 영향이 없는 0 근처 두 점으로 기울기/절편 추정
+    i, j = 28, 36
+    scale = (outputs[:, j] - outputs[:, i]) / (grid[j] - grid[i])
+    bias = outputs[:, i] - scale * grid[i]
+    low, high = outputs.min(axis=1), outputs.max(axis=1)
+
+    approx = np.clip(scale[:, None] * inputs + bias[:, None], low[:, None], high[:, None])
+    if not np.allclose(approx, outputs, atol=1e-3):
+        raise ValueError("멜 정규화 변환이 선형이 아니어서 내보낼 수 없습니다.")
+
+    return {'scale': scale.tolist(), 'bias': bias.tolist(), 'min': low.tolist(), 'max': high.tolist()}
+
+
+def manifest_path(export_dir, export_format):
+    return os.path.join(export_dir, f"manifest_{export_format}.json")
+
+
+def has_export(export_dir, export_format):
+    return bool(export_dir) and os.path.exists(manifest_path(export_dir, export_format))
+
+
+def default_export_dir(checkpoint_paths, cache_dir=None):
+    """체크포인트 지문별 내보내기 폴더 (모델 폴더가 아닌 사용자 캐시 폴더)"""
+    return os.path.join(cache_dir or DEFAULT_CACHE_DIR, "exported", fingerprint_model_files(checkpoint_paths))
+
+
+class ExportedSynthesizer:
+    """내보낸 그래프로 Synthesizer.tts와 같은 결과를 만드는 경량 실행기
+
+    TTS 패키지의 모델 코드 없이 인코더 → 지속시간 확장(numpy) → 디코더 → 보코더를 실행합니다.
+    텍스트 → 토큰 변환만 TTS의 텍스트 처리 모듈을 사용합니다.
+    """
+
+    def __init__(self, graphs, manifest, tts_config=None, seed=None):
+        self.encoder = graphs['glowtts_encoder']
+        self.decoder = graphs['glowtts_decoder']
+        self.vocoder = graphs['hifigan']
+        self.manifest = manifest
+        self.tts_config = tts_config
+
+        self.output_sample_rate = manifest['sample_rate']
+        self.hop_length = manifest['hop_length']
+        self.noise_scale = manifest['noise_scale']
+        self.length_scale = manifest['length_scale']
+
+        transform = manifest['mel_transform']
+        self.mel_scale = np.asarray(transform['scale'], dtype=np.float32)[:, None]
+        self.mel_bias = np.asarray(transform['bias'], dtype=np.float32)[:, None]
+        self.mel_min = np.asarray(transform['min'], dtype=np.float32)[:, None]
+        self.mel_max = np.asarray(transform['max'], dtype=np.float32)[:, None]
+
+        self.rng = np.random.default_rng(seed)
+        self._text_to_seqvec = None
+
+    @classmethod
+    def load(cls, export_dir, export_format='onnx', seed=None):
+        """내보내기 폴더에서 그래프 로드"""
+        with open(manifest_path(export_dir, export_format), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+        graph_class = OnnxGraph if export_format == 'onnx' else TorchScriptGraph
+        graphs = {name: graph_class(os.path.join(export_dir, filename))
+                  for name, filename in manifest['graphs'].items()}
+
+        from TTS.config import load_config
+        tts_config = load_config(os.path.join(export_dir, manifest['tts_config']))
+        return cls(graphs, manifest, tts_config, seed)
+
+    @classmethod
+    def from_synthesizer(cls, synthesizer, manifest, seed=None):
+        """로드된 PyTorch 모델을 같은 경로로 실행 (내보내기 결과 비교 기준)"""
+        graphs = {
+            'glowtts_encoder': TorchModuleGraph(GlowTTSEncoderGraph(synthesizer.tts_model).eval()),
+            'glowtts_decoder': TorchModuleGraph(GlowTTSDecoderGraph(synthesizer.tts_model).eval()),
+            'hifigan': TorchModuleGraph(VocoderGraph(synthesizer.vocoder_model).eval()),
+        }
+        return cls(graphs, manifest, synthesizer.tts_config, seed)
+
+    def text_to_ids(self, text):
+        if self._text_to_seqvec is None:
+            from TTS.tts.utils.synthesis import text_to_seqvec
+            self._text_to_seqvec = text_to_seqvec
+        return np.asarray(self._text_to_seqvec(text, self.tts_config), dtype=np.int64)
+
+    def text_to_mel(self, token_ids, noise_scale=None):
+        """토큰 → Glow-TTS 정규화 멜 [채널, 프레임]"""
+        noise_scale = self.noise_scale if noise_scale is None else noise_scale
+
+        x = np.asarray(token_ids, dtype=np.int64)[None, :]
+        x_lengths = np.asarray([x.shape[1]], dtype=np.int64)
+        o_mean, o_log_scale, o_dur_log, x_mask = self.encoder(x, x_lengths)
+
+        # sce-tts 포크 GlowTTS.inference와 같은 지속시간 계산 (정렬 행렬 곱 대신 프레임 반복)
+        #   w = (exp(o_dur_log) - 1) * x_mask * length_scale
+        #   w_ceil = ceil(w), y_lengths = clamp_min(sum(w_ceil), 1)
+        w = (np.exp(o_dur_log) - 1) * x_mask * self.length_scale
+        durations = np.ceil(w[0, 0]).astype(np.int64)
+        if durations.sum() < 1:
+            # 최소 1 프레임, 정렬이 비어 있으므로 평균/로그 스케일은 0
+            y_mean = np.zeros((o_mean.shape[1], 1), dtype=o_mean.dtype)
+            y_log_scale = np.zeros((o_log_scale.shape[1], 1), dtype=o_log_scale.dtype)
+        else:
+            y_mean = np.repeat(o_mean[0], durations, axis=1)
+            y_log_scale = np.repeat(o_log_scale[0], durations, axis=1)
+
+        noise = self.rng.standard_normal(y_mean.shape).astype(np.float32)
+        z = ((y_mean + np.exp(y_log_scale) * noise * noise_scale)[None]).astype(np.float32)
+        y_mask = np.ones((1, 1, z.shape[2]), dtype=np.float32)
+
+        return self.decoder(z, y_mask)[0][0]
+
+    def mel_for_vocoder(self, mel):
+        return np.clip(self.mel_scale * mel + self.mel_bias, self.mel_min, self.mel_max).astype(np.float32)
+
+    def vocode(self, vocoder_mel):
+        """보코더 정규화 멜 [채널, 프레임] → 파형"""
+        wav = self.vocoder(vocoder_mel[None].astype(np.float32))[0]
+        return wav.reshape(-1).astype(np.float32)
+
+    def synthesize_sentence(self, sentence, noise_scale=None):
+        mel = self.text_to_mel(self.text_to_ids(sentence), noise_scale)
+        return self.vocode(self.mel_for_vocoder(mel))
+
+    def split_into_sentences(self, text):
+        return [s.strip() for s in re.findall(r'[^.!?]*[.!?]|[^.!?]+$', text) if s.strip()]
+
+    def tts(self, text, speaker_name=None, style_wav=None):
+        """Synthesizer.tts와 같은 형태(문장 사이 무음 포함 list)로 반환"""
+        wavs = []
+        for sentence in self.split_into_sentences(text):
+            wavs += list(self.synthesize_sentence(sentence))
+            wavs += [0] * SENTENCE_GAP_SAMPLES
+        return wavs
+
+
+def _export_graph(module, example_inputs, path, export_format, input_names, output_names, dynamic_axes):
+    with torch.no_grad():
+        if export_format == 'torchscript':
+            traced = torch.jit.trace(module, example_inputs, check_trace=False)
+            traced.save(path)
+            return
+
+        kwargs = dict(input_names=input_names, output_names=output_names,
+                      dynamic_axes=dynamic_axes, opset_version=13)
+        try:
+            torch.onnx.export(module, example_inputs, path, dynamo=False, **kwargs)
+        except TypeError:  # dynamo 인자가 없는 이전 torch
+            torch.onnx.export(module, example_inputs, path, **kwargs)
+
+
+def export_synthesizer(synthesizer, output_dir, export_format='onnx', tts_config_path=None,
+                       example_text="안녕하세요. 내보내기용 예제 문장입니다."):
+    """로드된 Synthesizer의 Glow-TTS/HiFi-GAN을 그래프로 내보내고 매니페스트 경로 반환
+
+    Glow-TTS는 지속시간에 따라 길이가 바뀌는 부분을 제외하고 인코더/디코더로 나누어 내보냅니다.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 내보내기 형식: {export_format}")
+
+    from batch_synthesis import BatchSynthesizer
+
+    batcher = BatchSynthesizer(synthesizer)
+    if not batcher.supports_batching():
+        raise ValueError("보코더 샘플레이트가 달라 내보낼 수 없습니다.")
+
+    tts_model = synthesizer.tts_model
+    ap = synthesizer.ap
+    manifest = {
+        'format': export_format,
+        'torch': torch.__version__,
+        'sample_rate': synthesizer.output_sample_rate,
+        'hop_length': batcher.hop_length,
+        'noise_scale': float(getattr(tts_model, 'inference_noise_scale', 0.33)),
+        'length_scale': float(getattr(tts_model, 'length_scale', 1.0)),
+        'mel_transform': fit_mel_transform(ap, batcher.vocoder_ap, ap.num_mels),
+        'graphs': {name: name + GRAPH_EXTENSIONS[export_format] for name in GRAPH_NAMES},
+        'tts_config': 'tts_config.json',
+    }
+
+    os.makedirs(output_dir, exist_ok=True)
+    if tts_config_path:
+        shutil.copyfile(tts_config_path, os.path.join(output_dir, manifest['tts_config']))
+    else:
+        synthesizer.tts_config.save_json(os.path.join(output_dir, manifest['tts_config']))
+
+    # 예제 입력은 PyTorch 경로로 만들어 각 그래프를 추적
+    reference = ExportedSynthesizer.from_synthesizer(synthesizer, manifest, seed=0)
+    token_ids = batcher.text_to_ids(example_text)
+    x = torch.from_numpy(token_ids)[None, :]
+    x_lengths = torch.tensor([x.shape[1]], dtype=torch.long)
+    mel = reference.text_to_mel(token_ids)
+    z = torch.randn(1, mel.shape[0], mel.shape[1])
+    y_mask = torch.ones(1, 1, mel.shape[1])
+    vocoder_mel = torch.from_numpy(reference.mel_for_vocoder(mel))[None]
+
+    graphs = {
+        'glowtts_encoder': (GlowTTSEncoderGraph(tts_model), (x, x_lengths), ['x', 'x_lengths'],
+                            ['o_mean', 'o_log_scale', 'o_dur_log', 'x_mask'],
+                            {'x': {1: 'tokens'}, 'o_mean': {2: 'tokens'}, 'o_log_scale': {2: 'tokens'},
+                             'o_dur_log': {2: 'tokens'}, 'x_mask': {2: 'tokens'}}),
+        'glowtts_decoder': (GlowTTSDecoderGraph(tts_model), (z, y_mask), ['z', 'y_mask'], ['mel'],
+                            {'z': {2: 'frames'}, 'y_mask': {2: 'frames'}, 'mel': {2: 'frames'}}),
+        'hifigan': (VocoderGraph(synthesizer.vocoder_model), (vocoder_mel,), ['mel'], ['wav'],
+                    {'mel': {2: 'frames'}, 'wav': {2: 'samples'}}),
+    }
+
+    for name, (module, example_inputs, input_names, output_names, dynamic_axes) in graphs.items():
+        path = os.path.join(output_dir, manifest['graphs'][name])
+        print(f"   📤 {name} → {os.path.basename(path)}")
+        _export_graph(module.eval(), example_inputs, path, export_format,
+                      input_names, output_names, dynamic_axes)
+
+    # 매니페스트는 마지막에 기록 (중간에 실패하면 불완전한 내보내기로 인식되지 않음)
+    path = manifest_path(output_dir, export_format)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    print(f"✅ {export_format} 내보내기 완료: {output_dir}")
+    return path
+
+
+def _max_abs_diff(a, b):
+    length = min(a.shape[-1], b.shape[-1])
+    return float(np.max(np.abs(a[..., :length] - b[..., :length]))) if length else 0.0
+
+
+def check_export_parity(loader, export_dir, export_format='onnx', texts=None, atol=1e-3):
+    """내보낸 그래프와 PyTorch 모델의 멜/파형 출력 비교
+
+    잡음을 끄고(noise_scale=0) 같은 토큰으로 실행하며, 최대 절대 오차를 반환합니다.
+    loader는 torch 백엔드로 모델이 로드된 상태여야 합니다.
+    """
+    from batch_synthesis import BatchSynthesizer
+
+    texts = texts or ["안녕하세요.", "오늘 날씨가 정말 좋네요.",
+                      "간장 공장 공장장은 강 공장장이고 된장 공장 공장장은 공 공장장이다."]
+
+    exported = ExportedSynthesizer.load(export_dir, export_format)
+    reference = ExportedSynthesizer.from_synthesizer(loader.synthesizer, exported.manifest)
+    batcher = BatchSynthesizer(loader.synthesizer)
+
+    original_noise_scale = getattr(loader.synthesizer.tts_model, 'inference_noise_scale', None)
+    loader.synthesizer.tts_model.inference_noise_scale = 0.0
+    results = []
+    try:
+        for text in texts:
+            token_ids = batcher.text_to_ids(loader.normalize_text(text))
+
+            # 1) 지속시간 확장 재구현이 GlowTTS.inference와 같은지
+            model_mel = batcher.run_glowtts(torch.from_numpy(token_ids)[None],
+                                            torch.tensor([len(token_ids)]))['model_outputs'][0].numpy().T
+            reference_mel = reference.text_to_mel(token_ids, noise_scale=0.0)
+
+            # 2) 내보낸 그래프가 PyTorch 모델과 같은지
+            exported_mel = exported.text_to_mel(token_ids, noise_scale=0.0)
+            vocoder_mel = reference.mel_for_vocoder(reference_mel)
+            reference_wav = reference.vocode(vocoder_mel)
+            exported_wav = exported.vocode(vocoder_mel)
+
+            result = {
+                'text': text,
+                'model_mel_diff': _max_abs_diff(model_mel, reference_mel),
+                'mel_diff': _max_abs_diff(reference_mel, exported_mel),
+                'wav_diff': _max_abs_diff(reference_wav, exported_wav),
+                'length_match': reference_mel.shape == exported_mel.shape,
+            }
+            result['passed'] = (result['length_match'] and result['model_mel_diff'] <= atol and
+                                result['mel_diff'] <= atol and result['wav_diff'] <= atol)
+            results.append(result)
+    finally:
+        if original_noise_scale is not None:
+            loader.synthesizer.tts_model.inference_noise_scale = original_noise_scale
+
+    print(f"🔍 {export_format} 출력 비교 (허용 오차 {atol})")
+    for result in results:
+        status = "✅" if result['passed'] else "❌"
+        print(f"   {status} 멜 {result['mel_diff']:.2e}, 파형 {result['wav_diff']:.2e}, "
+              f"재구현 {result['model_mel_diff']:.2e}: {result['text']}")
+    return results
+
+
+def measure_backend(data_path, backend, texts):
+    """새 프로세스에서 호출: 모델 준비 시간과 문장별 지연 시간 측정"""
+    start = time.perf_counter()
+    from tts_model_loader import TTSModelLoader
+
+    loader = TTSModelLoader(data_path, use_cache=False, backend=backend)
+    if not loader.load_models():
+        return None
+    startup = time.perf_counter() - start
+
+    loader.synthesize(texts[0])  # 워밍업
+    latencies = []
+    samples = 0
+    for text in texts:
+        sentence_start = time.perf_counter()
+        wav = loader.synthesize(text)
+        latencies.append(time.perf_counter() - sentence_start)
+        samples += len(wav)
+
+    return {
+        'backend': backend,
+        'startup_sec': startup,
+        'mean_latency_sec': float(np.mean(latencies)),
+        'rtf': sum(latencies) / (samples / loader.synthesizer.output_sample_rate),
+    }
+
+
+def compare_backends(data_path, texts, backends=BACKENDS):
+    """백엔드별 시작 시간(별도 프로세스)과 합성 지연 비교"""
+    results = {}
+    for backend in backends:
+        process = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), 'measure', data_path, backend] + list(texts),
+            capture_output=True, text=True)
+        lines = process.stdout.strip().splitlines()
+        try:
+            results[backend] = json.loads(lines[-1])
+        except (IndexError, ValueError):
+            print(f"⚠️ {backend} 측정 실패: {process.stderr.strip()[-300:]}")
+
+    print("📊 백엔드 비교")
+    for backend, result in results.items():
+        if result is None:
+            continue
+        print(f"   {backend:>11}: 시작 {result['startup_sec']:.2f}초, "
+              f"문장당 {result['mean_latency_sec'] * 1000:.1f}ms, RTF {result['rtf']:.3f}")
+    return results
+
+
+SAMPLE_TEXTS = [
+    "안녕하세요.",
+    "오늘 날씨가 정말 좋네요.",
+    "간장 공장 공장장은 강 공장장이고 된장 공장 공장장은 공 공장장이다.",
+    "저는 음성 합성 시스템입니다.",
+]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="TTS 모델 그래프 내보내기")
+    parser.add_argument('command', choices=['export', 'parity', 'compare', 'measure'])
+    parser.add_argument('data_path', nargs='?', default='data')
+    parser.add_argument('args', nargs='*')
+    parser.add_argument('--format', choices=EXPORT_FORMATS, default='onnx')
+    parser.add_argument('--output', default=None, help="내보내기 폴더 (기본: 사용자 캐시 폴더)")
+    options = parser.parse_args()
+
+    if options.command == 'measure':
+        print(json.dumps(measure_backend(options.data_path, options.args[0], options.args[1:])))
+    elif options.command == 'compare':
+        compare_backends(options.data_path, options.args or SAMPLE_TEXTS)
+    else:
+        from tts_model_loader import TTSModelLoader
+
+        tts_loader = TTSModelLoader(options.data_path, use_cache=False)
+        if tts_loader.load_models():
+            output_dir = options.output or tts_loader.default_export_dir()
+            if options.command == 'export' or not has_export(output_dir, options.format):
+                export_synthesizer(tts_loader.synthesizer, output_dir, options.format,
+                                   tts_loader.glowtts_config_path)
+            if options.command == 'parity':
+                check_export_parity(tts_loader, output_dir, options.format, options.args or None)
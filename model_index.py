@@ -0,0 +1,175 @@
+"""
+모델 디렉토리 색인 모듈 (반복 os.walk 대신 한 번 만든 색인 재사용)
+"""
+import os
+import time
+import threading
+
+
+class DirectoryIndex:
+    """디렉토리 트리의 파일 이름 → 경로 색인
+
+    처음 한 번 전체를 스캔하고, 이후에는 디렉토리 mtime이 바뀐
+    디렉토리만 다시 읽어 색인을 갱신합니다.
+    """
+
+    def __init__(self, root, min_refresh_interval=1.0):
+        self.root = os.path.abspath(root)
+        self.min_refresh_interval = min_refresh_interval
+
+        # 디렉토리 경로 → {'mtime', 'files': {이름: mtime}, 'subdirs': [경로]}
+        self._dirs = {}
+        self._names = None
+        self._last_refresh = 0.0
+        self._lock = threading.RLock()
+
+        self.scan_count = 0
+        self.build()
+
+    def _is_cycle(self, dirpath, dir_id):
+        """dirpath의 상위 디렉토리 중 같은 실제 디렉토리(장치, inode)가 있으면 True (심볼릭 링크 순환)"""
+        parent = os.path.dirname(dirpath)
+        while parent in self._dirs:
+            if self._dirs[parent]['id'] == dir_id:
+                return True
+            if parent == self.root:
+                break
+            parent = os.path.dirname(parent)
+        return False
+
+    def _scan_dir(self, dirpath):
+        """디렉토리 하나만 읽어 색인에 반영 (새 하위 디렉토리는 재귀적으로 추가)
+
+        다른 볼륨을 가리키는 심볼릭 링크 디렉토리도 링크 경로 그대로 색인하되,
+        상위 디렉토리로 되돌아가는 링크는 건너뜁니다.
+        """
+        try:
+            stat = os.stat(dirpath)
+            dir_id = (stat.st_dev, stat.st_ino)
+            if dirpath != self.root and self._is_cycle(dirpath, dir_id):
+                self._remove_dir(dirpath)
+                return
+
+            files = {}
+            subdirs = []
+            with os.scandir(dirpath) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        files[entry.name] = entry.stat().st_mtime
+        except OSError:
+            self._remove_dir(dirpath)
+            return
+
+        previous = self._dirs.get(dirpath)
+        self._dirs[dirpath] = {'mtime': stat.st_mtime_ns, 'id': dir_id, 'files': files, 'subdirs': subdirs}
+        self.scan_count += 1
+
+        # 사라진 하위 디렉토리 제거
+        if previous is not None:
+            for subdir in set(previous['subdirs']) - set(subdirs):
+                self._remove_dir(subdir)
+
+        for subdir in subdirs:
+            if subdir not in self._dirs:
+                self._scan_dir(subdir)
+
+    def _remove_dir(self, dirpath):
+        info = self._dirs.pop(dirpath, None)
+        if info is not None:
+            for subdir in info['subdirs']:
+                self._remove_dir(subdir)
+
+    def build(self):
+        """전체 색인 생성"""
+        with self._lock:
+            self._dirs.clear()
+            if os.path.isdir(self.root):
+                self._scan_dir(self.root)
+            self._names = None
+            self._last_refresh = time.monotonic()
+
+    def refresh(self, force=False):
+        """mtime이 바뀐 디렉토리만 다시 스캔"""
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_refresh < self.min_refresh_interval:
+                return
+            self._last_refresh = now
+
+            if self.root not in self._dirs:
+                if os.path.isdir(self.root):
+                    self._scan_dir(self.root)
+                    self._names = None
+                return
+
+            for dirpath in list(self._dirs):
+                info = self._dirs.get(dirpath)
+                if info is None:
+                    continue  # 상위 디렉토리 재스캔 중 제거됨
+                try:
+                    changed = os.stat(dirpath).st_mtime_ns != info['mtime']
+                except OSError:
+                    changed = True
+                if changed:
+                    self._scan_dir(dirpath)
+                    self._names = None
+
+    def _name_map(self):
+        if self._names is None:
+            names = {}
+            for dirpath in sorted(self._dirs):
+                for filename in self._dirs[dirpath]['files']:
+                    names.setdefault(filename, []).append(os.path.join(dirpath, filename))
+            self._names = names
+        return self._names
+
+    @staticmethod
+    def _is_under(path, base):
+        return path == base or path.startswith(base.rstrip(os.sep) + os.sep)
+
+    def contains(self, path):
+        return self._is_under(os.path.abspath(path), self.root)
+
+    def find(self, filename, under=None):
+        """파일 이름으로 경로 목록 조회 (under가 있으면 그 아래만)"""
+        with self._lock:
+            self.refresh()
+            paths = self._name_map().get(filename, [])
+            if under is not None:
+                base = os.path.abspath(under)
+                paths = [path for path in paths if self._is_under(path, base)]
+            return list(paths)
+
+    def walk(self, under=None):
+        """(디렉토리 경로, {파일 이름: mtime}) 목록 반환 (os.walk 대체)"""
+        with self._lock:
+            self.refresh()
+            base = os.path.abspath(under) if under is not None else self.root
+            return [(dirpath, dict(info['files']))
+                    for dirpath, info in sorted(self._dirs.items())
+                    if self._is_under(dirpath, base)]
+
+    def get_mtime(self, path):
+        path = os.path.abspath(path)
+        with self._lock:
+            info = self._dirs.get(os.path.dirname(path))
+            if info is None:
+                return None
+            return info['files'].get(os.path.basename(path))
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_directory_index(root):
+    """경로별 색인을 프로세스 안에서 공유"""
+    key = os.path.abspath(root)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = DirectoryIndex(key)
+            _indexes[key] = index
+        return index
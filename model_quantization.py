@@ -0,0 +1,440 @@
+"""
+CPU 추론 최적화 모듈 (int8 동적 양자화 / bf16 autocast)
+"""
+import io
+import os
+import copy
+import time
+import hashlib
+import functools
+
+import numpy as np
+import torch
+from torch import nn
+from torch.nn.utils.weight_norm import WeightNorm
+
+try:
+    from torch.ao.quantization import quantize_dynamic
+except ImportError:  # torch < 1.10
+    from torch.quantization import quantize_dynamic
+
+from synthesis_cache import DEFAULT_CACHE_DIR
+from batch_synthesis import BatchSynthesizer
+
+INFERENCE_MODES = ('fp32', 'int8', 'bf16')
+
+# 양자화 기록 파일 접미사 (체크포인트 확장자와 겹치지 않게)
+QUANTIZED_SUFFIX = '.int8.bin'
+
+# int8 모델 사용 전 fp32 출력과 비교하는 문장과 허용 오차 (정규화 멜 평균 절대 차이, 멜 길이 비율)
+PARITY_TEXT = "안녕하세요. 오늘 날씨가 정말 좋네요."
+INT8_MEL_TOLERANCE = 0.3
+INT8_LENGTH_TOLERANCE = 0.1
+
+# 동적 양자화 대상 레이어
+DYNAMIC_QUANTIZED_LAYERS = {nn.Linear, nn.LSTM, nn.GRU}
+
+
+class PointwiseConv1d(nn.Module):
+    """kernel_size=1 Conv1d를 같은 연산의 Linear로 바꾼 모듈
+
+    동적 양자화는 Conv1d를 지원하지 않으므로, Glow-TTS 어텐션/WaveNet 블록의
+    1x1 합성곱을 Linear로 바꿔 int8 양자화 대상에 포함시킵니다.
+    """
+
+    def __init__(self, conv):
+        super().__init__()
+        self.linear = nn.Linear(conv.in_channels, conv.out_channels, bias=conv.bias is not None)
+        with torch.no_grad():
+            self.linear.weight.copy_(effective_weight(conv).detach()[:, :, 0])
+            if conv.bias is not None:
+                self.linear.bias.copy_(conv.bias.detach())
+
+    def forward(self, x):
+        # [B, C, T] → [B, T, C] → Linear → [B, C, T]
+        return self.linear(x.transpose(1, 2)).transpose(1, 2)
+
+
+def effective_weight(conv):
+    """합성곱의 실제 가중치 (훅 방식 weight_norm이면 weight_g/weight_v로 다시 계산)
+
+    Glow-TTS WaveNet 블록의 weight_norm은 forward 직전에만 weight를 갱신하므로,
+    체크포인트를 불러온 뒤 아직 실행하지 않은 모듈의 weight 속성은 초기화 값 그대로입니다.
+    """
+    for hook in conv._forward_pre_hooks.values():
+        if isinstance(hook, WeightNorm):
+            return hook.compute_weight(conv)
+    return conv.weight
+
+
+def refresh_weight_norm(model):
+    """훅 방식 weight_norm의 weight 속성을 weight_g/weight_v로 다시 계산
+
+    계산 그래프가 붙은 weight 속성은 deepcopy/직렬화할 수 없으므로 분리한 텐서로 바꿉니다.
+    """
+    for module in model.modules():
+        for hook in module._forward_pre_hooks.values():
+            if isinstance(hook, WeightNorm):
+                with torch.no_grad():
+                    setattr(module, hook.name, hook.compute_weight(module).detach())
+
+
+def is_pointwise_conv(module):
+    return (isinstance(module, nn.Conv1d) and module.kernel_size == (1,) and
+            module.stride == (1,) and module.padding == (0,) and module.groups == 1)
+
+
+def convert_pointwise_convs(model):
+    """모델 안의 1x1 Conv1d를 PointwiseConv1d로 교체하고 교체 개수 반환"""
+    count = 0
+    for name, child in list(model.named_children()):
+        if is_pointwise_conv(child):
+            setattr(model, name, PointwiseConv1d(child))
+            count += 1
+        else:
+            count += convert_pointwise_convs(child)
+    return count
+
+
+def has_quantizable_layers(model):
+    """1x1 Conv1d나 동적 양자화 대상 레이어가 있는지 (HiFi-GAN처럼 없으면 복사/양자화 생략)"""
+    return any(is_pointwise_conv(module) or type(module) in DYNAMIC_QUANTIZED_LAYERS
+               for module in model.modules())
+
+
+def quantize_int8(model):
+    """1x1 합성곱 변환 후 Linear/LSTM/GRU를 int8 동적 양자화 (모델 객체를 직접 변경)"""
+    convert_pointwise_convs(model)
+    return quantize_dynamic(model, DYNAMIC_QUANTIZED_LAYERS, dtype=torch.qint8, inplace=True)
+
+
+def count_quantized_layers(model):
+    return sum(1 for module in model.modules()
+               if type(module).__module__.startswith(('torch.ao.nn.quantized', 'torch.nn.quantized')))
+
+
+def bf16_supported():
+    """CPU가 bf16 연산(AVX512-BF16/AMX)을 지원하는지 확인"""
+    try:
+        return bool(torch.ops.mkldnn._is_mkldnn_bf16_supported())
+    except Exception:
+        return False
+
+
+def to_float32(outputs):
+    """bf16 출력 텐서를 float32로 되돌림 (dict/list/tuple 재귀)"""
+    if torch.is_tensor(outputs):
+        return outputs.float() if outputs.dtype == torch.bfloat16 else outputs
+    if isinstance(outputs, dict):
+        return {key: to_float32(value) for key, value in outputs.items()}
+    if isinstance(outputs, (list, tuple)):
+        return type(outputs)(to_float32(value) for value in outputs)
+    return outputs
+
+
+def enable_bf16_autocast(model, method_name='inference'):
+    """모델의 추론 메서드를 bf16 autocast 안에서 실행하도록 감쌈
+
+    가중치는 float32로 유지되고 합성곱/행렬곱만 bf16으로 계산되며,
+    출력은 float32로 되돌려 Synthesizer 후처리가 그대로 동작합니다.
+    """
+    method = getattr(model, method_name)
+
+    @functools.wraps(method)
+    def autocast_method(*args, **kwargs):
+        with torch.autocast('cpu', dtype=torch.bfloat16):
+            outputs = method(*args, **kwargs)
+        return to_float32(outputs)
+
+    # 인스턴스 속성으로 지정하여 클래스 메서드를 가림
+    model.__dict__[method_name] = autocast_method
+    return model
+
+
+def checkpoint_signature(checkpoint_path):
+    """원본 체크포인트가 바뀌었는지 확인하기 위한 (크기, 수정 시각)"""
+    stat = os.stat(checkpoint_path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def quantization_config():
+    """양자화 방식 (저장한 state_dict를 다시 적용할 수 있는지 확인하는 기준)"""
+    return {
+        'mode': 'int8',
+        'pointwise_convs': True,
+        'layers': sorted(layer.__name__ for layer in DYNAMIC_QUANTIZED_LAYERS),
+        'dtype': str(torch.qint8),
+        'torch': str(torch.__version__),
+    }
+
+
+def quantized_artifact_path(checkpoint_path, cache_dir=None):
+    """양자화 결과 저장 위치 (모델 폴더에는 쓰지 않고 사용자 캐시 폴더에만 저장)"""
+    digest = hashlib.sha256(os.path.abspath(checkpoint_path).encode('utf-8')).hexdigest()[:16]
+    filename = f"{digest}-{os.path.basename(checkpoint_path)}{QUANTIZED_SUFFIX}"
+    return os.path.join(cache_dir or DEFAULT_CACHE_DIR, "quantized", filename)
+
+
+def _torch_load(path):
+    try:
+        return torch.load(path, map_location='cpu', weights_only=True)
+    except TypeError:  # weights_only 인자가 없는 이전 torch
+        return torch.load(path, map_location='cpu')
+
+
+def load_quantization_record(checkpoint_path, cache_dir=None):
+    """저장된 양자화 기록 (없거나 원본 체크포인트/양자화 방식이 바뀌었으면 None)
+
+    기록은 {'state_dict': 양자화 state_dict} 또는 검증에 실패한 경우 {'parity_error': 멜 차이} 입니다.
+    모듈 객체가 아닌 텐서만 저장하므로 weights_only로 안전하게 로드합니다.
+    """
+    path = quantized_artifact_path(checkpoint_path, cache_dir)
+    if not os.path.exists(path):
+        return None
+    try:
+        record = _torch_load(path)
+        if record.get('source') != checkpoint_signature(checkpoint_path) or \
+                record.get('config') != quantization_config():
+            return None  # 원본 체크포인트, 양자화 방식이나 torch 버전이 바뀌면 다시 양자화
+        return record
+    except Exception as e:
+        print(f"      ⚠️ 양자화 기록 로드 실패: {os.path.basename(path)} ({e})")
+        return None
+
+
+def save_quantization_record(checkpoint_path, cache_dir=None, state_dict=None, parity_error=None):
+    """양자화 state_dict 또는 검증 실패 기록 저장 (임시 파일 후 교체) 후 저장 경로 반환"""
+    record = {
+        'source': checkpoint_signature(checkpoint_path),
+        'config': quantization_config(),
+        'state_dict': state_dict,
+        'parity_error': parity_error,
+    }
+    path = quantized_artifact_path(checkpoint_path, cache_dir)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        torch.save(record, temp_path)
+        os.replace(temp_path, path)
+        return path
+    except Exception as e:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        print(f"      ⚠️ 양자화 기록 저장 실패: {e}")
+        return None
+
+
+def mel_parity_error(reference, mel):
+    """[프레임, 채널] 멜 두 개의 평균 절대 차이 (길이 비율이 허용 범위를 벗어나면 inf)"""
+    frames = min(len(reference), len(mel))
+    if frames == 0 or abs(len(mel) / len(reference) - 1) > INT8_LENGTH_TOLERANCE:
+        return float('inf')
+    return float(np.mean(np.abs(reference[:frames] - mel[:frames])))
+
+
+def make_parity_probes(synthesizer, text=PARITY_TEXT):
+    """{'glowtts': 함수, 'hifigan': 함수} - 모델을 받아 같은 입력에 대한 [프레임, 채널] 멜 반환
+
+    Glow-TTS는 잡음을 샘플링하므로 매번 같은 시드로 고정하고, 보코더 입력은 fp32 Glow-TTS 출력을 사용합니다.
+    """
+    runner = BatchSynthesizer(synthesizer)
+    ids = torch.from_numpy(runner.text_to_ids(text))[None]
+    lengths = torch.tensor([ids.shape[1]], dtype=torch.long)
+
+    @torch.no_grad()
+    def glowtts_probe(model):
+        runner.tts_model = model
+        torch.manual_seed(0)
+        return runner.run_glowtts(ids, lengths)['model_outputs'][0].cpu().numpy()
+
+    fp32_tts_model = synthesizer.tts_model  # Glow-TTS를 먼저 교체해도 보코더 입력은 fp32 출력 사용
+    vocoder_input = []
+    ap = getattr(synthesizer, 'vocoder_ap', None) or synthesizer.ap
+
+    @torch.no_grad()
+    def vocoder_probe(model):
+        if not vocoder_input:
+            vocoder_input.append(torch.from_numpy(glowtts_probe(fp32_tts_model).T[None].copy()))
+        wav = model.inference(vocoder_input[0]).reshape(-1).cpu().numpy()
+        if hasattr(ap, 'melspectrogram'):
+            return ap.melspectrogram(wav.astype(np.float32)).T
+        return wav[:, None]
+
+    return {'glowtts': glowtts_probe, 'hifigan': vocoder_probe}
+
+
+def optimize_model(model, mode, checkpoint_path=None, cache_dir=None, probe=None,
+                   tolerance=INT8_MEL_TOLERANCE):
+    """모델 하나에 추론 모드 적용 후 사용할 모델 반환
+
+    int8은 복사본을 양자화하고, probe가 있으면 fp32와의 멜 차이가 tolerance 이하일 때만 양자화 모델을 반환합니다.
+    검증 결과는 사용자 캐시 폴더에 기록하여, 다음 실행에서는 통과한 state_dict를 바로 적용하고
+    실패한 모델은 다시 양자화/검증하지 않습니다.
+    """
+    if mode == 'int8':
+        if not has_quantizable_layers(model):
+            return model
+
+        record = load_quantization_record(checkpoint_path, cache_dir) if checkpoint_path else None
+        if record is not None and record['parity_error'] is not None and record['parity_error'] > tolerance:
+            print(f"   ⚠️ 이전 실행에서 int8 검증에 실패하여 fp32를 유지합니다 "
+                  f"(멜 차이 {record['parity_error']:.4f} > {tolerance})")
+            return model
+
+        refresh_weight_norm(model)
+        quantized = quantize_int8(copy.deepcopy(model))
+
+        if record is not None and record['state_dict'] is not None:
+            # 같은 구조로 양자화한 뒤 저장한 가중치를 적용 (검증 생략)
+            try:
+                quantized.load_state_dict(record['state_dict'])
+                return quantized.eval()
+            except Exception as e:
+                print(f"      ⚠️ 저장한 양자화 가중치 적용 실패, 다시 검증합니다: {e}")
+                quantized = quantize_int8(copy.deepcopy(model))
+
+        if probe is not None:
+            error = mel_parity_error(probe(model), probe(quantized))
+            if error > tolerance:
+                print(f"   ⚠️ int8 출력이 fp32와 너무 달라 fp32를 유지합니다 (멜 차이 {error:.4f} > {tolerance})")
+                if checkpoint_path:
+                    save_quantization_record(checkpoint_path, cache_dir, parity_error=error)
+                return model
+
+        if checkpoint_path:
+            save_quantization_record(checkpoint_path, cache_dir, state_dict=quantized.state_dict())
+        return quantized
+    elif mode == 'bf16':
+        enable_bf16_autocast(model)
+    return model
+
+
+def optimize_synthesizer(synthesizer, mode, checkpoint_paths=None, cache_dir=None):
+    """Synthesizer의 Glow-TTS와 HiFi-GAN에 추론 모드를 적용하고 실제 적용된 모드 반환
+
+    checkpoint_paths: {'glowtts': 경로, 'hifigan': 경로} (양자화 기록이 원본과 같은지 확인하는 기준)
+    int8 검증을 통과한 모델이 하나도 없으면 'fp32'를 반환합니다.
+    """
+    if mode not in INFERENCE_MODES:
+        raise ValueError(f"지원하지 않는 추론 모드: {mode} (가능: {', '.join(INFERENCE_MODES)})")
+
+    if mode == 'bf16' and not bf16_supported():
+        print("   ⚠️ 이 CPU는 bf16을 지원하지 않아 fp32로 실행합니다.")
+        return 'fp32'
+
+    if mode == 'fp32':
+        return mode
+
+    checkpoint_paths = checkpoint_paths or {}
+    probes = make_parity_probes(synthesizer) if mode == 'int8' else {}
+    quantized_count = 0
+    for model_type, attribute in (('glowtts', 'tts_model'), ('hifigan', 'vocoder_model')):
+        model = getattr(synthesizer, attribute)
+        if model is None:
+            continue
+        optimized = optimize_model(model, mode, checkpoint_paths.get(model_type), cache_dir,
+                                   probes.get(model_type))
+        setattr(synthesizer, attribute, optimized)
+        if mode == 'int8':
+            layers = count_quantized_layers(optimized)
+            quantized_count += layers
+            print(f"   ⚡ {model_type} int8 양자화: {layers}개 레이어")
+        else:
+            print(f"   ⚡ {model_type} bf16 autocast 적용")
+
+    if mode == 'int8' and not quantized_count:
+        return 'fp32'
+    return mode
+
+
+def model_size_bytes(model):
+    """직렬화한 state_dict 크기 (양자화 packed 가중치 포함)"""
+    if model is None:
+        return 0
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.tell()
+
+
+def log_mel_distance(reference, wav, ap):
+    """두 파형의 멜 스펙트로그램 평균 절대 차이 (짧은 쪽 길이 기준)"""
+    ref_mel = ap.melspectrogram(np.asarray(reference, dtype=np.float32))
+    mel = ap.melspectrogram(np.asarray(wav, dtype=np.float32))
+    frames = min(ref_mel.shape[1], mel.shape[1])
+    return float(np.mean(np.abs(ref_mel[:, :frames] - mel[:, :frames])))
+
+
+def signal_to_noise_db(reference, wav):
+    """fp32 파형 대비 SNR (짧은 쪽 길이 기준)"""
+    length = min(len(reference), len(wav))
+    reference = np.asarray(reference[:length], dtype=np.float64)
+    noise = reference - np.asarray(wav[:length], dtype=np.float64)
+    return float(10 * np.log10((np.sum(reference ** 2) + 1e-12) / (np.sum(noise ** 2) + 1e-12)))
+
+
+def benchmark_inference_modes(data_path, texts, modes=INFERENCE_MODES, seed=0):
+    """추론 모드별 실시간 계수(RTF), 모델 크기, fp32 대비 품질 비교
+
+    Glow-TTS는 잡음을 샘플링하므로 문장마다 같은 시드로 고정해 비교합니다.
+    """
+    from tts_model_loader import TTSModelLoader
+
+    results = {}
+    reference_wavs = None
+
+    for mode in modes:
+        loader = TTSModelLoader(data_path, use_cache=False, inference_mode=mode)
+        if not loader.load_models():
+            print(f"⚠️ {mode} 모드 모델 로드 실패")
+            continue
+
+        synthesizer = loader.synthesizer
+        normalized_texts = [loader.normalize_text(text) for text in texts]
+        synthesizer.tts(normalized_texts[0], None, None)  # 워밍업
+
+        wavs = []
+        elapsed = 0.0
+        for text in normalized_texts:
+            torch.manual_seed(seed)
+            start = time.perf_counter()
+            wav = synthesizer.tts(text, None, None)
+            elapsed += time.perf_counter() - start
+            wavs.append(np.asarray(wav, dtype=np.float32))
+
+        audio_seconds = sum(len(wav) for wav in wavs) / synthesizer.output_sample_rate
+        result = {
+            'active_mode': loader.active_inference_mode,
+            'rtf': elapsed / audio_seconds,
+            'model_bytes': (model_size_bytes(synthesizer.tts_model) +
+                            model_size_bytes(synthesizer.vocoder_model)),
+        }
+
+        if reference_wavs is None:
+            reference_wavs = wavs  # 첫 모드(fp32)를 기준으로 사용
+        result['mel_l1'] = float(np.mean([log_mel_distance(ref, wav, synthesizer.ap)
+                                          for ref, wav in zip(reference_wavs, wavs)]))
+        result['snr_db'] = float(np.mean([signal_to_noise_db(ref, wav)
+                                          for ref, wav in zip(reference_wavs, wavs)]))
+        result['length_ratio'] = (sum(len(wav) for wav in wavs) /
+                                  sum(len(ref) for ref in reference_wavs))
+        results[mode] = result
+
+    print(f"📊 추론 모드 벤치마크 (기준: {modes[0]})")
+    for mode, result in results.items():
+        print(f"   {mode:>4} ({result['active_mode']}): RTF {result['rtf']:.3f}, "
+              f"모델 {result['model_bytes'] / 1024 / 1024:.1f}MB, "
+              f"멜 L1 {result['mel_l1']:.4f}, SNR {result['snr_db']:.1f}dB, "
+              f"길이비 {result['length_ratio']:.3f}")
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    benchmark_inference_modes(sys.argv[1] if len(sys.argv) > 1 else "data", [
+        "안녕하세요.",
+        "오늘 날씨가 정말 좋네요.",
+        "간장 공장 공장장은 강 공장장이고 된장 공장 공장장은 공 공장장이다.",
+        "저는 음성 합성 시스템입니다.",
+        "경찰청 철창살은 외철창살이냐 쌍철창살이냐.",
+    ])
@@ -0,0 +1,214 @@
+"""
+모델 레지스트리 모듈 (프로세스 전역 체크포인트 캐시)
+"""
+import os
+import sys
+import time
+import threading
+from contextlib import contextmanager
+
+import torch
+
+
+def checkpoint_size_bytes(obj):
+    """체크포인트 안의 텐서 메모리 크기 합계"""
+    if torch.is_tensor(obj):
+        return obj.element_size() * obj.nelement()
+    if isinstance(obj, dict):
+        return sum(checkpoint_size_bytes(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sum(checkpoint_size_bytes(value) for value in obj)
+    return 0
+
+
+# Synthesizer가 체크포인트를 읽는 TTS 모듈 (shared_torch_load 전에 미리 import해 참조를 바꿈)
+TTS_CHECKPOINT_MODULES = ('TTS.utils.io', 'TTS.utils.synthesizer', 'TTS.tts.models.glow_tts',
+                          'TTS.vocoder.models.gan', 'TTS.vocoder.models.hifigan_generator')
+
+# TTS 모듈 참조 교체/복원 직렬화 (레지스트리 인스턴스와 무관하게 프로세스 전역)
+_patch_lock = threading.Lock()
+
+
+def _checkpoint_path(f):
+    """torch.load / load_fsspec 인자에서 파일 경로 추출 (경로, 파일 객체, fsspec OpenFile)"""
+    if isinstance(f, (str, os.PathLike)):
+        return os.fspath(f)
+    for attribute in ('name', 'path'):
+        value = getattr(f, attribute, None)
+        if isinstance(value, str) and os.path.exists(value):
+            return value
+    return None
+
+
+class _TorchWithLoad:
+    """load만 바꾸고 나머지 속성은 torch 모듈로 넘기는 대리 객체 (TTS 모듈의 torch 참조 교체용)"""
+
+    def __init__(self, load):
+        self.load = load
+
+    def __getattr__(self, name):
+        return getattr(torch, name)
+
+
+class ModelRegistry:
+    """체크포인트를 프로세스당 한 번만 로드하고 공유하는 레지스트리"""
+
+    def __init__(self):
+        self._entries = {}
+        self._loading = {}
+        self._lock = threading.Lock()
+        self.shared_hits = 0
+        self.shared_misses = 0
+
+    @staticmethod
+    def _key(path):
+        return os.path.abspath(path)
+
+    def load(self, path):
+        """체크포인트 로드 (이미 로드됐거나 로드 중이면 그 결과를 공유)"""
+        key = self._key(path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry['checkpoint'] is not None:
+                return entry['checkpoint']
+
+            event = self._loading.get(key)
+            owner = event is None
+            if owner:
+                event = threading.Event()
+                self._loading[key] = event
+
+        if not owner:
+            # 다른 스레드(백그라운드 preload)가 로드 중이면 완료될 때까지 대기
+            event.wait()
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is None or entry['checkpoint'] is None:
+                raise RuntimeError(f"체크포인트 로드 실패: {path}")
+            return entry['checkpoint']
+
+        try:
+            start = time.perf_counter()
+            checkpoint = torch.load(path, map_location='cpu')
+            load_time = time.perf_counter() - start
+
+            with self._lock:
+                self._entries[key] = {
+                    'checkpoint': checkpoint,
+                    'load_time': load_time,
+                    'size_bytes': checkpoint_size_bytes(checkpoint),
+                    'file_bytes': os.path.getsize(path),
+                }
+            return checkpoint
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+            event.set()
+
+    def preload(self, paths, background=True):
+        """체크포인트 미리 로드 (기본은 백그라운드 스레드)"""
+        paths = [path for path in paths if path]
+
+        def run():
+            for path in paths:
+                try:
+                    self.load(path)
+                except Exception as e:
+                    print(f"⚠️ 체크포인트 미리 로드 실패: {os.path.basename(path)} ({e})")
+
+        if not background:
+            run()
+            return None
+
+        thread = threading.Thread(target=run, name="model-preload", daemon=True)
+        thread.start()
+        return thread
+
+    def is_loaded(self, path):
+        with self._lock:
+            return self._key(path) in self._entries
+
+    def release(self, path):
+        """로드된 체크포인트 해제 (모델 생성 후 원본 가중치가 필요 없을 때)"""
+        with self._lock:
+            entry = self._entries.get(self._key(path))
+            if entry is not None:
+                entry['checkpoint'] = None
+
+    @contextmanager
+    def shared_torch_load(self):
+        """블록 안에서 TTS 모델 코드의 체크포인트 로드가 이미 로드된 체크포인트를 재사용하도록 연결
+
+        TTS Synthesizer는 체크포인트 경로만 받아 내부에서 다시 torch.load(또는 load_fsspec) 하므로,
+        레지스트리에 있는 경로면 디스크를 다시 읽지 않고 같은 객체를 돌려줍니다.
+        전역 torch.load는 바꾸지 않고 TTS 모듈 안의 참조(load_fsspec, torch)만 바꾸므로
+        다른 스레드의 torch.load에는 영향이 없으며, 바꾸고 되돌리는 동안은 잠금으로 직렬화합니다.
+        """
+        import importlib
+
+        for name in TTS_CHECKPOINT_MODULES:
+            try:
+                importlib.import_module(name)
+            except Exception:
+                pass  # TTS 버전에 따라 없는 모듈
+
+        with _patch_lock:
+            patched = []
+            torch_proxy = _TorchWithLoad(self._shared_loader(torch.load))
+            for name, module in list(sys.modules.items()):
+                if module is None or not (name == 'TTS' or name.startswith('TTS.')):
+                    continue
+                namespace = vars(module)
+                if namespace.get('torch') is torch:
+                    patched.append((namespace, 'torch', torch))
+                    namespace['torch'] = torch_proxy
+                original = namespace.get('load_fsspec')
+                if callable(original):
+                    patched.append((namespace, 'load_fsspec', original))
+                    namespace['load_fsspec'] = self._shared_loader(original)
+            try:
+                yield self
+            finally:
+                for namespace, attribute, original in reversed(patched):
+                    namespace[attribute] = original
+
+    def _shared_loader(self, original_load):
+        """레지스트리에 있는 체크포인트면 그 객체를, 아니면 original_load 결과를 돌려주는 로더"""
+
+        def shared_load(f, *args, **kwargs):
+            path = _checkpoint_path(f)
+            if path is not None:
+                with self._lock:
+                    entry = self._entries.get(self._key(path))
+                    if entry is not None and entry['checkpoint'] is not None:
+                        self.shared_hits += 1
+                        return entry['checkpoint']
+                    self.shared_misses += 1
+            return original_load(f, *args, **kwargs)
+
+        return shared_load
+
+    def report(self):
+        """모델별 로드 시간과 메모리 크기 반환"""
+        with self._lock:
+            return {
+                path: {
+                    'load_time': entry['load_time'],
+                    'size_bytes': entry['size_bytes'],
+                    'file_bytes': entry['file_bytes'],
+                    'resident': entry['checkpoint'] is not None,
+                }
+                for path, entry in self._entries.items()
+            }
+
+    def print_report(self):
+        for path, info in self.report().items():
+            print(f"   📦 {os.path.basename(path)}: 로드 {info['load_time']:.2f}초, "
+                  f"텐서 {info['size_bytes'] / 1024 / 1024:.1f}MB")
+        if self.shared_misses:
+            print(f"   ⚠️ 레지스트리에 없는 체크포인트를 다시 읽은 횟수: {self.shared_misses}")
+
+
+# 프로세스 전역 레지스트리
+model_registry = ModelRegistry()
@@ -2,12 +2,27 @@
 영어를 한글 발음으로 변환하는 개선된 모듈
 """
 import re
+from types import MappingProxyType
+from collections import OrderedDict
+
+# convert_text 토큰화 패턴
+SENTENCE_SPLIT_PATTERN = re.compile(r'([.!?]+)')
+PUNCTUATION_ONLY_PATTERN = re.compile(r'^[.!?]+$')
+WORD_PATTERN = re.compile(r'\b\w+\b|[^\w\s]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+CONTRACTION_CANDIDATE_PATTERN = re.compile(r"\b\w+'\w+\b")
+
+# 프로세스 풀 일괄 변환 워커가 사용할 변환기 (워커 초기화 시 전달)
+_batch_converter = None
 
 
 class EnglishToKoreanPronunciation:
     """영어를 한글 발음으로 변환하는 클래스 (개선된 버전)"""
 
-    def __init__(self):
+    def __init__(self, word_cache_size=4096, lexicon_path=None):
+        """word_cache_size: 단어별 변환 결과 LRU 캐시 크기 (0이면 사용하지 않음)
+        lexicon_path: compiled_lexicon.py로 만든 컴파일된 사전 (word_dict에 없는 단어를 조회)
+        """
         # 확장된 영어 단어 -> 한글 발음 사전
         self.word_dict = {
             # 기본 인사말
@@ -213,42 +228,173 @@ class EnglishToKoreanPronunciation:
             't': 'ㅌ', 'v': 'ㅂ', 'w': 'ㅇ', 'x': 'ㅋㅅ', 'z': 'ㅈ'
         }
 
-    def advanced_phonetic_conversion(self, word):
-        """고급 음성학적 변환"""
-        word = word.lower().strip()
+        # 축약형 -> 한글 발음 (바꿀 때는 add_contraction 또는 contractions 대입으로 정규식도 갱신)
+        self._contractions = {
+            "i'm": "아이 앰", "you're": "유 아", "he's": "히 이즈", "she's": "쉬 이즈",
+            "it's": "잇 이즈", "we're": "위 아", "they're": "데이 아",
+            "isn't": "이즌트", "aren't": "아런트", "wasn't": "와즌트", "weren't": "워런트",
+            "don't": "돈트", "doesn't": "더즌트", "didn't": "디든트",
+            "won't": "원트", "wouldn't": "우든트", "can't": "캔트", "couldn't": "쿠든트",
+            "shouldn't": "슈든트", "mustn't": "머슨트",
+            "i'll": "아일", "you'll": "율", "he'll": "힐", "she'll": "쉴",
+            "we'll": "윌", "they'll": "데일",
+            "i've": "아이브", "you've": "유브", "we've": "위브", "they've": "데이브",
+            "i'd": "아이드", "you'd": "유드", "he'd": "히드", "she'd": "쉬드",
+            "we'd": "위드", "they'd": "데이드",
+        }
 
-        # 사전에 있는 단어는 바로 반환
-        if word in self.word_dict:
-            return self.word_dict[word]
+        # 컴파일된 외부 사전 (mmap, 필요할 때만 조회)
+        self.lexicon = None
+
+        # 유사 단어 검색 색인 (처음 사용할 때 생성, 단어 추가 시 갱신)
+        self.fuzzy_index = None
+
+        # 단어별 변환 결과 캐시 (사전/규칙이 바뀌면 비움)
+        self.word_cache_size = word_cache_size
+        self.word_cache = OrderedDict()
+        self.word_cache_hits = 0
+        self.word_cache_misses = 0
+        self.dictionary_version = 0
+
+        # 음성학적 규칙을 최장 일치 트라이로 컴파일
+        self.compile_phonetic_rules()
+
+        # 축약형을 하나의 정규식으로 컴파일
+        self.compile_contractions()
 
-        result = word
+        if lexicon_path:
+            self.load_lexicon(lexicon_path)
 
-        # 1단계: 복합 패턴 적용
+    def compile_phonetic_rules(self):
+        """phonetic_rules를 최장 일치 트라이로 컴파일 (phonetic_rules를 바꾼 뒤에는 다시 호출)
+
+        각 노드는 다음 문자 → 자식 노드 dict이며, 패턴이 끝나는 노드는 '' 키에 치환 결과를 가집니다.
+        같은 패턴이 여러 번 있으면 목록에서 앞선 규칙을 사용합니다.
+        """
+        trie = {}
         for pattern, replacement in self.phonetic_rules:
-            result = result.replace(pattern, replacement)
+            node = trie
+            for char in pattern:
+                node = node.setdefault(char, {})
+            node.setdefault('', replacement)
+        self.rule_trie = trie
+        self.invalidate_word_cache()
+
+    def invalidate_word_cache(self):
+        """단어 변환 캐시 비우기 (word_dict나 phonetic_rules를 직접 수정한 뒤에도 호출)"""
+        self.word_cache.clear()
+        self.dictionary_version += 1
+
+    def lookup_word(self, word):
+        """사전 발음 조회 (word_dict 우선, 없으면 컴파일된 사전, 둘 다 없으면 None)"""
+        pronunciation = self.word_dict.get(word)
+        if pronunciation is None and self.lexicon is not None:
+            pronunciation = self.lexicon.get(word)
+        return pronunciation
+
+    def load_lexicon(self, path):
+        """컴파일된 사전 연결 (word_dict로 읽어 들이지 않고 mmap으로 조회)"""
+        try:
+            from compiled_lexicon import CompiledLexicon
+            lexicon = CompiledLexicon(path)
+        except (OSError, ValueError) as e:
+            print(f"❌ 컴파일된 사전 로드 실패: {e}")
+            return False
+
+        if self.lexicon is not None:
+            self.lexicon.close()
+        self.lexicon = lexicon
+        self.fuzzy_index = None
+        self.invalidate_word_cache()
+        print(f"✅ 컴파일된 사전 연결: {path} ({len(lexicon)}개 단어)")
+        return True
+
+    def get_fuzzy_index(self):
+        """word_dict (+ 컴파일된 사전) 단어의 유사 단어 검색 색인"""
+        if self.fuzzy_index is None:
+            from fuzzy_index import DeletionIndex
+            words = list(self.word_dict)
+            if self.lexicon is not None:
+                words.extend(self.lexicon.keys())
+            self.fuzzy_index = DeletionIndex(words)
+        return self.fuzzy_index
+
+    def find_similar_words(self, word, k=3, max_distance=2):
+        """편집 거리(삽입/삭제/치환/인접 교환)가 가까운 사전 단어 최대 k개 [(단어, 거리)]"""
+        return self.get_fuzzy_index().lookup(word.lower().strip(), k, max_distance)
+
+    def __getstate__(self):
+        # 프로세스 풀로 전달할 때 유사 단어 색인은 제외 (필요하면 받는 쪽에서 다시 생성)
+        state = self.__dict__.copy()
+        state['fuzzy_index'] = None
+        return state
+
+    def get_word_cache_stats(self):
+        """단어 변환 캐시 통계 반환"""
+        total = self.word_cache_hits + self.word_cache_misses
+        return {
+            'entries': len(self.word_cache),
+            'hits': self.word_cache_hits,
+            'misses': self.word_cache_misses,
+            'hit_rate': self.word_cache_hits / total if total else 0.0,
+            'dictionary_version': self.dictionary_version,
+        }
+
+    def match_phonetic_rule(self, word, start):
+        """start 위치에서 가장 긴 규칙 패턴 일치 → (패턴 끝 위치, 치환 결과), 없으면 None"""
+        node = self.rule_trie
+        match = None
+        for i in range(start, len(word)):
+            node = node.get(word[i])
+            if node is None:
+                break
+            if '' in node:
+                match = (i + 1, node[''])
+        return match
 
-        # 2단계: 남은 문자들을 개별 변환
-        final_result = ""
+    def advanced_phonetic_conversion(self, word):
+        """고급 음성학적 변환
+
+        왼쪽부터 한 번만 훑으며 각 위치에서 가장 긴 규칙 패턴을 치환하고(예: 'ing'가 'ng'보다 우선),
+        규칙이 없는 문자는 개별 문자 매핑으로 변환합니다.
+        """
+        word = word.lower().strip()
+
+        # 사전에 있는 단어는 바로 반환
+        pronunciation = self.lookup_word(word)
+        if pronunciation is not None:
+            return pronunciation
+
+        final_result = []
         i = 0
-        while i < len(result):
-            char = result[i]
-
-            # 한글이 이미 있으면 그대로 유지
-            if ord(char) >= 0xAC00 and ord(char) <= 0xD7A3:  # 한글 완성형 범위
-                final_result += char
-            elif char in 'ㄱㄴㄷㄹㅁㅂㅅㅇㅈㅊㅋㅌㅍㅎㅏㅑㅓㅕㅗㅛㅜㅠㅡㅣ':  # 한글 자모
-                final_result += char
-            elif char in self.single_char_map:
-                final_result += self.single_char_map[char]
-            elif char in ' .,!?;:-_()[]{}"\'/\\':
-                final_result += char
-            else:
-                # 알 수 없는 문자는 음성학적으로 추정
-                final_result += self.guess_pronunciation(char)
+        while i < len(word):
+            # 1단계: 복합 패턴 (최장 일치)
+            match = self.match_phonetic_rule(word, i)
+            if match is not None:
+                i, replacement = match
+                final_result.append(replacement)
+                continue
 
+            # 2단계: 남은 문자 개별 변환
+            final_result.append(self.convert_char(word[i]))
             i += 1
 
-        return final_result
+        return ''.join(final_result)
+
+    def convert_char(self, char):
+        """규칙 패턴에 걸리지 않은 문자 하나 변환"""
+        # 한글이 이미 있으면 그대로 유지
+        if ord(char) >= 0xAC00 and ord(char) <= 0xD7A3:  # 한글 완성형 범위
+            return char
+        elif char in 'ㄱㄴㄷㄹㅁㅂㅅㅇㅈㅊㅋㅌㅍㅎㅏㅑㅓㅕㅗㅛㅜㅠㅡㅣ':  # 한글 자모
+            return char
+        elif char in self.single_char_map:
+            return self.single_char_map[char]
+        elif char in ' .,!?;:-_()[]{}"\'/\\':
+            return char
+        else:
+            # 알 수 없는 문자는 음성학적으로 추정
+            return self.guess_pronunciation(char)
 
     def guess_pronunciation(self, char):
         """알 수 없는 문자의 발음 추정"""
@@ -269,102 +415,303 @@ class EnglishToKoreanPronunciation:
         return self.single_char_map.get(char, char)
 
     def handle_contractions(self, text):
-        """축약형 처리"""
-        contractions = {
-            "i'm": "아이 앰", "you're": "유 아", "he's": "히 이즈", "she's": "쉬 이즈",
-            "it's": "잇 이즈", "we're": "위 아", "they're": "데이 아",
-            "isn't": "이즌트", "aren't": "아런트", "wasn't": "와즌트", "weren't": "워런트",
-            "don't": "돈트", "doesn't": "더즌트", "didn't": "디든트",
-            "won't": "원트", "wouldn't": "우든트", "can't": "캔트", "couldn't": "쿠든트",
-            "shouldn't": "슈든트", "mustn't": "머슨트",
-            "i'll": "아일", "you'll": "율", "he'll": "힐", "she'll": "쉴",
-            "we'll": "윌", "they'll": "데일",
-            "i've": "아이브", "you've": "유브", "we've": "위브", "they've": "데이브",
-            "i'd": "아이드", "you'd": "유드", "he'd": "히드", "she'd": "쉬드",
-            "we'd": "위드", "they'd": "데이드",
-        }
-
-        # 축약형을 공백으로 분리해서 처리
-        for contraction, expanded in contractions.items():
-            text = re.sub(r'\b' + contraction + r'\b', expanded, text, flags=re.IGNORECASE)
-
-        return text
+        """축약형 처리 (모든 축약형을 한 번의 정규식 검색으로 치환)"""
+        return self.contraction_pattern.sub(self._expand_contraction, text)
+
+    def _expand_contraction(self, match):
+        word = match.group(0)
+        return self._contractions.get(word.lower(), word)
+
+    @property
+    def contractions(self):
+        """축약형 사전 (읽기 전용, 직접 수정하면 치환 정규식과 어긋나므로 add_contraction 사용)"""
+        return MappingProxyType(self._contractions)
+
+    @contractions.setter
+    def contractions(self, contractions):
+        self._contractions = {contraction.lower(): expanded for contraction, expanded in contractions.items()}
+        self.compile_contractions()
+
+    def compile_contractions(self):
+        """축약형 치환 정규식 컴파일
+
+        모든 축약형이 '단어'단어' 형태이면 그 형태의 후보만 찾아 사전에서 조회하고
+        (대안 수와 무관하게 빠름), 아니면 축약형 전체를 하나의 정규식 대안(alternation)으로 만듭니다.
+        """
+        if all(CONTRACTION_CANDIDATE_PATTERN.fullmatch(contraction) for contraction in self._contractions):
+            self.contraction_pattern = CONTRACTION_CANDIDATE_PATTERN
+            return
+
+        # 긴 축약형을 먼저 두어 접두사가 같은 축약형보다 우선 일치
+        # ('cause처럼 문장부호로 시작/끝나는 축약형도 찾도록 \b 대신 앞뒤 단어 문자 여부로 경계 판정)
+        alternatives = sorted(self._contractions, key=len, reverse=True)
+        self.contraction_pattern = re.compile(
+            r'(?<!\w)(?:' + '|'.join(re.escape(contraction) for contraction in alternatives) + r')(?!\w)',
+            re.IGNORECASE)
+
+    def add_contraction(self, contraction, expanded):
+        """사용자 정의 축약형 추가"""
+        self._contractions[contraction.lower()] = expanded
+        self.compile_contractions()
 
     def handle_special_endings(self, word):
         """특수 어미 처리"""
         # -s 복수형 처리
         if word.endswith('s') and len(word) > 1:
             base_word = word[:-1]
-            if base_word in self.word_dict:
-                return self.word_dict[base_word] + '스'
+            base_pronunciation = self.lookup_word(base_word)
+            if base_pronunciation is not None:
+                return base_pronunciation + '스'
 
         # -ed 과거형 처리
         if word.endswith('ed') and len(word) > 2:
             base_word = word[:-2]
-            if base_word in self.word_dict:
-                return self.word_dict[base_word] + '드'
+            base_pronunciation = self.lookup_word(base_word)
+            if base_pronunciation is not None:
+                return base_pronunciation + '드'
 
         # -ing 진행형 처리
         if word.endswith('ing') and len(word) > 3:
             base_word = word[:-3]
-            if base_word in self.word_dict:
-                return self.word_dict[base_word] + '잉'
+            base_pronunciation = self.lookup_word(base_word)
+            if base_pronunciation is not None:
+                return base_pronunciation + '잉'
 
         # -ly 부사 처리
         if word.endswith('ly') and len(word) > 2:
             base_word = word[:-2]
-            if base_word in self.word_dict:
-                return self.word_dict[base_word] + '리'
+            base_pronunciation = self.lookup_word(base_word)
+            if base_pronunciation is not None:
+                return base_pronunciation + '리'
 
         return None
 
+    def convert_word(self, word):
+        """소문자 영어 단어 하나를 변환 (특수 어미 → 일반 변환, 결과는 LRU 캐시)"""
+        converted = self.word_cache.get(word)
+        if converted is not None:
+            self.word_cache.move_to_end(word)
+            self.word_cache_hits += 1
+            return converted
+
+        self.word_cache_misses += 1
+        converted = self._convert_word_uncached(word)
+        self._remember_word(word, converted)
+        return converted
+
+    def _remember_word(self, word, converted):
+        """변환 결과를 단어 캐시에 저장 (word_cache_size를 넘으면 가장 오래된 항목부터 제거)"""
+        if not self.word_cache_size:
+            return
+        self.word_cache[word] = converted
+        self.word_cache.move_to_end(word)
+        while len(self.word_cache) > self.word_cache_size:
+            self.word_cache.popitem(last=False)
+
+    def _convert_word_uncached(self, word):
+        # 사전에 단어 자체가 있으면 어미 규칙보다 우선 (큰 사전에는 활용형도 들어 있음)
+        # 빈 문자열 발음(읽지 않는 단어)도 사전 결과이므로 None만 미등록으로 취급
+        pronunciation = self.lookup_word(word)
+        if pronunciation is None:
+            pronunciation = self.handle_special_endings(word)
+        if pronunciation is None:
+            pronunciation = self.advanced_phonetic_conversion(word)
+        return pronunciation
+
+    def tokenize_text(self, english_text):
+        """축약형 처리 후 조각 목록으로 분리
+
+        각 조각은 문장부호 문자열(그대로 출력) 또는 소문자 토큰 목록(단어/구두점/숫자)입니다.
+        """
+        # 1단계: 축약형 처리
+        text = self.handle_contractions(english_text)
+
+        # 2단계: 문장부호 보존을 위한 처리
+        segments = []
+        for sentence in SENTENCE_SPLIT_PATTERN.split(text):
+            if PUNCTUATION_ONLY_PATTERN.match(sentence):
+                segments.append(sentence)
+                continue
+
+            # 3단계: 단어 단위로 분리 (구두점 보존)
+            tokens = WORD_PATTERN.findall(sentence.lower())
+            if tokens:
+                segments.append(tokens)
+        return segments
+
+    def assemble_text(self, segments, convert_word):
+        """tokenize_text 조각을 변환하여 결과 문자열 조합 (구두점이나 숫자는 그대로 유지)"""
+        converted_sentences = []
+        for segment in segments:
+            if isinstance(segment, str):
+                converted_sentences.append(segment)
+            else:
+                converted_sentences.append(' '.join(convert_word(token) if token.isalpha() else token
+                                                    for token in segment))
+
+        # 후처리: 불필요한 공백 정리
+        return WHITESPACE_PATTERN.sub(' ', ''.join(converted_sentences)).strip()
+
     def convert_text(self, english_text):
         """영어 텍스트를 한글 발음으로 변환 (개선된 버전)"""
         if not english_text:
             return ""
 
-        # 1단계: 축약형 처리
-        text = self.handle_contractions(english_text)
+        # 4~5단계: 특수 어미 처리 또는 일반 변환 (단어 캐시 우선)
+        return self.assemble_text(self.tokenize_text(english_text), self.convert_word)
+
+    def trace_word(self, word):
+        """소문자 단어 하나의 변환 추적 → {'word', 'converted', 'source', 'rules', 'confidence'}
+
+        converted는 convert_word 결과(단어 캐시 공유)이고, rules는 단어에 들어 있는 규칙 패턴(겹치는 것 포함)입니다.
+        source: 'dictionary' (사전), 'rule' (규칙 패턴 포함), 'guess' (문자 단위 추측)
+        """
+        trace = self.classify_word(word)
+        trace['converted'] = self.convert_word(word)
+        return trace
+
+    def classify_word(self, word):
+        """변환하지 않고 단어의 발음 출처와 신뢰도만 계산 → {'word', 'source', 'rules', 'confidence'}"""
+        if self.lookup_word(word) is not None:
+            return {'word': word, 'source': 'dictionary', 'rules': [], 'confidence': 0.95}
+
+        rules = self.matched_rule_patterns(word)
+        if len(rules) >= 2:
+            confidence = 0.8  # 여러 규칙이 적용되면 높은 신뢰도
+        elif rules:
+            confidence = 0.6  # 하나의 규칙이 적용되면 중간 신뢰도
+        else:
+            confidence = 0.3  # 추측 기반 변환은 낮은 신뢰도
+        return {'word': word, 'source': 'rule' if rules else 'guess', 'rules': rules, 'confidence': confidence}
+
+    def matched_rule_patterns(self, word):
+        """단어에 들어 있는 음성학적 규칙 패턴 목록 (겹치는 것 포함, 처음 나온 순서)"""
+        rules = []
+        for start in range(len(word)):
+            node = self.rule_trie
+            for i in range(start, len(word)):
+                node = node.get(word[i])
+                if node is None:
+                    break
+                if '' in node and word[start:i + 1] not in rules:
+                    rules.append(word[start:i + 1])
+        return rules
+
+    def trace_contraction(self, contraction):
+        """축약형 추적 (사전 항목과 같은 신뢰도, 축약형이 아니면 None)"""
+        expanded = self._contractions.get(contraction)
+        if expanded is None:
+            return None
+        return {'word': contraction, 'converted': expanded, 'source': 'contraction',
+                'rules': [], 'confidence': 0.95}
+
+    def trace_text(self, english_text, traces=None):
+        """convert_text 결과와 단어별 추적 목록을 한 번의 순회로 계산
+
+        반환: {'original': 원문, 'converted': 변환 결과, 'words': [trace_word 결과]}
+        축약형은 확장 전 형태 하나를 사전 항목(source 'contraction')으로 기록하고,
+        숫자가 섞인 토큰은 변환하지 않고 그대로 두되 통계에는 포함합니다.
+        traces: 단어 → trace_word 결과 (여러 텍스트를 추적할 때 공유하면 고유 단어당 한 번만 계산)
+        """
+        if traces is None:
+            traces = {}
+        words = []
+        if not english_text:
+            return {'original': english_text, 'converted': "", 'words': words}
 
-        # 2단계: 문장부호 보존을 위한 처리
-        sentences = re.split(r'([.!?]+)', text)
         converted_sentences = []
-
-        for sentence in sentences:
-            if re.match(r'^[.!?]+$', sentence):
+        for sentence in SENTENCE_SPLIT_PATTERN.split(english_text):
+            if PUNCTUATION_ONLY_PATTERN.match(sentence):
                 converted_sentences.append(sentence)
                 continue
 
-            # 3단계: 단어 단위로 분리 (구두점 보존)
-            words = re.findall(r'\b\w+\b|[^\w\s]', sentence.lower())
-            converted_words = []
-
-            for word in words:
-                if not word.isalpha():
-                    # 구두점이나 숫자는 그대로 유지
-                    converted_words.append(word)
+            # 축약형 사이 구간만 단어 단위로 추적하고, 축약형은 확장 결과를 변환하여 출력
+            tokens = []
+            position = 0
+            for match in self.contraction_pattern.finditer(sentence):
+                trace = self.trace_contraction(match.group(0).lower())
+                if trace is None:
                     continue
+                tokens += self._trace_tokens(sentence[position:match.start()], words, traces)
+                # 확장 결과도 convert_text와 같이 단어마다 convert_word로 변환
+                expanded = [self.convert_word(token) if token.isalpha() else token
+                            for token in WORD_PATTERN.findall(trace['converted'].lower())]
+                trace['converted'] = ' '.join(expanded)
+                tokens += expanded
+                words.append(trace)
+                position = match.end()
+            tokens += self._trace_tokens(sentence[position:], words, traces)
+
+            if tokens:
+                converted_sentences.append(' '.join(tokens))
+
+        converted = WHITESPACE_PATTERN.sub(' ', ''.join(converted_sentences)).strip()
+        return {'original': english_text, 'converted': converted, 'words': words}
+
+    def _trace_tokens(self, text, words, traces):
+        """text를 토큰으로 나누어 단어 추적을 words에 추가하고 변환된 토큰 목록 반환"""
+        converted = []
+        for token in WORD_PATTERN.findall(text.lower()):
+            if not (token[0].isalnum() or token[0] == '_'):  # 구두점
+                converted.append(token)
+                continue
 
-                # 4단계: 특수 어미 처리 시도
-                special_result = self.handle_special_endings(word)
-                if special_result:
-                    converted_words.append(special_result)
-                    continue
+            trace = traces.get(token)
+            if trace is None:
+                trace = self.trace_word(token)
+                if not token.isalpha():
+                    trace['converted'] = token
+                traces[token] = trace
+            words.append(trace)
+            converted.append(trace['converted'])
+        return converted
+
+    def convert_batch(self, texts, processes=None, pool_min_words=5000):
+        """여러 영어 텍스트를 한 번에 변환하여 입력 순서대로 결과 목록 반환
+
+        모든 입력을 먼저 토큰화한 뒤 배치 전체의 고유 단어를 한 번씩만 변환하고 다시 조합합니다.
+        processes를 지정하고 새로 변환할 고유 단어가 pool_min_words개 이상이면 프로세스 풀로 나누어 변환합니다.
+        """
+        segments_list = [self.tokenize_text(text) if text else [] for text in texts]
+        unique_words = {token for segments in segments_list for segment in segments
+                        if not isinstance(segment, str) for token in segment if token.isalpha()}
+
+        converted = {}
+        pending = []
+        for word in unique_words:
+            cached = self.word_cache.get(word)
+            if cached is not None:
+                self.word_cache.move_to_end(word)
+                converted[word] = cached
+            else:
+                pending.append(word)
+        self.word_cache_hits += len(converted)
+        self.word_cache_misses += len(pending)
+
+        if processes and processes > 1 and len(pending) >= pool_min_words:
+            results = self._convert_words_parallel(pending, processes)
+        else:
+            results = {word: self._convert_word_uncached(word) for word in pending}
 
-                # 5단계: 일반 변환 처리
-                converted_word = self.advanced_phonetic_conversion(word)
-                converted_words.append(converted_word)
+        # 새로 변환한 단어는 convert_word와 같은 LRU 캐시에 저장
+        for word in pending:
+            self._remember_word(word, results[word])
+        converted.update(results)
 
-            if converted_words:
-                converted_sentences.append(' '.join(converted_words))
+        return [self.assemble_text(segments, converted.__getitem__) for segments in segments_list]
 
-        # 최종 결과 조합
-        result = ''.join(converted_sentences)
+    def _convert_words_parallel(self, words, processes):
+        """단어 목록을 프로세스 풀로 나누어 변환 → {단어: 발음}"""
+        from concurrent.futures import ProcessPoolExecutor
 
-        # 후처리: 불필요한 공백 정리
-        result = re.sub(r'\s+', ' ', result).strip()
+        chunk_size = max(1, -(-len(words) // (processes * 4)))
+        chunks = [words[i:i + chunk_size] for i in range(0, len(words), chunk_size)]
 
-        return result
+        converted = {}
+        with ProcessPoolExecutor(processes, initializer=_init_batch_worker, initargs=(self,)) as executor:
+            for chunk, results in zip(chunks, executor.map(_convert_words_chunk, chunks)):
+                converted.update(zip(chunk, results))
+        return converted
 
     def convert_with_context(self, english_text, context_type="general"):
         """문맥을 고려한 변환"""
@@ -382,45 +729,39 @@ class EnglishToKoreanPronunciation:
         return self.convert_text(english_text)
 
     def get_pronunciation_confidence(self, word):
-        """발음 변환 신뢰도 반환"""
+        """발음 변환 신뢰도 반환 (사전/축약형 0.95, 규칙 2개 이상 0.8, 1개 0.6, 추측 0.3)"""
         word = word.lower().strip()
-
-        if word in self.word_dict:
-            return 0.95  # 사전에 있는 단어는 높은 신뢰도
-
-        # 규칙 기반 패턴이 적용되는지 확인
-        rule_matches = sum(1 for pattern, _ in self.phonetic_rules if pattern in word)
-
-        if rule_matches >= 2:
-            return 0.8  # 여러 규칙이 적용되면 높은 신뢰도
-        elif rule_matches == 1:
-            return 0.6  # 하나의 규칙이 적용되면 중간 신뢰도
-        else:
-            return 0.3  # 추측 기반 변환은 낮은 신뢰도
+        trace = self.trace_contraction(word) or self.classify_word(word)
+        return trace['confidence']
 
     def batch_convert(self, word_list):
         """단어 목록 일괄 변환"""
         results = []
-        for word in word_list:
-            converted = self.convert_text(word)
-            confidence = self.get_pronunciation_confidence(word)
+        confidences = {}
+        for word, converted in zip(word_list, self.convert_batch(word_list)):
+            if word not in confidences:
+                confidences[word] = self.get_pronunciation_confidence(word)
             results.append({
                 'original': word,
                 'converted': converted,
-                'confidence': confidence
+                'confidence': confidences[word]
             })
         return results
 
     def add_custom_word(self, english_word, korean_pronunciation):
         """사용자 정의 단어 추가"""
         self.word_dict[english_word.lower()] = korean_pronunciation
+        if self.fuzzy_index is not None:
+            self.fuzzy_index.add(english_word.lower())
+        self.invalidate_word_cache()
         print(f"✅ 사용자 단어 추가: {english_word} -> {korean_pronunciation}")
 
     def get_word_variants(self, base_word):
         """단어의 변형들 생성"""
         variants = {}
-        base_pronunciation = self.word_dict.get(base_word.lower(),
-                                               self.advanced_phonetic_conversion(base_word))
+        base_pronunciation = self.lookup_word(base_word.lower())
+        if base_pronunciation is None:
+            base_pronunciation = self.advanced_phonetic_conversion(base_word)
 
         # 복수형
         variants[f"{base_word}s"] = f"{base_pronunciation}스"
@@ -447,7 +788,10 @@ class EnglishToKoreanPronunciation:
 
     def analyze_pronunciation_patterns(self, text):
         """발음 패턴 분석"""
-        words = re.findall(r'\b\w+\b', text.lower())
+        return self.summarize_trace(self.trace_text(text)['words'])
+
+    def summarize_trace(self, words):
+        """단어별 추적 목록 → 출처/신뢰도 통계 (축약형은 사전 매칭으로 집계)"""
         analysis = {
             'total_words': len(words),
             'dictionary_matches': 0,
@@ -456,16 +800,15 @@ class EnglishToKoreanPronunciation:
             'confidence_distribution': {'high': 0, 'medium': 0, 'low': 0}
         }
 
-        for word in words:
-            confidence = self.get_pronunciation_confidence(word)
-
-            if word in self.word_dict:
+        for trace in words:
+            if trace['source'] in ('dictionary', 'contraction'):
                 analysis['dictionary_matches'] += 1
-            elif any(pattern in word for pattern, _ in self.phonetic_rules):
+            elif trace['source'] == 'rule':
                 analysis['rule_based_conversions'] += 1
             else:
                 analysis['guessed_conversions'] += 1
 
+            confidence = trace['confidence']
             if confidence >= 0.8:
                 analysis['confidence_distribution']['high'] += 1
             elif confidence >= 0.5:
@@ -473,6 +816,9 @@ class EnglishToKoreanPronunciation:
             else:
                 analysis['confidence_distribution']['low'] += 1
 
+        # 전체 신뢰도: 사전 매칭 100%, 규칙 기반 70%로 계산한 비율 (%)
+        weighted = analysis['dictionary_matches'] + analysis['rule_based_conversions'] * 0.7
+        analysis['overall_confidence'] = weighted / analysis['total_words'] * 100 if words else 0.0
         return analysis
 
     def suggest_improvements(self, word):
@@ -480,17 +826,12 @@ class EnglishToKoreanPronunciation:
         word = word.lower().strip()
         suggestions = []
 
-        if word not in self.word_dict:
-            # 유사한 단어 찾기
-            similar_words = []
-            for dict_word in self.word_dict.keys():
-                if len(word) == len(dict_word):
-                    differences = sum(1 for a, b in zip(word, dict_word) if a != b)
-                    if differences <= 2:  # 2글자 이하 차이
-                        similar_words.append(dict_word)
+        if self.lookup_word(word) is None:
+            # 유사한 단어 찾기 (편집 거리 2 이하, 가까운 순)
+            similar_words = [similar_word for similar_word, _ in self.find_similar_words(word, k=3)]
 
             if similar_words:
-                suggestions.append(f"유사한 단어들: {', '.join(similar_words[:3])}")
+                suggestions.append(f"유사한 단어들: {', '.join(similar_words)}")
 
             # 발음 규칙 제안
             applicable_rules = [pattern for pattern, _ in self.phonetic_rules if pattern in word]
@@ -522,23 +863,27 @@ class EnglishToKoreanPronunciation:
             # 기존 사전과 병합
             original_size = len(self.word_dict)
             self.word_dict.update(imported_dict)
+            if self.fuzzy_index is not None:
+                for word in imported_dict:
+                    self.fuzzy_index.add(word)
+            self.invalidate_word_cache()
             new_size = len(self.word_dict)
 
             print(f"✅ 사전 가져오기 완료: {new_size - original_size}개 단어 추가")
         except Exception as e:
             print(f"❌ 사전 가져오기 실패: {e}")
 
-    def create_pronunciation_report(self, text):
+    def create_pronunciation_report(self, text, traces=None):
         """발음 변환 보고서 생성"""
-        converted = self.convert_text(text)
-        analysis = self.analyze_pronunciation_patterns(text)
+        trace = self.trace_text(text, traces)
+        analysis = self.summarize_trace(trace['words'])
 
         report = f"""
 📊 발음 변환 보고서
 ================
 
 📝 원문: {text}
-🔊 변환: {converted}
+🔊 변환: {trace['converted']}
 
 📈 통계:
 - 총 단어 수: {analysis['total_words']}
@@ -551,10 +896,56 @@ class EnglishToKoreanPronunciation:
 - 중간 (50-80%): {analysis['confidence_distribution']['medium']}개
 - 낮음 (50% 미만): {analysis['confidence_distribution']['low']}개
 
-💡 전체 신뢰도: {(analysis['dictionary_matches'] + analysis['rule_based_conversions'] * 0.7) / analysis['total_words'] * 100:.1f}%
+💡 전체 신뢰도: {analysis['overall_confidence']:.1f}%
 """
         return report
 
+    def create_pronunciation_reports(self, texts):
+        """여러 텍스트의 발음 변환 보고서 목록 (단어 추적은 고유 단어당 한 번)"""
+        traces = {}
+        return [self.create_pronunciation_report(text, traces) for text in texts]
+
+    def trace_corpus(self, texts, output_path=None, top_n=20):
+        """코퍼스 전체 발음 QA: 텍스트별 추적 + 전체 통계 + 자주 나오는 저신뢰도 단어
+
+        output_path를 지정하면 텍스트별 추적을 JSON Lines로 저장합니다.
+        반환: {'analysis': 전체 통계, 'low_confidence_words': [(단어, 횟수)], 'traces': [trace_text 결과]}
+        """
+        from collections import Counter
+
+        word_traces = {}
+        traces = [self.trace_text(text, word_traces) for text in texts]
+        all_words = [trace for text_trace in traces for trace in text_trace['words']]
+        low_confidence = Counter(trace['word'] for trace in all_words if trace['confidence'] < 0.5)
+
+        if output_path:
+            try:
+                import os
+                import json
+                temp_path = f"{output_path}.{os.getpid()}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    for text_trace in traces:
+                        f.write(json.dumps(text_trace, ensure_ascii=False) + '\n')
+                os.replace(temp_path, output_path)
+                print(f"✅ 발음 추적 저장 완료: {output_path} ({len(traces)}개 텍스트)")
+            except Exception as e:
+                print(f"❌ 발음 추적 저장 실패: {e}")
+
+        return {
+            'analysis': self.summarize_trace(all_words),
+            'low_confidence_words': low_confidence.most_common(top_n),
+            'traces': traces,
+        }
+
+
+def _init_batch_worker(converter):
+    global _batch_converter
+    _batch_converter = converter
+
+
+def _convert_words_chunk(words):
+    return [_batch_converter._convert_word_uncached(word) for word in words]
+
 
 # 사용 예시 및 테스트 함수들
 def test_pronunciation_converter():
@@ -584,8 +975,125 @@ def test_pronunciation_converter():
 
         # 분석 정보
         analysis = converter.analyze_pronunciation_patterns(sentence)
-        confidence = (analysis['dictionary_matches'] + analysis['rule_based_conversions'] * 0.7) / analysis['total_words'] * 100
-        print(f"   신뢰도: {confidence:.1f}%")
+        print(f"   신뢰도: {analysis['overall_confidence']:.1f}%")
+
+
+# 규칙 변환 벤치마크용 사전에 없는 단어 (기대 결과는 tests/test_pronunciation_converter.py)
+RULE_SAMPLE_WORDS = (
+    'sing', 'singer', 'thinking', 'judge', 'watch', 'nation', 'partial', 'special', 'tough',
+    'check', 'queen', 'knife', 'climb', 'doubt', 'sea', 'pie', 'moon', 'saw', 'boy', 'gem',
+    'giant', 'played', 'walked', 'quickly', 'careful', 'useless', 'kindness', 'strongest',
+    'jumped', 'cycle',
+)
+
+
+def benchmark_phonetic_rules(word_list_path=None, repeats=3):
+    """규칙 순차 치환(이전 방식)과 트라이 단일 패스의 단어 변환 속도 비교
+
+    word_list_path: 한 줄에 한 단어인 목록 (없으면 /usr/share/dict/words, 그것도 없으면 내장 단어로 생성)
+    """
+    import os
+    import time
+
+    converter = EnglishToKoreanPronunciation()
+    path = word_list_path or '/usr/share/dict/words'
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            words = [line.strip().lower() for line in f if line.strip().isalpha()]
+    else:
+        base_words = list(RULE_SAMPLE_WORDS) + list(converter.word_dict)
+        words = [variant for word in base_words for variant in converter.get_word_variants(word)] * 20
+    words = [word for word in words if word not in converter.word_dict]
+
+    def sequential(word):
+        # 이전 방식: 규칙마다 str.replace 후 남은 문자 변환 (치환 결과는 한글이라 트라이에 걸리지 않음)
+        for pattern, replacement in converter.phonetic_rules:
+            word = word.replace(pattern, replacement)
+        return converter.advanced_phonetic_conversion(word)
+
+    def trie(word):
+        return converter.advanced_phonetic_conversion(word)
+
+    results = {}
+    for name, convert in (('sequential', sequential), ('trie', trie)):
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for word in words:
+                convert(word)
+            best = min(best, time.perf_counter() - start)
+        results[name] = best
+
+    print(f"📊 음성학적 규칙 변환 ({len(words)}단어, 규칙 {len(converter.phonetic_rules)}개)")
+    print(f"   순차 치환: {len(words) / results['sequential']:10.0f} 단어/초")
+    print(f"   트라이:    {len(words) / results['trie']:10.0f} 단어/초")
+    return results
+
+
+def benchmark_batch_convert(num_lines=20000, processes=None, seed=0):
+    """자막형 영어 문장 num_lines개에 대해 문장별 convert_text와 convert_batch 속도 비교 (결과 동일성 확인 포함)"""
+    import random
+    import time
+
+    converter = EnglishToKoreanPronunciation()
+    rng = random.Random(seed)
+    vocabulary = list(converter.word_dict) + list(RULE_SAMPLE_WORDS) + list(converter.contractions)
+    vocabulary += [variant for word in list(RULE_SAMPLE_WORDS)[:10] for variant in converter.get_word_variants(word)]
+    lines = [' '.join(rng.choice(vocabulary) for _ in range(rng.randint(3, 12))).capitalize()
+             + rng.choice(['.', '!', '?', ', right?', '...']) for _ in range(num_lines)]
+
+    # 문장별 변환 (단어 캐시 미사용, 이전 batch_convert와 같은 방식)
+    per_line_converter = EnglishToKoreanPronunciation(word_cache_size=0)
+    start = time.perf_counter()
+    expected = [per_line_converter.convert_text(line) for line in lines]
+    per_line_sec = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = converter.convert_batch(lines, processes=processes)
+    batch_sec = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(expected, batched) if a != b)
+    print(f"📊 일괄 발음 변환 ({num_lines}문장, 프로세스 {processes or 1}개)")
+    print(f"   문장별 convert_text: {num_lines / per_line_sec:10.0f} 문장/초")
+    print(f"   convert_batch:       {num_lines / batch_sec:10.0f} 문장/초 (불일치 {mismatches}건)")
+    return {'per_line_sec': per_line_sec, 'batch_sec': batch_sec, 'mismatches': mismatches}
+
+
+def benchmark_pronunciation_report(num_lines=20000, seed=0):
+    """문장 num_lines개의 발음 QA: 변환 + 단어별 신뢰도 + 규칙 재검사(이전 방식)와 trace_corpus 한 번 순회 비교"""
+    import random
+    import time
+
+    converter = EnglishToKoreanPronunciation()
+    rng = random.Random(seed)
+    vocabulary = list(converter.word_dict) + list(RULE_SAMPLE_WORDS)
+    vocabulary += [variant for word in list(RULE_SAMPLE_WORDS)[:10] for variant in converter.get_word_variants(word)]
+    lines = [' '.join(rng.choice(vocabulary) for _ in range(rng.randint(3, 12))).capitalize()
+             + rng.choice(['.', '!', '?', ', right?', '...']) for _ in range(num_lines)]
+
+    def three_pass(text):
+        # 이전 방식: 변환 후 단어마다 신뢰도(규칙 전체 검사)와 규칙 일치 여부를 다시 검사
+        converter.convert_text(text)
+        for word in re.findall(r'\b\w+\b', text.lower()):
+            if converter.lookup_word(word) is None:
+                sum(1 for pattern, _ in converter.phonetic_rules if pattern in word)
+                any(pattern in word for pattern, _ in converter.phonetic_rules)
+
+    start = time.perf_counter()
+    for line in lines:
+        three_pass(line)
+    three_pass_sec = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = converter.trace_corpus(lines)
+    trace_sec = time.perf_counter() - start
+
+    mismatches = sum(1 for line, trace in zip(lines, result['traces']) if converter.convert_text(line) != trace['converted'])
+    print(f"📊 발음 QA 보고서 ({num_lines}문장, 단어 {result['analysis']['total_words']}개)")
+    print(f"   변환 + 분석 3회 순회: {num_lines / three_pass_sec:10.0f} 문장/초")
+    print(f"   trace_corpus:         {num_lines / trace_sec:10.0f} 문장/초 (변환 불일치 {mismatches}건)")
+    return {'three_pass_sec': three_pass_sec, 'trace_sec': trace_sec, 'mismatches': mismatches}
+
 
 def demo_advanced_features():
     """고급 기능 데모"""
@@ -615,4 +1123,6 @@ def demo_advanced_features():
 if __name__ == "__main__":
     # 메인 테스트 실행
     test_pronunciation_converter()
-    demo_advanced_features()
\ No newline at end of file
+    demo_advanced_features()
+    benchmark_phonetic_rules()
+    benchmark_batch_convert()
\ No newline at end of file
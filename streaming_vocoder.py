@@ -0,0 +1,201 @@
+"""
+스트리밍 보코더 모듈 (멜 구간별 HiFi-GAN 추론 + 겹침 구간 크로스페이드)
+"""
+import time
+
+import numpy as np
+import torch
+
+
+class StreamingVocoder:
+    """멜 스펙트로그램을 고정 길이 구간으로 나누어 보코딩하고 오디오 블록을 순서대로 반환
+
+    각 구간 앞뒤에 수용 영역(receptive field)만큼 문맥 프레임을 붙여 추론한 뒤
+    문맥에 해당하는 출력은 버리므로, 이어 붙인 결과가 전체 보코딩과 거의 같습니다.
+    구간 경계는 crossfade_frames 만큼 겹쳐 선형 크로스페이드로 잇습니다.
+    첫 블록까지의 지연은 문장 길이와 무관하게 chunk_frames + 문맥 길이로 정해집니다.
+    """
+
+    def __init__(self, vocoder_model, hop_length, chunk_frames=32, context_frames=None, crossfade_frames=2):
+        """context_frames: 보코더 수용 영역 (프레임, 한쪽). None이면 처음 사용할 때 측정"""
+        self.vocoder_model = vocoder_model
+        self.hop_length = hop_length
+        self.chunk_frames = chunk_frames
+        self.crossfade_frames = crossfade_frames
+        self._context_frames = context_frames
+
+        # HiFi-GAN inference는 입력 양끝을 복제 패딩하므로 그만큼 출력이 길어짐
+        self.inference_padding = inference_padding_frames(vocoder_model)
+
+    @property
+    def context_frames(self):
+        """구간 앞뒤에 붙일 문맥 프레임 수
+
+        크로스페이드로 구간 끝보다 더 가져오는 프레임도 수용 영역만큼의 문맥이 필요하므로
+        수용 영역(지정하지 않으면 측정값)에 크로스페이드 길이를 더합니다.
+        """
+        if self._context_frames is None:
+            self._context_frames = measure_receptive_field_frames(self.vocoder_model, self.hop_length)
+        return self._context_frames + self.crossfade_frames
+
+    @torch.no_grad()
+    def vocode_window(self, mel):
+        """보코더 정규화 멜 [채널, 프레임] → 파형 (inference 패딩 포함)"""
+        wav = self.vocoder_model.inference(torch.from_numpy(np.ascontiguousarray(mel, dtype=np.float32))[None])
+        return wav.reshape(-1).cpu().numpy().astype(np.float32)
+
+    def windows(self, total_frames):
+        """(구간 시작, 구간 끝, 문맥 포함 시작, 문맥 포함 끝) 목록"""
+        context = self.context_frames
+        start = 0
+        while start < total_frames:
+            end = min(start + self.chunk_frames, total_frames)
+            if total_frames - end <= self.crossfade_frames:
+                end = total_frames  # 크로스페이드보다 짧은 마지막 구간은 앞 구간에 합침
+            yield start, end, max(0, start - context), min(total_frames, end + context)
+            start = end
+
+    def stream(self, mel):
+        """멜 [채널, 프레임]을 구간별로 보코딩하여 float32 오디오 블록을 순서대로 반환 (제너레이터)"""
+        total_frames = mel.shape[1]
+        hop = self.hop_length
+        fade = self.crossfade_frames * hop
+        fade_in = np.linspace(0.0, 1.0, fade, endpoint=False, dtype=np.float32) if fade else None
+        pending_tail = None
+
+        for start, end, window_start, window_end in self.windows(total_frames):
+            wav = self.vocode_window(mel[:, window_start:window_end])
+
+            # 문맥을 제외한 구간 출력 위치 (inference 패딩 보정)
+            offset = (self.inference_padding + start - window_start) * hop
+            segment_start = 0 if start == 0 else offset
+            if end == total_frames:
+                segment_end = len(wav)  # 마지막 구간은 오른쪽 패딩 출력까지 포함
+            else:
+                # 다음 구간과 겹치도록 크로스페이드 길이만큼 더 가져옴
+                segment_end = offset + (end - start) * hop + fade
+            segment = wav[segment_start:segment_end]
+
+            if pending_tail is not None:
+                # 이전 구간의 꼬리와 현재 구간의 머리를 선형 크로스페이드
+                head = segment[:fade] * fade_in + pending_tail * (1.0 - fade_in)
+                segment = np.concatenate([head, segment[fade:]])
+
+            if end == total_frames or not fade:
+                pending_tail = None
+                yield segment
+            else:
+                pending_tail = segment[-fade:]
+                yield segment[:-fade]
+
+
+@torch.no_grad()
+def measure_receptive_field_frames(vocoder_model, hop_length, num_frames=96):
+    """한 프레임을 바꿨을 때 출력이 달라지는 범위로 보코더의 수용 영역(프레임, 한쪽) 측정"""
+    num_mels = _num_mels(vocoder_model)
+    base = torch.zeros(1, num_mels, num_frames)
+    probe = base.clone()
+    center = num_frames // 2
+    probe[:, :, center] = 1.0
+
+    difference = (vocoder_model.inference(probe) - vocoder_model.inference(base)).abs().reshape(-1)
+    changed = torch.nonzero(difference > 1e-6).reshape(-1)
+    if len(changed) == 0:
+        return 1
+
+    padding = inference_padding_frames(vocoder_model)
+    first_frame = int(changed[0]) // hop_length - padding
+    last_frame = int(changed[-1]) // hop_length - padding
+    return max(center - first_frame, last_frame - center, 1)
+
+
+def inference_padding_frames(vocoder_model):
+    """보코더 inference가 멜 양끝에 붙이는 복제 패딩 프레임 수 (TTS HifiganGenerator는 inp_pad)"""
+    for name in ('inp_pad', 'inference_padding'):
+        padding = getattr(vocoder_model, name, None)
+        if padding is not None:
+            return int(padding)
+    return 0
+
+
+def _num_mels(vocoder_model):
+    """보코더 첫 합성곱의 입력 채널 수"""
+    for module in vocoder_model.modules():
+        if isinstance(module, (torch.nn.Conv1d, torch.nn.ConvTranspose1d)):
+            return module.in_channels
+    return 80
+
+
+def verify_streaming_vocoder(vocoder_model, mel, hop_length, chunk_frames=32, context_frames=None,
+                             crossfade_frames=2, tolerance=1e-3):
+    """스트리밍 보코딩을 이어 붙인 결과와 전체 보코딩 결과 비교
+
+    반환: {'max_abs_diff', 'snr_db', 'blocks', 'context_frames', 'length_match', 'passed'}
+    """
+    streamer = StreamingVocoder(vocoder_model, hop_length, chunk_frames, context_frames, crossfade_frames)
+    full = streamer.vocode_window(mel)
+    blocks = list(streamer.stream(mel))
+    stitched = np.concatenate(blocks) if blocks else np.zeros(0, dtype=np.float32)
+
+    length = min(len(full), len(stitched))
+    difference = full[:length] - stitched[:length]
+    max_abs_diff = float(np.max(np.abs(difference))) if length else 0.0
+    snr_db = float(10 * np.log10((np.sum(full[:length] ** 2) + 1e-12) / (np.sum(difference ** 2) + 1e-12)))
+
+    result = {
+        'max_abs_diff': max_abs_diff,
+        'snr_db': snr_db,
+        'blocks': len(blocks),
+        'context_frames': streamer.context_frames,
+        'length_match': len(full) == len(stitched),
+    }
+    result['passed'] = result['length_match'] and max_abs_diff <= tolerance
+    return result
+
+
+def benchmark_first_block_latency(loader, texts, chunk_frames=32):
+    """문장 길이별 첫 오디오 블록까지의 보코더 지연 (전체 보코딩 대비)"""
+    from batch_synthesis import BatchSynthesizer
+
+    batcher = BatchSynthesizer(loader.synthesizer)
+    streamer = StreamingVocoder(loader.synthesizer.vocoder_model, batcher.hop_length, chunk_frames)
+    receptive_field = streamer.context_frames - streamer.crossfade_frames  # 수용 영역 측정은 미리 수행
+
+    results = []
+    for text in texts:
+        mels, _ = batcher.text_to_mels([batcher.text_to_ids(loader.normalize_text(text))])
+        mel = mels[0]
+
+        start = time.perf_counter()
+        streamer.vocode_window(mel)
+        full_sec = time.perf_counter() - start
+
+        start = time.perf_counter()
+        next(streamer.stream(mel))
+        first_block_sec = time.perf_counter() - start
+
+        verification = verify_streaming_vocoder(loader.synthesizer.vocoder_model, mel, batcher.hop_length,
+                                                chunk_frames, receptive_field)
+        results.append({'text': text, 'frames': mel.shape[1], 'full_sec': full_sec,
+                        'first_block_sec': first_block_sec, **verification})
+
+    print(f"📊 스트리밍 보코더 (구간 {chunk_frames}프레임, 문맥 {streamer.context_frames}프레임)")
+    for result in results:
+        status = "✅" if result['passed'] else "❌"
+        print(f"   {status} {result['frames']:4d}프레임: 전체 {result['full_sec'] * 1000:.1f}ms → "
+              f"첫 블록 {result['first_block_sec'] * 1000:.1f}ms, 오차 {result['max_abs_diff']:.2e}")
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+    from tts_model_loader import TTSModelLoader
+
+    tts_loader = TTSModelLoader(sys.argv[1] if len(sys.argv) > 1 else "data", use_cache=False)
+    if tts_loader.load_models():
+        benchmark_first_block_latency(tts_loader, [
+            "안녕하세요.",
+            "오늘 날씨가 정말 좋네요.",
+            "간장 공장 공장장은 강 공장장이고 된장 공장 공장장은 공 공장장이다.",
+            "이 문장은 문장 길이와 관계없이 첫 오디오 블록이 일정한 시간 안에 나오는지 확인하기 위한 아주 긴 문장입니다.",
+        ])
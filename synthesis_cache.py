@@ -0,0 +1,209 @@
+"""
+합성 결과 캐시 모듈
+"""
+import os
+import json
+import time
+import zlib
+import shutil
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# 기본 캐시 위치 (모델 디렉토리는 읽기 전용일 수 있으므로 사용자 캐시 폴더 사용)
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "custom-voice-tts")
+
+
+def fingerprint_model_files(paths, configs=None):
+    """체크포인트/설정 파일 목록으로 모델 지문 생성
+
+    파일 내용 전체를 해싱하면 수백 MB를 읽어야 하므로
+    경로, 크기, 수정 시각만 사용합니다.
+    """
+    digest = hashlib.sha256()
+
+    for path in paths:
+        digest.update(str(path).encode('utf-8'))
+        if path and os.path.exists(path):
+            stat = os.stat(path)
+            digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode('utf-8'))
+
+    for config in configs or []:
+        digest.update(json.dumps(config, sort_keys=True, default=str).encode('utf-8'))
+
+    return digest.hexdigest()[:16]
+
+
+class SynthesisCache:
+    """정규화된 텍스트 기반 파형 캐시 (메모리 LRU + 디스크 저장소)"""
+
+    def __init__(self, cache_dir=None, max_memory_bytes=64 * 1024 * 1024, use_disk=True):
+        self.cache_dir = os.path.join(cache_dir or DEFAULT_CACHE_DIR, "synthesis")
+        self.max_memory_bytes = max_memory_bytes
+        self.use_disk = use_disk
+        self.fingerprint = None
+
+        self._entries = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def bind(self, fingerprint):
+        """로드된 모델 지문 연결 (지문이 바뀌면 메모리 캐시 무효화)
+
+        같은 cache_dir을 쓰는 다른 로더/모델의 디스크 캐시는 지우지 않고,
+        현재 지문 디렉토리의 수정 시각만 갱신합니다 (오래된 캐시 정리는 purge_stale로 명시적으로 실행).
+        """
+        with self._lock:
+            if fingerprint == self.fingerprint:
+                return
+
+            self.fingerprint = fingerprint
+            self._entries.clear()
+            self._memory_bytes = 0
+
+        if self.use_disk:
+            try:
+                directory = os.path.join(self.cache_dir, fingerprint)
+                os.makedirs(directory, exist_ok=True)
+                os.utime(directory)
+            except OSError as e:
+                print(f"⚠️ 캐시 디렉토리 준비 실패: {e}")
+
+    def make_key(self, normalized_text):
+        """정규화된 텍스트와 모델 지문으로 캐시 키 생성"""
+        payload = f"{self.fingerprint}\0{normalized_text}".encode('utf-8')
+        return hashlib.sha256(payload).hexdigest()
+
+    def _disk_path(self, key):
+        return os.path.join(self.cache_dir, self.fingerprint, key[:2], f"{key}.pcm.z")
+
+    def get(self, normalized_text):
+        """캐시에서 파형 조회 (없으면 None, 캐시 내용을 보호하기 위해 읽기 전용 배열)"""
+        if self.fingerprint is None:
+            return None
+
+        key = self.make_key(normalized_text)
+
+        with self._lock:
+            wav = self._entries.get(key)
+            if wav is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return wav
+
+        wav = self._read_disk(key) if self.use_disk else None
+        if wav is None:
+            self.misses += 1
+            return None
+
+        self.disk_hits += 1
+        self._remember(key, wav)
+        return wav
+
+    def put(self, normalized_text, wav):
+        """합성된 파형을 캐시에 저장"""
+        if self.fingerprint is None or wav is None:
+            return
+
+        key = self.make_key(normalized_text)
+        wav = np.array(wav, dtype=np.float32)  # 호출자가 원본을 수정해도 캐시에 영향이 없도록 복사
+
+        self._remember(key, wav)
+        if self.use_disk:
+            self._write_disk(key, wav)
+
+    def _remember(self, key, wav):
+        """메모리 LRU에 저장하고 용량 초과분 제거"""
+        if wav.nbytes > self.max_memory_bytes:
+            return
+
+        wav.setflags(write=False)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= previous.nbytes
+
+            self._entries[key] = wav
+            self._memory_bytes += wav.nbytes
+
+            while self._memory_bytes > self.max_memory_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._memory_bytes -= evicted.nbytes
+
+    def _read_disk(self, key):
+        path = self._disk_path(key)
+        try:
+            with open(path, 'rb') as f:
+                pcm = np.frombuffer(zlib.decompress(f.read()), dtype='<i2')
+            return pcm.astype(np.float32) / 32767.0
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"⚠️ 캐시 읽기 실패: {e}")
+            return None
+
+    def _write_disk(self, key, wav):
+        path = self._disk_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            # 16bit PCM으로 변환 후 압축
+            pcm = (np.clip(wav, -1.0, 1.0) * 32767).astype('<i2')
+            data = zlib.compress(pcm.tobytes(), 6)
+
+            # 다른 프로세스와 경합하지 않도록 임시 파일에 쓴 뒤 교체
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"⚠️ 캐시 저장 실패: {e}")
+
+    def purge_stale(self, max_age_days=30):
+        """현재 지문이 아니고 max_age_days일 이상 사용되지 않은 모델의 디스크 캐시 삭제
+
+        사용 시각은 bind가 갱신하는 지문 디렉토리 수정 시각으로 판단하므로,
+        같은 cache_dir을 쓰는 다른 로더가 최근에 사용한 캐시는 남습니다.
+        """
+        try:
+            if not os.path.isdir(self.cache_dir):
+                return
+
+            cutoff = time.time() - max_age_days * 24 * 3600
+            removed = 0
+            for name in os.listdir(self.cache_dir):
+                path = os.path.join(self.cache_dir, name)
+                if name != self.fingerprint and os.path.getmtime(path) < cutoff:
+                    shutil.rmtree(path, ignore_errors=True)
+                    removed += 1
+
+            if removed > 0:
+                print(f"🧹 이전 모델 캐시 {removed}개 정리 완료")
+        except Exception as e:
+            print(f"⚠️ 캐시 정리 실패: {e}")
+
+    def clear(self):
+        """메모리 및 디스크 캐시 전체 삭제"""
+        with self._lock:
+            self._entries.clear()
+            self._memory_bytes = 0
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def get_stats(self):
+        """캐시 통계 반환"""
+        with self._lock:
+            total = self.hits + self.disk_hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'memory_bytes': self._memory_bytes,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': (self.hits + self.disk_hits) / total if total else 0.0,
+            }
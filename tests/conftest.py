@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 저장소 최상위 모듈(batch_synthesis 등)을 테스트에서 import
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
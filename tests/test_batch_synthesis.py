@@ -0,0 +1,66 @@
+"""
+BatchSynthesizer 배치 추론과 문장별 GlowTTS.inference 결과 비교 (대체 모델 사용)
+"""
+import numpy as np
+import pytest
+import torch
+
+from batch_synthesis import BatchSynthesizer
+from bench.standin_model import StandInSynthesizer
+
+TEXTS = ["안녕하세요.", "오늘 날씨가 정말 좋네요.", "네.",
+         "간장 공장 공장장은 강 공장장이고 된장 공장 공장장은 공 공장장이다."]
+
+
+@pytest.fixture
+def synthesizer():
+    synthesizer = StandInSynthesizer(seed=0)
+    synthesizer.tts_model.inference_noise_scale = 0.0
+    return synthesizer
+
+
+def single_inference(model, ids):
+    x = torch.from_numpy(ids)[None]
+    return model.inference(x, aux_input={'x_lengths': torch.tensor([len(ids)])})['model_outputs'][0].numpy()
+
+
+@pytest.mark.parametrize('length_scale', [1.0, 1.3, 0.7])
+def test_batched_mel_lengths_match_inference(synthesizer, length_scale):
+    synthesizer.tts_model.length_scale = length_scale
+    batcher = BatchSynthesizer(synthesizer)
+    token_ids = [batcher.text_to_ids(text) for text in TEXTS]
+
+    _, mel_lengths = batcher.text_to_mels(token_ids)
+
+    assert mel_lengths == [single_inference(synthesizer.tts_model, ids).shape[0] for ids in token_ids]
+
+
+def test_batched_output_matches_single_on_padded_inputs(synthesizer):
+    batcher = BatchSynthesizer(synthesizer)
+    token_ids = [batcher.text_to_ids(text) for text in TEXTS]
+
+    mels, _ = batcher.text_to_mels(token_ids)
+    wavs = batcher.vocode(mels)
+
+    for ids, mel, wav in zip(token_ids, mels, wavs):
+        single_mels, _ = batcher.text_to_mels([ids])
+        np.testing.assert_allclose(mel, single_mels[0], atol=1e-5)
+        np.testing.assert_allclose(mel.T, single_inference(synthesizer.tts_model, ids), atol=1e-5)
+
+        # 보코더는 배치 패딩이 끝부분 수용 영역에만 영향을 주므로 마지막 몇 프레임은 제외하고 비교
+        single_wav = batcher.vocode(single_mels)[0]
+        padding = synthesizer.vocoder_model.inp_pad
+        assert len(wav) == len(single_wav) == (mel.shape[1] + 2 * padding) * batcher.hop_length
+        stable = (mel.shape[1] - 8) * batcher.hop_length
+        np.testing.assert_allclose(wav[:stable], single_wav[:stable], atol=1e-5)
+
+
+def test_batched_waveforms_match_synthesizer_layout(synthesizer):
+    # 여러 문장 입력도 Synthesizer.tts와 같이 문장별로 나누어 문장마다 무음을 붙임 (합성 캐시 키 공유)
+    texts = ["안녕하세요. 오늘 날씨가 정말 좋네요.", "네."]
+    batch_wavs = BatchSynthesizer(synthesizer).synthesize_batch(texts)
+
+    for text, wav in zip(texts, batch_wavs):
+        single_wav = np.asarray(synthesizer.tts(text), dtype=np.float32)
+        assert len(wav) == len(single_wav)
+        np.testing.assert_array_equal(wav == 0, single_wav == 0)
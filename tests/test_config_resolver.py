@@ -0,0 +1,43 @@
+"""
+오래된 절대 경로가 남아 있는 config도 캐시한 해석 결과를 다시 사용하는지 확인
+"""
+import json
+import os
+
+from config_resolver import ConfigResolver
+
+
+def test_stale_absolute_paths_do_not_invalidate_cache(tmp_path):
+    model_path = tmp_path / "model"
+    model_path.mkdir()
+    speakers_path = model_path / "speakers.json"
+    speakers_path.write_text("{}", encoding='utf-8')
+
+    config_path = model_path / "config.json"
+    config_path.write_text(json.dumps({
+        'output_path': "/content/drive/My Drive/Colab Notebooks/output",  # 찾을 수 없는 Colab 경로
+        'datasets': [{'path': "/home/trainer/dataset/"}],  # 다른 환경의 오래된 절대 경로
+        'speakers_file': "/content/drive/My Drive/Colab Notebooks/speakers.json",
+    }), encoding='utf-8')
+
+    calls = []
+
+    def fix_paths(config, _model_path):
+        calls.append(config)
+        config['output_path'] = None
+        config['speakers_file'] = str(speakers_path)
+        return config
+
+    cache_dir = str(tmp_path / "cache")
+    config, runtime_path = ConfigResolver(cache_dir).resolve(str(config_path), str(model_path), fix_paths)
+    assert config['speakers_file'] == str(speakers_path)
+    assert runtime_path != str(config_path)
+
+    # 다른 프로세스(새 해석기)는 저장된 결과를 그대로 사용
+    assert ConfigResolver(cache_dir).resolve(str(config_path), str(model_path), fix_paths) == (config, runtime_path)
+    assert len(calls) == 1
+
+    # 수정한 경로의 파일이 사라지면 다시 해석
+    os.remove(speakers_path)
+    ConfigResolver(cache_dir).resolve(str(config_path), str(model_path), fix_paths)
+    assert len(calls) == 2
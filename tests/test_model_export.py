@@ -0,0 +1,55 @@
+"""
+TorchScript로 내보낸 그래프와 배치 추론의 멜 길이/출력을 GlowTTS.inference와 비교 (대체 모델 사용)
+"""
+import json
+
+import numpy as np
+import pytest
+import torch
+from torch import nn
+
+from batch_synthesis import BatchSynthesizer
+from model_export import ExportedSynthesizer, TorchScriptGraph, export_synthesizer
+from bench.standin_model import StandInSynthesizer
+
+TEXTS = ["안녕하세요.", "오늘 날씨가 정말 좋네요.", "네.",
+         "간장 공장 공장장은 강 공장장이고 된장 공장 공장장은 공 공장장이다."]
+
+
+@pytest.fixture(scope='module')
+def exported(tmp_path_factory):
+    """토큰마다 지속시간이 다른 대체 모델과, 이를 TorchScript로 내보낸 실행기"""
+    synthesizer = StandInSynthesizer(seed=0)
+    synthesizer.tts_model.inference_noise_scale = 0.0
+    torch.manual_seed(1)
+    nn.init.normal_(synthesizer.tts_model.encoder.duration_proj.weight, std=0.05)
+
+    output_dir = tmp_path_factory.mktemp("exported")
+    config_path = output_dir / "source_config.json"
+    config_path.write_text("{}", encoding='utf-8')
+    manifest_path = export_synthesizer(synthesizer, str(output_dir), 'torchscript', str(config_path))
+
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    graphs = {name: TorchScriptGraph(str(output_dir / filename)) for name, filename in manifest['graphs'].items()}
+    return synthesizer, ExportedSynthesizer(graphs, manifest, synthesizer.tts_config, seed=0)
+
+
+@pytest.mark.parametrize('length_scale', [1.0, 1.3, 0.7, 0.0])
+def test_exported_and_batched_mels_match_inference(exported, length_scale):
+    synthesizer, runtime = exported
+    synthesizer.tts_model.length_scale = length_scale
+    runtime.length_scale = length_scale
+    batcher = BatchSynthesizer(synthesizer)
+    token_ids = [batcher.text_to_ids(text) for text in TEXTS]
+
+    _, batched_lengths = batcher.text_to_mels(token_ids)
+    for ids, batched_length in zip(token_ids, batched_lengths):
+        x = torch.from_numpy(ids)[None]
+        model_mel = synthesizer.tts_model.inference(
+            x, aux_input={'x_lengths': torch.tensor([len(ids)])})['model_outputs'][0].numpy().T
+        exported_mel = runtime.text_to_mel(ids, noise_scale=0.0)
+
+        assert exported_mel.shape == model_mel.shape
+        assert batched_length == model_mel.shape[1]
+        np.testing.assert_allclose(exported_mel, model_mel, atol=1e-4)
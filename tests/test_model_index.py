@@ -0,0 +1,48 @@
+"""
+심볼릭 링크로 연결한 모델/학습 실행 폴더에서도 체크포인트를 찾는지 확인
+"""
+import os
+
+import pytest
+
+from checkpoint_catalog import CheckpointCatalog
+from model_index import DirectoryIndex
+
+pytestmark = pytest.mark.skipif(not hasattr(os, 'symlink'), reason="심볼릭 링크가 필요한 테스트")
+
+RUN_NAME = "glowtts-v2-June-18-2025_06+37AM-3aa165a"
+
+
+@pytest.fixture
+def data_path(tmp_path):
+    # 다른 볼륨에 있는 실행 폴더를 data/glowtts-v2 아래로 링크
+    volume_run = tmp_path / "volume" / RUN_NAME
+    volume_run.mkdir(parents=True)
+    (volume_run / "best_model_1000.pth").write_bytes(b"")
+    (volume_run / "checkpoint_2000.pth").write_bytes(b"")
+    os.symlink(tmp_path / "volume", volume_run / "loop")  # 상위로 되돌아가는 링크
+
+    data_path = tmp_path / "data"
+    (data_path / "glowtts-v2").mkdir(parents=True)
+    os.symlink(volume_run, data_path / "glowtts-v2" / RUN_NAME)
+    return data_path
+
+
+def test_symlinked_run_is_indexed(data_path):
+    index = DirectoryIndex(str(data_path))
+    catalog = CheckpointCatalog(str(data_path / "glowtts-v2"), "glowtts-v2-", index)
+
+    run, checkpoint = catalog.select('best')
+
+    assert run['name'] == RUN_NAME
+    assert checkpoint['path'] == str(data_path / "glowtts-v2" / RUN_NAME / "best_model_1000.pth")
+    assert catalog.select('latest')[1]['name'] == "checkpoint_2000.pth"
+    assert index.find("best_model_1000.pth") == [checkpoint['path']]
+
+
+def test_symlink_cycle_is_skipped(data_path):
+    index = DirectoryIndex(str(data_path))
+    dirpaths = [dirpath for dirpath, _ in index.walk()]
+
+    assert all(os.sep + "loop" + os.sep + RUN_NAME not in dirpath for dirpath in dirpaths)
+    assert len(dirpaths) == len(set(os.path.realpath(dirpath) for dirpath in dirpaths))
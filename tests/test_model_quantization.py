@@ -0,0 +1,86 @@
+"""
+int8 양자화: weight_norm 1x1 합성곱 변환, fp32 대비 출력 검증, 저장한 양자화 모델 재사용 (대체 모델 사용)
+"""
+import os
+import warnings
+
+import pytest
+import torch
+from torch import nn
+
+import model_quantization
+from model_quantization import PointwiseConv1d, optimize_model, optimize_synthesizer
+from bench.standin_model import StandInSynthesizer
+
+
+def weight_normed_synthesizer():
+    """Glow-TTS WaveNet 블록처럼 훅 방식 weight_norm을 건 뒤 체크포인트를 불러온 대체 모델"""
+    synthesizer = StandInSynthesizer(seed=0)
+    model = synthesizer.tts_model
+    model.inference_noise_scale = 0.0
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for conv in (model.decoder.pre, model.decoder.post, model.encoder.proj_mean, model.encoder.convs[0]):
+            nn.utils.weight_norm(conv)
+
+    # load_state_dict는 weight_g/weight_v만 바꾸므로 weight 속성은 이전 값으로 남음
+    generator = torch.Generator().manual_seed(1)
+    model.load_state_dict({key: value * (1 + torch.rand(value.shape, generator=generator))
+                           if key.endswith('weight_g') else value
+                           for key, value in model.state_dict().items()})
+    return synthesizer
+
+
+@pytest.fixture
+def checkpoint_path(tmp_path):
+    (tmp_path / "run").mkdir()
+    path = tmp_path / "run" / "best_model.pth"
+    torch.save({}, path)
+    return str(path)
+
+
+def test_pointwise_conv_uses_weight_norm_weights():
+    conv = weight_normed_synthesizer().tts_model.decoder.pre
+    x = torch.randn(2, conv.in_channels, 11)
+
+    with torch.no_grad():
+        assert torch.allclose(PointwiseConv1d(conv)(x), conv(x), atol=1e-5)
+
+
+def test_int8_matches_fp32_and_reuses_saved_model(checkpoint_path, tmp_path, monkeypatch):
+    reference = weight_normed_synthesizer()
+    probe = model_quantization.make_parity_probes(reference)['glowtts']
+
+    synthesizer = weight_normed_synthesizer()
+    assert optimize_synthesizer(synthesizer, 'int8', {'glowtts': checkpoint_path}, str(tmp_path / "cache")) == 'int8'
+    assert model_quantization.mel_parity_error(probe(reference.tts_model), probe(synthesizer.tts_model)) \
+        < model_quantization.INT8_MEL_TOLERANCE
+    # 양자화 결과는 모델 폴더가 아닌 캐시 폴더에 state_dict로만 저장
+    assert os.listdir(os.path.dirname(checkpoint_path)) == ["best_model.pth"]
+    assert os.path.exists(model_quantization.quantized_artifact_path(checkpoint_path, str(tmp_path / "cache")))
+
+    # 다음 실행은 저장한 가중치를 적용하고 fp32 비교는 다시 하지 않음
+    def fail(reference, mel):
+        raise AssertionError("저장한 양자화 모델을 다시 검증함")
+
+    monkeypatch.setattr(model_quantization, 'mel_parity_error', fail)
+    restarted = weight_normed_synthesizer()
+    assert optimize_synthesizer(restarted, 'int8', {'glowtts': checkpoint_path}, str(tmp_path / "cache")) == 'int8'
+    assert torch.equal(torch.from_numpy(probe(restarted.tts_model)), torch.from_numpy(probe(synthesizer.tts_model)))
+
+
+def test_int8_over_tolerance_keeps_fp32_and_is_not_retried(checkpoint_path, tmp_path, monkeypatch):
+    synthesizer = weight_normed_synthesizer()
+    probe = model_quantization.make_parity_probes(synthesizer)['glowtts']
+    cache_dir = str(tmp_path / "cache")
+
+    model = synthesizer.tts_model
+    assert optimize_model(model, 'int8', checkpoint_path, cache_dir, probe, tolerance=0.0) is model
+    assert model_quantization.load_quantization_record(checkpoint_path, cache_dir)['state_dict'] is None
+
+    # 검증 실패 기록이 있으면 다음 실행에서 다시 양자화하지 않음
+    def fail(model):
+        raise AssertionError("검증에 실패한 모델을 다시 양자화함")
+
+    monkeypatch.setattr(model_quantization, 'quantize_int8', fail)
+    assert optimize_model(model, 'int8', checkpoint_path, cache_dir, probe, tolerance=0.0) is model
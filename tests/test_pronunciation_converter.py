@@ -0,0 +1,86 @@
+"""
+사전에 없는 영어 단어의 규칙 기반 발음 변환을 기대 결과 표와 비교
+"""
+import pytest
+
+from pronunciation_converter import EnglishToKoreanPronunciation
+
+# 규칙 기반 변환 기대 결과 (사전에 없는 단어, 최장 일치 우선)
+PHONETIC_GOLDEN = {
+    'sing': 'ㅅ잉', 'singer': 'ㅅ잉어', 'thinking': 'ㅅ이ㄴㅋ잉',  # 'ing' > 'ng'
+    'judge': 'ㅈ우지', 'watch': '와치',  # 'dge' > 'ge', 'tch' > 'ch'
+    'nation': 'ㄴ아션', 'partial': 'ㅍ아ㄹ셜', 'special': 'ㅅㅍ에셜',
+    'tough': 'ㅌ어프', 'check': '치에ㅋ', 'queen': '큐이ㄴ', 'knife': 'ㄴ이ㅍ에',
+    'climb': 'ㅋㄹ이ㅁ', 'doubt': 'ㄷ아우ㅌ', 'sea': 'ㅅ이', 'pie': 'ㅍ아이',
+    'moon': 'ㅁ우ㄴ', 'saw': 'ㅅ오', 'boy': 'ㅂ오이', 'gem': '지ㅁ', 'giant': '지아ㄴㅌ',
+    'played': 'ㅍㄹ에이드', 'walked': 'ㅇ아ㄹㅋ드', 'quickly': '큐이ㅋ리',
+    'careful': 'ㅋ아ㄹ에풀', 'useless': '우ㅅ에레스', 'kindness': 'ㅋ이ㄴㄷ네스',
+    'strongest': 'ㅅㅌㄹ오ㅇ에스트', 'jumped': 'ㅈ우ㅁㅍ드', 'cycle': '시ㅋㄹ에',
+}
+
+
+@pytest.fixture(scope='module')
+def converter():
+    return EnglishToKoreanPronunciation()
+
+
+def test_phonetic_rules_match_golden(converter):
+    mismatches = [(word, expected, converter.advanced_phonetic_conversion(word))
+                  for word, expected in PHONETIC_GOLDEN.items()
+                  if converter.advanced_phonetic_conversion(word) != expected]
+
+    assert mismatches == []
+
+
+
+def test_contractions_change_rebuilds_pattern():
+    converter = EnglishToKoreanPronunciation()
+    with pytest.raises(TypeError):
+        converter.contractions["'cause"] = "코즈"  # 직접 수정하면 정규식과 어긋나므로 막음
+
+    converter.contractions = dict(converter.contractions, **{"'Cause": "코즈"})
+    assert converter.handle_contractions("'cause I'm late") == "코즈 아이 앰 late"
+
+    converter.add_contraction("'til", "틸")
+    assert converter.handle_contractions("wait 'til noon") == "wait 틸 noon"
+
+
+@pytest.mark.parametrize('processes', [None, 2])
+def test_convert_batch_fills_word_cache(processes):
+    converter = EnglishToKoreanPronunciation(word_cache_size=3)
+    texts = ["Hello judge!", "Sing a song, queen."]
+
+    results = converter.convert_batch(texts, processes=processes, pool_min_words=1)
+
+    assert results == [converter.convert_text(text) for text in texts]
+    assert len(converter.word_cache) == 3
+    assert all(converter.word_cache[word] == converter._convert_word_uncached(word) for word in converter.word_cache)
+
+
+def test_empty_dictionary_pronunciation_is_a_hit():
+    converter = EnglishToKoreanPronunciation()
+    converter.add_custom_word("uh", "")
+
+    assert converter.convert_word("uh") == ""
+    assert converter.convert_word("uh") == ""  # 캐시 적중도 같은 결과
+
+
+@pytest.mark.parametrize('text', ["It's thinking about the queen's special watch, isn't it?",
+                                  "I'm gonna sing."])
+def test_trace_matches_conversion_and_confidence(text):
+    converter = EnglishToKoreanPronunciation()
+    converter.add_contraction("gonna", "going to")  # 영어로 확장되는 축약형도 단어마다 변환
+    trace = converter.trace_text(text)
+
+    assert trace['converted'] == converter.convert_text(text)
+    for word in trace['words']:
+        assert converter.get_pronunciation_confidence(word['word']) == word['confidence']
+        if word['source'] != 'contraction':
+            assert word['converted'] == converter.convert_word(word['word'])
+
+
+def test_confidence_does_not_convert():
+    converter = EnglishToKoreanPronunciation()
+
+    assert converter.get_pronunciation_confidence("thinking") == 0.8
+    assert not converter.word_cache and converter.word_cache_misses == 0
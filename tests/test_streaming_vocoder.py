@@ -0,0 +1,56 @@
+"""
+구간별 스트리밍 보코딩을 이어 붙인 결과와 전체 보코딩 비교 (HiFi-GAN 형태 무작위 합성곱 보코더 사용)
+"""
+import numpy as np
+import pytest
+import torch
+
+from tts_model_loader import TTSModelLoader
+from streaming_vocoder import StreamingVocoder, measure_receptive_field_frames, verify_streaming_vocoder
+from bench.standin_model import STANDIN_HOP_LENGTH, STANDIN_NUM_MELS, StandInHiFiGAN, attach_standin
+
+
+@pytest.fixture(scope='module')
+def vocoder():
+    torch.manual_seed(0)
+    return StandInHiFiGAN().eval()
+
+
+@pytest.fixture(scope='module')
+def mel():
+    return np.random.default_rng(0).standard_normal((STANDIN_NUM_MELS, 150)).astype(np.float32)
+
+
+@pytest.mark.parametrize('chunk_frames, crossfade_frames', [(16, 2), (32, 2), (40, 0), (200, 2)])
+def test_stitched_stream_matches_full_vocoding(vocoder, mel, chunk_frames, crossfade_frames):
+    result = verify_streaming_vocoder(vocoder, mel, STANDIN_HOP_LENGTH, chunk_frames,
+                                      crossfade_frames=crossfade_frames, tolerance=1e-4)
+
+    assert result['length_match']
+    assert result['max_abs_diff'] <= 1e-4
+    assert result['blocks'] == max(1, -(-mel.shape[1] // chunk_frames))
+
+
+def test_first_block_covers_only_first_chunk(vocoder, mel):
+    streamer = StreamingVocoder(vocoder, STANDIN_HOP_LENGTH, chunk_frames=32, crossfade_frames=2)
+    first_block = next(streamer.stream(mel))
+
+    # 첫 블록은 inference 왼쪽 패딩 출력 + 첫 구간 (크로스페이드 꼬리는 다음 블록으로)
+    assert len(first_block) == (streamer.inference_padding + 32) * STANDIN_HOP_LENGTH
+    assert measure_receptive_field_frames(vocoder, STANDIN_HOP_LENGTH) >= 1
+
+
+def test_streamed_sentence_does_not_fill_synthesis_cache(tmp_path):
+    loader = attach_standin(TTSModelLoader(None, cache_dir=str(tmp_path), vocoder_chunk_frames=16,
+                                           apply_threads=False))
+    loader.synthesis_cache.bind("standin")
+    loader.synthesizer.tts_model.inference_noise_scale = 0.0
+    text = "안녕하세요."
+    assert loader.use_streaming_vocoder()
+
+    assert len(np.concatenate(list(loader._stream_normalized(text)))) > 0
+    assert loader.synthesis_cache.get(text) is None
+
+    # 스트리밍 뒤에도 synthesize 경로는 처음 합성과 같은 파형 (문장 뒤 무음 포함)
+    np.testing.assert_array_equal(loader._synthesize_normalized(text),
+                                  np.asarray(loader.synthesizer.tts(text), dtype=np.float32))
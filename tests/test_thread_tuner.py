@@ -0,0 +1,22 @@
+"""
+잘못된 스레드 수 환경 변수는 시작을 막지 않고 자동 조정 결과로 대체되는지 확인
+"""
+import json
+
+import thread_tuner
+
+
+def test_malformed_env_falls_back_to_tuned_setting(tmp_path, monkeypatch):
+    settings_path = tmp_path / "threads.json"
+    settings_path.write_text(json.dumps({thread_tuner.profile_key(): {'intra_op': 3, 'inter_op': 1}}),
+                             encoding='utf-8')
+
+    monkeypatch.setenv(thread_tuner.THREADS_ENV, "four")
+    assert thread_tuner.get_thread_setting(str(settings_path)) == {'intra_op': 3, 'inter_op': 1, 'source': 'tuned'}
+
+    monkeypatch.setenv(thread_tuner.THREADS_ENV, "0")
+    assert thread_tuner.get_thread_setting(str(tmp_path / "missing.json")) is None
+
+    monkeypatch.setenv(thread_tuner.THREADS_ENV, "2")
+    monkeypatch.setenv(thread_tuner.INTEROP_THREADS_ENV, "two")
+    assert thread_tuner.get_thread_setting(str(settings_path)) == {'intra_op': 2, 'inter_op': None, 'source': 'env'}
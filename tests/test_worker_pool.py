@@ -0,0 +1,52 @@
+"""
+워커 프로세스가 죽었을 때 결과 대기가 멈추지 않고 남은 문장을 실패 처리하는지 확인 (대체 모델 사용)
+"""
+import os
+import time
+
+import pytest
+
+from tts_model_loader import TTSModelLoader
+from worker_pool import SynthesisWorkerPool
+from bench.standin_model import attach_standin
+
+pytestmark = pytest.mark.skipif(not hasattr(os, 'fork'), reason="fork가 필요한 워커 풀")
+
+
+@pytest.fixture
+def loader():
+    loader = attach_standin(TTSModelLoader(None, use_cache=False, apply_threads=False))
+    synthesizer_tts = loader.synthesizer.tts
+    parent_pid = os.getpid()
+
+    def tts(text, speaker_idx=None, speaker_wav=None):
+        if text == "종료." and os.getpid() != parent_pid:
+            os._exit(3)  # 워커 비정상 종료
+        return synthesizer_tts(text, speaker_idx, speaker_wav)
+
+    loader.synthesizer.tts = tts
+    yield loader
+    loader.stop_worker_pool()
+
+
+def test_dead_worker_fails_outstanding_tasks(loader):
+    pool = SynthesisWorkerPool(loader, num_workers=1)
+    loader.worker_pool = pool
+
+    start = time.perf_counter()
+    wavs, _ = pool.synthesize_normalized(["안녕.", "종료.", "반가워."])
+
+    assert time.perf_counter() - start < 30
+    assert wavs[0] is not None and wavs[1] is None and wavs[2] is None
+    assert pool.broken
+    with pytest.raises(RuntimeError):
+        pool.synthesize_normalized(["안녕."])
+
+
+def test_loader_falls_back_when_pool_dies(loader):
+    loader.start_worker_pool(num_workers=1)
+
+    wavs = loader.synthesize_normalized_batch(["안녕.", "종료.", "반가워."])
+
+    assert loader.worker_pool.broken
+    assert all(wav is not None for wav in wavs)
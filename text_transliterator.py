@@ -0,0 +1,155 @@
+"""
+한글 음역 변환 모듈 (알파벳/자모/문장부호를 한글 읽기로 변환)
+"""
+import re
+import time
+
+# 영어 알파벳 → 한글 읽기
+ALPHABET_MAP = {
+    'a': '에이', 'b': '비', 'c': '씨', 'd': '디', 'e': '이', 'f': '에프',
+    'g': '쥐', 'h': '에이치', 'i': '아이', 'j': '제이', 'k': '케이', 'l': '엘',
+    'm': '엠', 'n': '엔', 'o': '오', 'p': '피', 'q': '큐', 'r': '알',
+    's': '에스', 't': '티', 'u': '유', 'v': '브이', 'w': '더블유', 'x': '엑스',
+    'y': '와이', 'z': '지'
+}
+
+# 한글 호환 자모 → 자모 이름
+JAMO_MAP = {
+    'ㄱ': '기역', 'ㄴ': '니은', 'ㄷ': '디귿', 'ㄹ': '리을', 'ㅁ': '미음', 'ㅂ': '비읍',
+    'ㅅ': '시옷', 'ㅇ': '이응', 'ㅈ': '지읒', 'ㅊ': '치읓', 'ㅋ': '키읔', 'ㅌ': '티읕',
+    'ㅍ': '피읖', 'ㅎ': '히읗', 'ㄲ': '쌍기역', 'ㄸ': '쌍디귿', 'ㅃ': '쌍비읍',
+    'ㅆ': '쌍시옷', 'ㅉ': '쌍지읒', 'ㄳ': '기역시옷', 'ㄵ': '니은지읒', 'ㄶ': '니은히읗',
+    'ㄺ': '리을기역', 'ㄻ': '리을미음', 'ㄼ': '리을비읍', 'ㄽ': '리을시옷', 'ㄾ': '리을티읕',
+    'ㄿ': '리을피읍', 'ㅀ': '리을히읗', 'ㅄ': '비읍시옷',
+    'ㅏ': '아', 'ㅑ': '야', 'ㅓ': '어', 'ㅕ': '여', 'ㅗ': '오', 'ㅛ': '요', 'ㅜ': '우',
+    'ㅠ': '유', 'ㅡ': '으', 'ㅣ': '이', 'ㅐ': '애', 'ㅒ': '얘', 'ㅔ': '에', 'ㅖ': '예',
+    'ㅘ': '와', 'ㅙ': '왜', 'ㅚ': '외', 'ㅝ': '워', 'ㅞ': '웨', 'ㅟ': '위', 'ㅢ': '의'
+}
+
+# 단독 문장부호 → 한글 읽기
+PUNCTUATION_MAP = {'!': '느낌표', '?': '물음표', '.': '마침표'}
+
+
+def character_class(chars):
+    """문자 집합 → 정규식 문자 클래스 본문 (연속 코드 포인트는 a-z 형태 범위로)"""
+    codes = sorted(ord(char) for char in chars)
+    parts = []
+    start = previous = codes[0]
+    for code in codes[1:] + [None]:
+        if code is not None and code == previous + 1:
+            previous = code
+            continue
+        if previous == start:
+            parts.append(re.escape(chr(start)))
+        else:
+            parts.append(f'{re.escape(chr(start))}-{re.escape(chr(previous))}')
+        if code is not None:
+            start = previous = code
+    return ''.join(parts)
+
+
+class Transliterator:
+    """여러 치환 규칙을 한 번에 적용하는 변환기
+
+    모든 규칙을 하나의 정규식으로 합쳐 텍스트를 한 번만 훑고,
+    매칭된 부분만 사전 조회 콜백으로 치환합니다.
+    """
+
+    def __init__(self, mapping, ignore_case=False):
+        self.mapping = dict(mapping)
+        if ignore_case:
+            for key, value in list(self.mapping.items()):
+                self.mapping.setdefault(key.upper(), value)
+                self.mapping.setdefault(key.lower(), value)
+
+        self.single_char = all(len(key) == 1 for key in self.mapping)
+        if self.single_char:
+            # 한 글자 규칙은 (연속 코드 포인트를 범위로 줄인) 문자 클래스 하나로 split한 뒤 글자마다 사전 조회
+            # (자모 51자는 U+3131~U+3163 한 범위, 매칭마다 콜백을 부르는 sub보다 가벼움)
+            self.pattern = re.compile(f'([{character_class(self.mapping)}])')
+        else:
+            # 긴 키가 먼저 매칭되도록 길이 역순 정렬
+            keys = sorted(self.mapping, key=len, reverse=True)
+            self.pattern = re.compile('|'.join(re.escape(key) for key in keys))
+            self._replace = lambda match: self.mapping[match.group(0)]
+
+    def __call__(self, text):
+        if not self.single_char:
+            return self.pattern.sub(self._replace, text)
+
+        # split 결과의 홀수 번째가 매칭된 글자
+        parts = self.pattern.split(text)
+        if len(parts) == 1:
+            return text
+        mapping = self.mapping
+        parts[1::2] = [mapping[char] for char in parts[1::2]]
+        return ''.join(parts)
+
+
+# 모든 정규화기에서 공유하는 변환기
+alphabet_transliterator = Transliterator(ALPHABET_MAP, ignore_case=True)
+jamo_transliterator = Transliterator(JAMO_MAP)
+punctuation_transliterator = Transliterator(PUNCTUATION_MAP)
+
+
+def alphabet_text(text):
+    """영어 알파벳을 한글 읽기로 변환"""
+    return alphabet_transliterator(text)
+
+
+def jamo_text(text):
+    """단독 자모를 자모 이름으로 변환"""
+    return jamo_transliterator(text)
+
+
+def punctuation_text(text):
+    """문장부호를 한글 읽기로 변환"""
+    return punctuation_transliterator(text)
+
+
+def benchmark_transliteration(repeats=20, paragraph_count=200):
+    """기존 글자별 re.sub 방식과 단일 패스 방식의 글자당 처리 비용 비교"""
+    paragraphs = {
+        # 변환 대상이 섞인 문단
+        'mixed': ("간장 공장 공장장은 강 공장장이고 된장 공장 공장장은 공 공장장이다. "
+                  "SCE-TTS로 ㅋㅋ 합성한 AI 음성입니다! ㄱㄴㄷ ABC xyz. ") * paragraph_count,
+        # 변환 대상이 없는 일반 한국어 문단
+        'korean': ("오늘 날씨가 정말 좋네요. 내일 다시 만나서 이야기해요! "
+                   "경찰청 철창살은 외철창살이냐 쌍철창살이냐. ") * paragraph_count,
+    }
+
+    def legacy_alphabet(text):
+        for eng, kor in ALPHABET_MAP.items():
+            text = re.sub(f'({eng}|{eng.upper()})', kor, text)
+        return text
+
+    def legacy_jamo(text):
+        for jamo, name in JAMO_MAP.items():
+            text = re.sub(jamo, name, text)
+        return text
+
+    def measure(fn, paragraph):
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn(paragraph)
+            best = min(best, time.perf_counter() - start)
+        return best / len(paragraph) * 1e9  # 글자당 나노초
+
+    print("📊 음역 변환 벤치마크 (ns/글자)")
+
+    results = {}
+    for corpus, paragraph in paragraphs.items():
+        for name, legacy, single_pass in (('alphabet_text', legacy_alphabet, alphabet_text),
+                                          ('jamo_text', legacy_jamo, jamo_text)):
+            assert legacy(paragraph) == single_pass(paragraph)
+            result = {'legacy': measure(legacy, paragraph),
+                      'single_pass': measure(single_pass, paragraph)}
+            results[f"{corpus}/{name}"] = result
+            print(f"   [{corpus}] {name}: 기존 {result['legacy']:.1f} → 단일 패스 {result['single_pass']:.1f}")
+
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_transliteration()
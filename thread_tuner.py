@@ -0,0 +1,232 @@
+"""
+추론 스레드 자동 조정 모듈 (호스트별 최적 intra-op / inter-op 스레드 수 측정 및 적용)
+"""
+import os
+import sys
+import json
+import time
+import hashlib
+import platform
+import subprocess
+
+import torch
+
+from synthesis_cache import DEFAULT_CACHE_DIR
+
+SETTINGS_PATH = os.path.join(DEFAULT_CACHE_DIR, "thread_settings.json")
+
+# 스레드 수 직접 지정용 환경 변수 (저장된 설정보다 우선)
+THREADS_ENV = 'TTS_NUM_THREADS'
+INTEROP_THREADS_ENV = 'TTS_NUM_INTEROP_THREADS'
+
+# 측정용 고정 문장 (짧은 문장 위주의 실제 사용 패턴)
+TUNING_SENTENCES = [
+    "안녕하세요.",
+    "오늘 날씨가 정말 좋네요.",
+    "저는 음성 합성 시스템입니다.",
+    "간장 공장 공장장은 강 공장장이고 된장 공장 공장장은 공 공장장이다.",
+    "내일 다시 만나요!",
+    "경찰청 철창살은 외철창살이냐 쌍철창살이냐.",
+]
+
+_applied_settings = None
+
+
+def usable_cpu_count():
+    """현재 프로세스가 사용할 수 있는 CPU 수 (affinity 기준)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def cpu_model_name():
+    try:
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def host_profile():
+    """스레드 설정을 구분하는 호스트 정보"""
+    return {
+        'host': platform.node(),
+        'cpu': cpu_model_name(),
+        'logical_cpus': os.cpu_count() or 1,
+        'usable_cpus': usable_cpu_count(),
+        'torch': torch.__version__,
+    }
+
+
+def profile_key(profile=None):
+    profile = profile or host_profile()
+    return hashlib.sha256(json.dumps(profile, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+def load_settings(path=SETTINGS_PATH):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_setting(setting, path=SETTINGS_PATH):
+    """현재 호스트 프로필의 최적 설정 저장 (다른 프로필 설정은 유지)"""
+    settings = load_settings(path)
+    settings[profile_key(setting['profile'])] = setting
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(settings, f, indent=2, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+
+def read_thread_env(name):
+    """환경 변수의 스레드 수 (없으면 None, 양의 정수가 아니면 경고 후 None)"""
+    value = os.environ.get(name, '').strip()
+    if not value:
+        return None
+    try:
+        threads = int(value)
+        if threads > 0:
+            return threads
+    except ValueError:
+        pass
+    print(f"⚠️ {name} 값이 올바르지 않아 무시합니다: {value!r} (양의 정수)")
+    return None
+
+
+def get_thread_setting(path=SETTINGS_PATH):
+    """적용할 (intra-op, inter-op) 스레드 수와 출처 반환 (없으면 None)
+
+    환경 변수 값이 잘못되었으면 경고 후 자동 조정 결과(없으면 torch 기본값)를 사용합니다.
+    """
+    intra_op = read_thread_env(THREADS_ENV)
+    if intra_op is not None:
+        return {'intra_op': intra_op, 'inter_op': read_thread_env(INTEROP_THREADS_ENV), 'source': 'env'}
+
+    setting = load_settings(path).get(profile_key())
+    if setting:
+        return {'intra_op': setting['intra_op'], 'inter_op': setting['inter_op'], 'source': 'tuned'}
+    return None
+
+
+def set_threads(intra_op, inter_op=None):
+    """torch 스레드 수 설정 (inter-op은 병렬 작업 시작 후에는 바꿀 수 없어 실패 시 무시)"""
+    torch.set_num_threads(intra_op)
+    if inter_op:
+        try:
+            torch.set_num_interop_threads(inter_op)
+        except RuntimeError:
+            return False
+    return True
+
+
+def apply_thread_settings(path=SETTINGS_PATH):
+    """저장된 호스트별 설정(또는 환경 변수)을 프로세스당 한 번 적용"""
+    global _applied_settings
+    if _applied_settings is not None:
+        return _applied_settings
+
+    setting = get_thread_setting(path)
+    if setting is None:
+        _applied_settings = {}
+        return _applied_settings
+
+    interop_applied = set_threads(setting['intra_op'], setting['inter_op'])
+    _applied_settings = dict(setting, inter_op_applied=interop_applied)
+    print(f"🧵 torch 스레드 설정: intra-op {setting['intra_op']}, "
+          f"inter-op {setting['inter_op'] if interop_applied else torch.get_num_interop_threads()} "
+          f"({'환경 변수' if setting['source'] == 'env' else '자동 조정 결과'})")
+    return _applied_settings
+
+
+def candidate_configs(max_threads=None):
+    """측정할 (intra-op, inter-op) 조합: intra-op은 1, 2, 4, ... 사용 가능 코어 수"""
+    max_threads = max_threads or usable_cpu_count()
+    intra_ops = sorted({max_threads} | {2 ** i for i in range(max_threads.bit_length()) if 2 ** i <= max_threads})
+    return [(intra_op, inter_op) for intra_op in intra_ops for inter_op in (1, 2)
+            if inter_op == 1 or intra_op * inter_op <= max_threads]
+
+
+def measure_config(data_path, intra_op, inter_op, sentences=TUNING_SENTENCES, repeats=2):
+    """현재 프로세스에서 스레드 설정 후 합성 RTF 측정 (측정용 하위 프로세스에서 호출)"""
+    set_threads(intra_op, inter_op)
+
+    from tts_model_loader import TTSModelLoader
+    loader = TTSModelLoader(data_path, use_cache=False, apply_threads=False)
+    if not loader.load_models():
+        return None
+
+    normalized = [loader.normalize_text(sentence) for sentence in sentences]
+    loader.synthesizer.tts(normalized[0], None, None)  # 워밍업
+
+    best = float('inf')
+    samples = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        samples = sum(len(loader.synthesizer.tts(text, None, None)) for text in normalized)
+        best = min(best, time.perf_counter() - start)
+
+    return {'intra_op': intra_op, 'inter_op': inter_op, 'seconds': best,
+            'rtf': best / (samples / loader.synthesizer.output_sample_rate)}
+
+
+def tune_threads(data_path, configs=None, path=SETTINGS_PATH):
+    """스레드 조합별로 별도 프로세스에서 합성 속도를 측정하고 가장 빠른 설정을 저장"""
+    configs = configs or candidate_configs()
+    results = []
+
+    print(f"🔧 스레드 자동 조정 시작 ({len(configs)}개 조합, 사용 가능 CPU {usable_cpu_count()}개)")
+    for intra_op, inter_op in configs:
+        # inter-op 스레드는 프로세스당 한 번만 설정할 수 있으므로 조합마다 새 프로세스 사용
+        process = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), 'measure', data_path, str(intra_op), str(inter_op)],
+            capture_output=True, text=True)
+        try:
+            result = json.loads(process.stdout.strip().splitlines()[-1])
+        except (IndexError, ValueError):
+            result = None
+
+        if result is None:
+            print(f"   ⚠️ intra-op {intra_op}, inter-op {inter_op}: 측정 실패")
+            continue
+        results.append(result)
+        print(f"   intra-op {intra_op:2d}, inter-op {inter_op}: RTF {result['rtf']:.3f}")
+
+    if not results:
+        print("❌ 측정된 설정이 없어 저장하지 않습니다.")
+        return None
+
+    best = min(results, key=lambda result: result['rtf'])
+    setting = {
+        'profile': host_profile(),
+        'intra_op': best['intra_op'],
+        'inter_op': best['inter_op'],
+        'rtf': best['rtf'],
+        'default_rtf': next((r['rtf'] for r in results if r['intra_op'] == usable_cpu_count()
+                             and r['inter_op'] == 1), None),
+        'results': results,
+        'tuned_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+    save_setting(setting, path)
+    print(f"✅ 최적 설정 저장: intra-op {setting['intra_op']}, inter-op {setting['inter_op']} "
+          f"(RTF {setting['rtf']:.3f})")
+    return setting
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else 'tune'
+
+    if command == 'measure':
+        print(json.dumps(measure_config(sys.argv[2], int(sys.argv[3]), int(sys.argv[4]))))
+    elif command == 'show':
+        print(json.dumps(load_settings().get(profile_key()), indent=2, ensure_ascii=False))
+    else:
+        tune_threads(sys.argv[2] if len(sys.argv) > 2 else "data")
@@ -0,0 +1,199 @@
+"""
+음성 번역 파이프라인 모듈 (단계별 생산자/소비자 실행)
+"""
+import time
+import queue
+import threading
+from collections import deque
+
+# 단계 사이에 전달되는 종료 신호
+STOP = object()
+
+
+class PipelineStage:
+    """하나의 작업자 스레드와 입력 큐를 가진 파이프라인 단계"""
+
+    def __init__(self, name, func, input_queue=None, output_queue=None, window=50):
+        self.name = name
+        self.func = func
+        self.input_queue = input_queue
+        self.output_queue = output_queue
+        self.thread = None
+
+        self.processed = 0
+        self.dropped = 0
+        self.latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def start(self, stop_event):
+        self.thread = threading.Thread(target=self.run, args=(stop_event,),
+                                       name=f"pipeline-{self.name}", daemon=True)
+        self.thread.start()
+
+    def run(self, stop_event):
+        """입력 큐(없으면 종료 신호 전까지 계속 생성)에서 항목을 받아 처리 후 다음 단계로 전달
+
+        입력이 있는 단계는 종료 신호(STOP)를 받을 때까지 남은 항목을 모두 처리합니다.
+        """
+        while True:
+            if self.input_queue is not None:
+                item = self.input_queue.get()
+                if item is STOP:
+                    self._forward(STOP)
+                    break
+            else:
+                if stop_event.is_set():
+                    self._forward(STOP)
+                    break
+                item = {}
+
+            start = time.perf_counter()
+            try:
+                result = self.func(item)
+            except Exception as e:
+                print(f"❌ [{self.name}] 처리 오류: {e}")
+                result = None
+            elapsed = time.perf_counter() - start
+
+            with self._lock:
+                self.latencies.append(elapsed)
+                if result is None:
+                    self.dropped += 1
+                else:
+                    self.processed += 1
+
+            if result is STOP:
+                stop_event.set()
+                self._forward(STOP)
+                break
+
+            if result is not None:
+                result.setdefault('timings', {})[self.name] = elapsed
+                self._forward(result)
+
+    def _forward(self, item):
+        """다음 단계로 전달 (큐가 가득 차면 다음 단계가 비울 때까지 대기)"""
+        if self.output_queue is not None:
+            self.output_queue.put(item)
+
+    def get_stats(self):
+        with self._lock:
+            latencies = list(self.latencies)
+            return {
+                'queue_depth': self.input_queue.qsize() if self.input_queue is not None else 0,
+                'processed': self.processed,
+                'dropped': self.dropped,
+                'last_latency': latencies[-1] if latencies else 0.0,
+                'avg_latency': sum(latencies) / len(latencies) if latencies else 0.0,
+                'max_latency': max(latencies) if latencies else 0.0,
+            }
+
+
+class TranslationPipeline:
+    """음성 인식 → 번역 → 발음 변환 → 합성 → 재생 단계를 동시에 실행하는 파이프라인
+
+    각 단계는 전용 스레드에서 실행되며, 단계 사이의 큐 크기를 제한해
+    뒤 단계가 밀리면 앞 단계가 자연스럽게 기다리도록 합니다.
+    """
+
+    def __init__(self, translator, queue_size=2):
+        self.translator = translator
+        self.stop_event = threading.Event()
+        self.utterance_count = 0
+
+        stage_funcs = [
+            ('listen', self.listen),
+            ('translate', self.translate),
+            ('pronounce', self.pronounce),
+            ('synthesize', self.synthesize),
+            ('play', self.play),
+        ]
+
+        queues = [queue.Queue(maxsize=queue_size) for _ in range(len(stage_funcs) - 1)]
+        self.stages = []
+        for i, (name, func) in enumerate(stage_funcs):
+            input_queue = queues[i - 1] if i > 0 else None
+            output_queue = queues[i] if i < len(queues) else None
+            self.stages.append(PipelineStage(name, func, input_queue, output_queue))
+
+    # 단계별 처리 함수
+    def listen(self, item):
+        korean_text = self.translator.audio_handler.listen_korean()
+        if korean_text is None:
+            return None
+
+        if korean_text.lower() in ['quit', 'exit', '종료', '끝', '그만']:
+            print("👋 번역기를 종료합니다.")
+            return STOP
+
+        self.utterance_count += 1
+        return {'id': self.utterance_count, 'korean': korean_text, 'created': time.perf_counter()}
+
+    def translate(self, item):
+        english_text = self.translator.translate_to_english(item['korean'])
+        if not english_text:
+            print("❌ 번역에 실패했습니다.")
+            return None
+        item['english'] = english_text
+        return item
+
+    def pronounce(self, item):
+        item['hangul'] = self.translator.convert_english_to_hangul_pronunciation(item['english'])
+        return item
+
+    def synthesize(self, item):
+        if self.translator.models_loaded:
+            item['wav'] = self.translator.tts_loader.synthesize(item['hangul'])
+        else:
+            item['wav'] = None
+        return item
+
+    def play(self, item):
+        if item['wav'] is not None:
+            self.translator.audio_handler.play_audio(item['wav'], 22050)
+            print(f"🔊 음성 합성 완료: {item['hangul']}")
+        else:
+            print("🎵 TTS 시뮬레이션 모드")
+            print(f"🔊 텍스트 출력: {item['hangul']}")
+
+        total = time.perf_counter() - item['created']
+        print(f"⏱️ [{item['id']}] 전체 지연: {total:.2f}초")
+        return item
+
+    # 실행 제어
+    def start(self):
+        self.stop_event.clear()
+        for stage in self.stages:
+            stage.start(self.stop_event)
+
+    def stop(self):
+        self.stop_event.set()
+
+    def join(self, timeout=None):
+        for stage in self.stages:
+            if stage.thread is not None:
+                stage.thread.join(timeout)
+
+    def run(self):
+        """종료 명령이나 Ctrl+C가 들어올 때까지 파이프라인 실행"""
+        self.start()
+        try:
+            while not self.stop_event.is_set():
+                time.sleep(0.2)
+        except KeyboardInterrupt:
+            print("\n👋 파이프라인을 종료합니다.")
+            self.stop()
+
+        # 마지막 재생 단계가 끝날 때까지 잠시 대기 (마이크 대기 중인 단계는 데몬으로 종료)
+        self.stages[-1].thread.join(timeout=30)
+        self.print_stats()
+
+    def get_stats(self):
+        """단계별 큐 깊이와 지연 시간 통계 반환"""
+        return {stage.name: stage.get_stats() for stage in self.stages}
+
+    def print_stats(self):
+        print("\n📊 파이프라인 단계별 통계")
+        for name, stats in self.get_stats().items():
+            print(f"   {name:<11} 대기 {stats['queue_depth']}개 | 처리 {stats['processed']}개 | "
+                  f"평균 {stats['avg_latency']:.2f}초 | 최대 {stats['max_latency']:.2f}초")
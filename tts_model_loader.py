@@ -2,24 +2,99 @@
 TTS 모델 로더 모듈 (개선된 버전)
 """
 import os
-import json
-import torch
+import re
+import time
+import numpy as np
+
+from synthesis_cache import SynthesisCache, fingerprint_model_files
+from batch_synthesis import BatchSynthesizer
+from streaming_vocoder import StreamingVocoder
+from worker_pool import SynthesisWorkerPool
+from thread_tuner import apply_thread_settings
+from instrumentation import metrics
+from text_transliterator import alphabet_text
+from korean_normalizer import KoreanNormalizer
+from model_registry import model_registry
+from model_index import get_directory_index
+from checkpoint_catalog import CheckpointCatalog, parse_checkpoint_policy
+from config_resolver import ConfigResolver, config_resolver
+from model_quantization import INFERENCE_MODES, optimize_synthesizer
+from model_export import BACKENDS, ExportedSynthesizer, default_export_dir, export_synthesizer, has_export
 
 
 class TTSModelLoader:
     """TTS 모델 로딩 및 초기화를 담당하는 클래스"""
 
-    def __init__(self, data_path):
+    def __init__(self, data_path, use_cache=True, cache_dir=None, checkpoint_policy='best',
+                 inference_mode='fp32', backend='torch', export_dir=None, vocoder_chunk_frames=None,
+                 apply_threads=True, use_g2p=False):
+        """checkpoint_policy: 'best', 'latest', 스텝 번호, 또는 모델별 dict
+        (예: {'glowtts': 'best', 'hifigan': 293026})
+        inference_mode: 'fp32', 'int8'(동적 양자화), 'bf16'(지원 CPU에서만)
+        backend: 'torch'(TTS Synthesizer), 'torchscript', 'onnx'(내보낸 그래프 실행)
+        vocoder_chunk_frames: 지정하면 synthesize_stream이 멜을 이 길이 구간으로 나누어 보코딩
+        apply_threads: thread_tuner로 저장한 호스트별 torch 스레드 설정 적용 여부
+        use_g2p: g2pK 정규화(발음 변환 + 숫자/영어 읽기, 문장/형태소 분석 캐시) 사용 여부
+        """
+        if inference_mode not in INFERENCE_MODES:
+            raise ValueError(f"지원하지 않는 추론 모드: {inference_mode}")
+        if backend not in BACKENDS:
+            raise ValueError(f"지원하지 않는 백엔드: {backend}")
+        if backend != 'torch' and inference_mode != 'fp32':
+            raise ValueError("내보낸 그래프 백엔드는 fp32 추론 모드만 지원합니다.")
+        if isinstance(checkpoint_policy, dict):
+            checkpoint_policy = {model_type: parse_checkpoint_policy(policy)
+                                 for model_type, policy in checkpoint_policy.items()}
+        else:
+            checkpoint_policy = parse_checkpoint_policy(checkpoint_policy)
+
+        # 호스트별 최적 스레드 수 적용 (프로세스당 한 번)
+        if apply_threads:
+            apply_thread_settings()
+
         self.data_path = data_path
+        self.cache_dir = cache_dir
+        self.checkpoint_policy = checkpoint_policy
+        self.inference_mode = inference_mode
+        self.active_inference_mode = None
+        self.backend = backend
+        self.export_dir = export_dir
+        self.selected_checkpoints = {}
         self.glowtts_path = None
         self.hifigan_path = None
         self.glowtts_config = None
         self.hifigan_config = None
         self.glowtts_checkpoint = None
         self.hifigan_checkpoint = None
+        self.model_files = None
         self.models_loaded = False
         self.use_synthesizer = False
         self.synthesizer = None
+        self.batch_synthesizer = None
+        self.vocoder_chunk_frames = vocoder_chunk_frames
+        self.streaming_vocoder = None
+        self.worker_pool = None
+
+        # g2pK 정규화기 (g2pK가 없으면 기본 정규화 사용)
+        self.korean_normalizer = KoreanNormalizer() if use_g2p else None
+
+        # 반복 문장 합성 결과 캐시
+        self.synthesis_cache = SynthesisCache(cache_dir) if use_cache else None
+
+        # 경로 수정된 런타임 config (원본 해시 기준으로 프로세스 간 공유)
+        self.config_resolver = ConfigResolver(cache_dir) if cache_dir else config_resolver
+
+    @classmethod
+    def preload(cls, data_path):
+        """모델 체크포인트를 백그라운드에서 미리 로드 (load_models 호출 전에 사용)"""
+        loader = cls(data_path, use_cache=False)
+        if not loader.find_model_paths():
+            return None
+
+        paths = [loader.find_checkpoint_files(loader.glowtts_path)['checkpoint'],
+                 loader.find_checkpoint_files(loader.hifigan_path)['checkpoint']]
+        print("⏳ TTS 체크포인트 백그라운드 로드 시작")
+        return model_registry.preload(paths)
 
     def find_model_paths(self):
         """모델 경로 자동 탐지"""
@@ -27,21 +102,19 @@ class TTSModelLoader:
             return False
 
         try:
-            # Glow-TTS 모델 경로 찾기
-            glowtts_base = os.path.join(self.data_path, "glowtts-v2")
-            if os.path.exists(glowtts_base):
-                for folder in os.listdir(glowtts_base):
-                    if folder.startswith("glowtts-v2-"):
-                        self.glowtts_path = os.path.join(glowtts_base, folder)
-                        break
-
-            # HiFi-GAN 모델 경로 찾기
-            hifigan_base = os.path.join(self.data_path, "hifigan-v2")
-            if os.path.exists(hifigan_base):
-                for folder in os.listdir(hifigan_base):
-                    if folder.startswith("hifigan-v2-"):
-                        self.hifigan_path = os.path.join(hifigan_base, folder)
-                        break
+            # 학습 실행 폴더 중 정책에 맞는 체크포인트가 있는 최신 실행 선택
+            for model_type in ('glowtts', 'hifigan'):
+                base_dir = os.path.join(self.data_path, f"{model_type}-v2")
+                if not os.path.exists(base_dir):
+                    continue
+
+                catalog = CheckpointCatalog(base_dir, f"{model_type}-v2-", self.get_index(base_dir))
+                run, checkpoint = catalog.select(self.get_checkpoint_policy(model_type))
+                if run is None:
+                    continue
+
+                setattr(self, f"{model_type}_path", run['path'])
+                self.selected_checkpoints[run['path']] = checkpoint['path']
 
             print(f"📁 Glow-TTS 경로: {self.glowtts_path}")
             print(f"📁 HiFi-GAN 경로: {self.hifigan_path}")
@@ -52,6 +125,20 @@ class TTSModelLoader:
             print(f"❌ 경로 탐지 실패: {e}")
             return False
 
+    def get_checkpoint_policy(self, model_type):
+        """모델별 체크포인트 선택 정책"""
+        if isinstance(self.checkpoint_policy, dict):
+            return self.checkpoint_policy.get(model_type, 'best')
+        return self.checkpoint_policy
+
+    def get_index(self, path):
+        """경로를 포함하는 디렉토리 색인 반환 (data_path 색인 우선)"""
+        if self.data_path and os.path.exists(self.data_path):
+            index = get_directory_index(self.data_path)
+            if index.contains(path):
+                return index
+        return get_directory_index(path)
+
     def find_checkpoint_files(self, model_path):
         """체크포인트 파일들 찾기 (중복 config 파일 제외)"""
         files = {'checkpoint': None, 'config': None}
@@ -62,20 +149,26 @@ class TTSModelLoader:
 
             print(f"   📁 스캔 중: {model_path}")
 
-            for root, dirs, filenames in os.walk(model_path):
-                for filename in filenames:
-                    filepath = os.path.join(root, filename)
-
-                    # 체크포인트 파일들 찾기
-                    if filename.endswith(('.pth', '.pt', '.ckpt', '.pth.tar')):
-                        if 'best_model' in filename.lower() or not files['checkpoint']:
-                            files['checkpoint'] = filepath
-                            print(f"      ✅ 체크포인트: {filename}")
-
-                    # 원본 설정 파일만 찾기 (fixed 파일들 제외)
-                    elif filename == 'config.json':  # 정확히 config.json만
-                        files['config'] = filepath
-                        print(f"      ✅ 설정 파일: {filename}")
+            # 체크포인트는 카탈로그에서 선택된 파일 하나만 사용
+            checkpoint_path = self.selected_checkpoints.get(model_path)
+            if checkpoint_path is None:
+                model_type = 'glowtts' if model_path == self.glowtts_path else 'hifigan'
+                catalog = CheckpointCatalog(os.path.dirname(model_path), '', self.get_index(model_path))
+                checkpoint = catalog.select_checkpoint(catalog.list_checkpoints(model_path),
+                                                       self.get_checkpoint_policy(model_type))
+                checkpoint_path = checkpoint['path'] if checkpoint else None
+
+            if checkpoint_path:
+                files['checkpoint'] = checkpoint_path
+                print(f"      ✅ 체크포인트: {os.path.basename(checkpoint_path)}")
+
+            # 원본 설정 파일만 찾기 (fixed 파일들 제외, 실행 폴더에 가장 가까운 것 우선)
+            config_paths = [os.path.join(root, 'config.json')  # 정확히 config.json만
+                            for root, filenames in self.get_index(model_path).walk(model_path)
+                            if 'config.json' in filenames]
+            if config_paths:
+                files['config'] = min(config_paths, key=lambda path: (path.count(os.sep), path))
+                print(f"      ✅ 설정 파일: {os.path.basename(files['config'])}")
 
         except Exception as e:
             print(f"⚠️ 파일 스캔 실패: {e}")
@@ -89,7 +182,7 @@ class TTSModelLoader:
                 return
 
             cleaned_count = 0
-            for root, dirs, filenames in os.walk(model_path):
+            for root, filenames in self.get_index(model_path).walk(model_path):
                 for filename in filenames:
                     # config_fixed로 시작하는 파일들 삭제
                     if filename.startswith('config_fixed') and filename.endswith('.json'):
@@ -157,9 +250,9 @@ class TTSModelLoader:
                 if not search_path or not os.path.exists(search_path):
                     continue
 
-                for root, dirs, files in os.walk(search_path):
-                    if filename in files:
-                        return os.path.join(root, filename)
+                matches = self.get_index(search_path).find(filename, under=search_path)
+                if matches:
+                    return matches[0]
             return None
 
         except Exception as e:
@@ -167,21 +260,20 @@ class TTSModelLoader:
             return None
 
     def load_config_file(self, config_path, model_type="glowtts"):
-        """설정 파일 로드 및 경로 수정 (고정된 파일명 사용)"""
+        """설정 파일 로드 및 경로 수정 (원본 내용 해시 기준 캐시 사용)"""
         try:
             print(f"      📂 {model_type} 설정 로딩 중: {os.path.basename(config_path)}")
 
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            model_path = self.glowtts_path if model_type == "glowtts" else self.hifigan_path
+
+            # 수정된 config는 모델 폴더가 아닌 사용자 캐시 폴더에 저장
+            config, runtime_config_path = self.config_resolver.resolve(
+                config_path, model_path, self.fix_config_paths)
 
-            # 경로 수정
             if model_type == "glowtts":
-                config = self.fix_config_paths(config, self.glowtts_path)
+                self.glowtts_config_path = runtime_config_path
             else:
-                config = self.fix_config_paths(config, self.hifigan_path)
-
-            # 수정된 config를 고정된 이름으로 저장
-            self.save_fixed_config(config, config_path, model_type)
+                self.hifigan_config_path = runtime_config_path
 
             print(f"      ⚙️ {model_type} 설정 로드 완료!")
             return config
@@ -190,31 +282,6 @@ class TTSModelLoader:
             print(f"      ❌ {model_type} 설정 로드 실패: {e}")
             return None
 
-    def save_fixed_config(self, config, original_path, model_type):
-        """수정된 설정을 고정된 파일명으로 저장"""
-        try:
-            dir_name = os.path.dirname(original_path)
-            # 고정된 파일명 사용 (더 이상 중복 생성 안됨)
-            temp_config_path = os.path.join(dir_name, f"config_{model_type}_runtime.json")
-
-            with open(temp_config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
-
-            print(f"      💾 런타임 설정 파일 저장: {os.path.basename(temp_config_path)}")
-
-            # 경로 업데이트
-            if model_type == "glowtts":
-                self.glowtts_config_path = temp_config_path
-            else:
-                self.hifigan_config_path = temp_config_path
-
-        except Exception as e:
-            print(f"      ⚠️ 런타임 설정 파일 저장 실패: {e}")
-            if model_type == "glowtts":
-                self.glowtts_config_path = original_path
-            else:
-                self.hifigan_config_path = original_path
-
     def load_models(self):
         """TTS 모델들 로드"""
         try:
@@ -231,11 +298,16 @@ class TTSModelLoader:
             # 파일들 찾기
             glowtts_files = self.find_checkpoint_files(self.glowtts_path)
             hifigan_files = self.find_checkpoint_files(self.hifigan_path)
+            self.model_files = {'glowtts': glowtts_files, 'hifigan': hifigan_files}
+
+            # 내보낸 그래프가 있으면 TTS 모델 코드 없이 바로 실행
+            if self.backend != 'torch' and has_export(self.default_export_dir(), self.backend):
+                return self.initialize_exported_runtime()
 
             # 체크포인트 로드
             if glowtts_files['checkpoint']:
                 print(f"   📦 Glow-TTS 체크포인트: {os.path.basename(glowtts_files['checkpoint'])}")
-                self.glowtts_checkpoint = torch.load(glowtts_files['checkpoint'], map_location='cpu')
+                self.glowtts_checkpoint = model_registry.load(glowtts_files['checkpoint'])
 
             if glowtts_files['config']:
                 print(f"   ⚙️ Glow-TTS 설정: {os.path.basename(glowtts_files['config'])}")
@@ -243,7 +315,7 @@ class TTSModelLoader:
 
             if hifigan_files['checkpoint']:
                 print(f"   📦 HiFi-GAN 체크포인트: {os.path.basename(hifigan_files['checkpoint'])}")
-                self.hifigan_checkpoint = torch.load(hifigan_files['checkpoint'], map_location='cpu')
+                self.hifigan_checkpoint = model_registry.load(hifigan_files['checkpoint'])
 
             if hifigan_files['config']:
                 print(f"   ⚙️ HiFi-GAN 설정: {os.path.basename(hifigan_files['config'])}")
@@ -253,7 +325,12 @@ class TTSModelLoader:
             if (self.glowtts_checkpoint and self.hifigan_checkpoint and
                     self.glowtts_config and self.hifigan_config):
                 print("🚀 TTS 모델 초기화 중...")
-                return self.initialize_synthesizer()
+                if not self.initialize_synthesizer():
+                    return False
+                if self.backend != 'torch':
+                    # 처음 한 번은 PyTorch 모델에서 그래프를 내보낸 뒤 전환
+                    return self.initialize_exported_runtime(export=True)
+                return True
             else:
                 print("⚠️ 일부 모델 파일을 찾을 수 없습니다.")
                 return False
@@ -268,26 +345,57 @@ class TTSModelLoader:
             from TTS.utils.synthesizer import Synthesizer
             print("   ✅ TTS Synthesizer import 성공")
 
-            # 체크포인트 파일 경로들
-            glowtts_files = self.find_checkpoint_files(self.glowtts_path)
-            hifigan_files = self.find_checkpoint_files(self.hifigan_path)
+            # 체크포인트 파일 경로들 (load_models에서 찾은 결과 재사용)
+            if self.model_files is None:
+                self.model_files = {'glowtts': self.find_checkpoint_files(self.glowtts_path),
+                                    'hifigan': self.find_checkpoint_files(self.hifigan_path)}
+            glowtts_files = self.model_files['glowtts']
+            hifigan_files = self.model_files['hifigan']
 
             # 런타임 config 파일 경로 사용
             glowtts_config_path = getattr(self, 'glowtts_config_path', glowtts_files['config'])
             hifigan_config_path = getattr(self, 'hifigan_config_path', hifigan_files['config'])
 
-            self.synthesizer = Synthesizer(
-                glowtts_files['checkpoint'],
-                glowtts_config_path,
-                None,
-                hifigan_files['checkpoint'],
-                hifigan_config_path,
-                None,
-                None,
-                False,
-            )
+            # 검증 단계에서 로드한 체크포인트를 Synthesizer가 그대로 재사용
+            with model_registry.shared_torch_load():
+                self.synthesizer = Synthesizer(
+                    glowtts_files['checkpoint'],
+                    glowtts_config_path,
+                    None,
+                    hifigan_files['checkpoint'],
+                    hifigan_config_path,
+                    None,
+                    None,
+                    False,
+                )
 
             print(f"   ✅ Synthesizer 초기화 완료!")
+            model_registry.print_report()
+
+            # CPU 추론 최적화 (int8 양자화 / bf16)
+            self.active_inference_mode = optimize_synthesizer(
+                self.synthesizer, self.inference_mode,
+                {'glowtts': glowtts_files['checkpoint'], 'hifigan': hifigan_files['checkpoint']},
+                self.cache_dir,
+            )
+
+            # Glow-TTS / HiFi-GAN 추론 시간 계측
+            metrics.instrument_method(self.synthesizer.tts_model, 'inference', 'glowtts')
+            metrics.instrument_method(self.synthesizer.vocoder_model, 'inference', 'hifigan')
+
+            # 가중치가 모델로 복사되었으므로 원본 체크포인트는 해제
+            model_registry.release(glowtts_files['checkpoint'])
+            model_registry.release(hifigan_files['checkpoint'])
+            self.glowtts_checkpoint = None
+            self.hifigan_checkpoint = None
+
+            # 로드된 모델 기준으로 캐시 연결 (새 체크포인트면 자동 무효화)
+            if self.synthesis_cache is not None:
+                self.synthesis_cache.bind(fingerprint_model_files(
+                    [glowtts_files['checkpoint'], hifigan_files['checkpoint']],
+                    [self.glowtts_config, self.hifigan_config,
+                     {'inference_mode': self.active_inference_mode}],
+                ))
             self.models_loaded = True
             self.use_synthesizer = True
             return True
@@ -298,10 +406,53 @@ class TTSModelLoader:
             self.use_synthesizer = False
             return False
 
+    def default_export_dir(self):
+        """체크포인트 기준 내보내기 폴더 (export_dir 지정 시 그 경로)"""
+        if self.export_dir:
+            return self.export_dir
+        return default_export_dir([self.model_files['glowtts']['checkpoint'],
+                                   self.model_files['hifigan']['checkpoint']], self.cache_dir)
+
+    def initialize_exported_runtime(self, export=False):
+        """내보낸 TorchScript/ONNX 그래프 실행기로 합성기 교체"""
+        try:
+            export_dir = self.default_export_dir()
+            if export:
+                print(f"📤 {self.backend} 그래프 내보내는 중...")
+                export_synthesizer(self.synthesizer, export_dir, self.backend,
+                                   getattr(self, 'glowtts_config_path', None))
+
+            self.synthesizer = ExportedSynthesizer.load(export_dir, self.backend)
+            self.batch_synthesizer = None
+            self.streaming_vocoder = None
+            metrics.instrument_method(self.synthesizer, 'text_to_mel', 'glowtts')
+            metrics.instrument_method(self.synthesizer, 'vocode', 'hifigan')
+            print(f"   ✅ {self.backend} 실행기 초기화 완료!")
+
+            if self.synthesis_cache is not None:
+                self.synthesis_cache.bind(fingerprint_model_files(
+                    [self.model_files['glowtts']['checkpoint'], self.model_files['hifigan']['checkpoint']],
+                    [self.synthesizer.manifest],
+                ))
+            self.models_loaded = True
+            self.use_synthesizer = True
+            return True
+
+        except Exception as e:
+            print(f"   ❌ {self.backend} 실행기 초기화 실패: {e}")
+            self.models_loaded = False
+            self.use_synthesizer = False
+            return False
+
     def normalize_text(self, text):
         """텍스트 정규화"""
+        start = time.perf_counter()
         try:
-            import re
+            if self.korean_normalizer is not None:
+                normalized = self.korean_normalizer.normalize(text)
+                if normalized is not None:
+                    metrics.observe('normalize_text', time.perf_counter() - start)
+                    return normalized
 
             # 기본 정리
             text = text.strip()
@@ -310,57 +461,249 @@ class TTSModelLoader:
             for c in ",;:":
                 text = text.replace(c, ".")
 
-            # 영어 알파벳을 한글로 변환
-            alphabet_map = {
-                'a': '에이', 'b': '비', 'c': '씨', 'd': '디', 'e': '이', 'f': '에프',
-                'g': '쥐', 'h': '에이치', 'i': '아이', 'j': '제이', 'k': '케이', 'l': '엘',
-                'm': '엠', 'n': '엔', 'o': '오', 'p': '피', 'q': '큐', 'r': '알',
-                's': '에스', 't': '티', 'u': '유', 'v': '브이', 'w': '더블유', 'x': '엑스',
-                'y': '와이', 'z': '지'
-            }
-
-            for eng, kor in alphabet_map.items():
-                text = re.sub(f'({eng}|{eng.upper()})', kor, text)
+            # 영어 알파벳을 한글로 변환 (단일 패스)
+            text = alphabet_text(text)
 
             # 마침표 추가
             if text and text[-1] not in '.!?':
                 text += '.'
 
+            metrics.observe('normalize_text', time.perf_counter() - start)
             return text
 
         except Exception as e:
             print(f"   ⚠️ 정규화 실패: {e}")
             return text
 
+    def remove_duplicated_punctuations(self, text):
+        """연속된 문장부호 정리"""
+        text = re.sub(r"[.?!]+\?", "?", text)
+        text = re.sub(r"[.?!]+!", "!", text)
+        text = re.sub(r"[.?!]+\.", ".", text)
+        return text
+
+    def split_text(self, text):
+        """문장 단위로 분리 (문장부호 없는 마지막 문장도 포함)"""
+        text = self.remove_duplicated_punctuations(text)
+
+        texts = []
+        for subtext in re.findall(r'[^.!?\n]*[.!?\n]|[^.!?\n]+$', text):
+            subtext = subtext.strip()
+            if subtext and subtext not in '.!?':
+                texts.append(subtext)
+
+        return texts
+
+    def _synthesize_normalized(self, normalized_text):
+        """정규화된 텍스트 합성 (캐시 우선)"""
+        if self.synthesis_cache is not None:
+            cached_wav = self.synthesis_cache.get(normalized_text)
+            if cached_wav is not None:
+                return cached_wav
+
+        wav = self.synthesizer.tts(normalized_text, None, None)
+
+        if self.synthesis_cache is not None:
+            self.synthesis_cache.put(normalized_text, wav)
+        return wav
+
     def synthesize(self, text):
         """텍스트를 음성으로 합성"""
         if not self.models_loaded or not self.use_synthesizer:
             return None
 
         try:
+            start = time.perf_counter()
             normalized_text = self.normalize_text(text)
-            wav = self.synthesizer.tts(normalized_text, None, None)
+            wav = self._synthesize_normalized(normalized_text)
+            if wav is not None:
+                metrics.record_utterance(time.perf_counter() - start,
+                                         len(wav) / self.synthesizer.output_sample_rate)
             return wav
         except Exception as e:
             print(f"❌ 음성 합성 실패: {e}")
             return None
 
-    def cleanup_runtime_files(self):
-        """프로그램 종료 시 런타임 파일들 정리 (선택사항)"""
+    def synthesize_batch(self, texts, batch_size=8):
+        """여러 문장을 길이별 배치로 합성하여 입력 순서대로 파형 목록 반환"""
+        if not self.models_loaded or not self.use_synthesizer:
+            return [None] * len(texts)
+
+        return self.synthesize_normalized_batch([self.normalize_text(text) for text in texts], batch_size)
+
+    def synthesize_normalized_batch(self, normalized_texts, batch_size=8):
+        """정규화된 문장 목록을 배치로 합성 (normalize_text를 이미 적용한 입력, 다시 정규화하지 않음)"""
+        if not self.models_loaded or not self.use_synthesizer:
+            return [None] * len(normalized_texts)
+
+        wavs = [None] * len(normalized_texts)
+
+        # 캐시에 없는 문장만 합성
+        pending = []
+        for i, normalized_text in enumerate(normalized_texts):
+            if self.synthesis_cache is not None:
+                wavs[i] = self.synthesis_cache.get(normalized_text)
+            if wavs[i] is None and normalized_text:
+                pending.append(i)
+
+        if not pending:
+            return wavs
+
+        if self.worker_pool is not None and not self.worker_pool.broken:
+            # 워커 프로세스에 문장별로 분산
+            pool_wavs, _ = self.worker_pool.synthesize_normalized([normalized_texts[i] for i in pending])
+            for i, wav in zip(pending, pool_wavs):
+                wavs[i] = wav
+                if wav is not None and self.synthesis_cache is not None:
+                    self.synthesis_cache.put(normalized_texts[i], wav)
+            if not self.worker_pool.broken:
+                return wavs
+
+            # 워커가 죽어 결과를 받지 못한 문장은 이 프로세스에서 합성
+            print("⚠️ 워커 풀을 사용할 수 없어 이 프로세스에서 합성합니다.")
+            pending = [i for i in pending if wavs[i] is None]
+            if not pending:
+                return wavs
+
+        if self.backend != 'torch':
+            # 내보낸 그래프는 배치 1 기준이므로 순차 합성
+            for i in pending:
+                try:
+                    wavs[i] = self._synthesize_normalized(normalized_texts[i])
+                except Exception as e:
+                    print(f"❌ 문장 합성 실패: {normalized_texts[i]} ({e})")
+            return wavs
+
+        try:
+            if self.batch_synthesizer is None:
+                self.batch_synthesizer = BatchSynthesizer(self.synthesizer)
+            self.batch_synthesizer.batch_size = batch_size
+
+            if not self.batch_synthesizer.supports_batching():
+                raise RuntimeError("보코더 샘플레이트가 달라 배치 추론 불가")
+
+            batch_wavs = self.batch_synthesizer.synthesize_batch([normalized_texts[i] for i in pending])
+            for i, wav in zip(pending, batch_wavs):
+                wavs[i] = wav
+                if self.synthesis_cache is not None:
+                    self.synthesis_cache.put(normalized_texts[i], wav)
+
+        except Exception as e:
+            print(f"⚠️ 배치 합성 실패, 순차 합성으로 전환: {e}")
+            for i in pending:
+                try:
+                    wavs[i] = self._synthesize_normalized(normalized_texts[i])
+                except Exception as sentence_error:
+                    print(f"❌ 문장 합성 실패: {normalized_texts[i]} ({sentence_error})")
+
+        return wavs
+
+    def start_worker_pool(self, num_workers=None, threads_per_worker=None):
+        """synthesize_batch를 여러 프로세스로 나누어 처리하는 워커 풀 시작 (모델 로드 후 호출)"""
+        if not self.models_loaded:
+            print("⚠️ 모델이 로드되지 않아 워커 풀을 시작할 수 없습니다.")
+            return None
         try:
-            paths_to_clean = [
-                getattr(self, 'glowtts_config_path', None),
-                getattr(self, 'hifigan_config_path', None)
-            ]
+            self.stop_worker_pool()
+            self.worker_pool = SynthesisWorkerPool(self, num_workers, threads_per_worker)
+            return self.worker_pool
+        except Exception as e:
+            print(f"❌ 워커 풀 시작 실패: {e}")
+            self.worker_pool = None
+            return None
+
+    def stop_worker_pool(self):
+        if self.worker_pool is not None:
+            self.worker_pool.close()
+            self.worker_pool = None
+
+    def use_streaming_vocoder(self):
+        """구간별 보코딩 사용 가능 여부 (torch 백엔드, 보코더 샘플레이트 동일)"""
+        if not self.vocoder_chunk_frames or self.backend != 'torch':
+            return False
+        if self.batch_synthesizer is None:
+            self.batch_synthesizer = BatchSynthesizer(self.synthesizer)
+        return self.batch_synthesizer.supports_batching()
+
+    def _stream_normalized(self, normalized_text):
+        """정규화된 문장을 멜 구간별로 보코딩하여 오디오 블록 반환 (첫 블록 지연이 문장 길이와 무관)
+
+        블록에는 Synthesizer.tts의 문장 분리/문장 뒤 무음이 없어 합성 캐시에는 저장하지 않습니다
+        (캐시는 synthesize와 같은 파형만 보관).
+        """
+        if self.streaming_vocoder is None:
+            self.streaming_vocoder = StreamingVocoder(self.synthesizer.vocoder_model,
+                                                      self.batch_synthesizer.hop_length,
+                                                      self.vocoder_chunk_frames)
+
+        token_ids = self.batch_synthesizer.text_to_ids(normalized_text)
+        mels, _ = self.batch_synthesizer.text_to_mels([token_ids])
+        yield from self.streaming_vocoder.stream(mels[0])
+
+    def synthesize_stream(self, text):
+        """문장 단위로 합성하여 완성되는 대로 float32 오디오 청크 반환 (제너레이터)
+
+        vocoder_chunk_frames가 지정되면 문장 안에서도 멜 구간 단위로 블록을 반환합니다.
+        """
+        if not self.models_loaded or not self.use_synthesizer:
+            return
+
+        # 소비 측(재생) 대기 시간을 제외한 합성 시간과 오디오 길이로 RTF 기록
+        compute_seconds = 0.0
+        total_samples = 0
+        for sentence in self.split_text(text):
+            try:
+                start = time.perf_counter()
+                normalized_text = self.normalize_text(sentence)
+                if not normalized_text:
+                    continue
+
+                if self.use_streaming_vocoder():
+                    wav = self.synthesis_cache.get(normalized_text) if self.synthesis_cache is not None else None
+                    if wav is None:
+                        blocks = self._stream_normalized(normalized_text)
+                        while True:
+                            block = next(blocks, None)
+                            compute_seconds += time.perf_counter() - start
+                            if block is None:
+                                break
+                            total_samples += len(block)
+                            yield block
+                            start = time.perf_counter()
+                        continue
+                else:
+                    wav = self._synthesize_normalized(normalized_text)
+
+                compute_seconds += time.perf_counter() - start
+                if wav is not None:
+                    total_samples += len(wav)
+                    yield np.asarray(wav, dtype=np.float32)
+            except Exception as e:
+                print(f"❌ 문장 합성 실패: {sentence} ({e})")
+
+        if total_samples:
+            metrics.record_utterance(compute_seconds, total_samples / self.synthesizer.output_sample_rate)
 
+    def cleanup_runtime_files(self):
+        """이전 버전이 모델 폴더에 남긴 런타임 config 파일 정리 (선택사항)
+
+        현재 런타임 config는 사용자 캐시 폴더에 내용 해시 이름으로 저장되어
+        다른 프로세스와 공유되므로 여기서 삭제하지 않습니다.
+        """
+        try:
             cleaned_count = 0
-            for path in paths_to_clean:
-                if path and os.path.exists(path) and 'runtime' in path:
-                    try:
-                        os.remove(path)
-                        cleaned_count += 1
-                    except:
-                        pass
+            for model_path in (self.glowtts_path, self.hifigan_path):
+                if not model_path or not os.path.exists(model_path):
+                    continue
+
+                for model_type in ("glowtts", "hifigan"):
+                    path = os.path.join(model_path, f"config_{model_type}_runtime.json")
+                    if os.path.exists(path):
+                        try:
+                            os.remove(path)
+                            cleaned_count += 1
+                        except:
+                            pass
 
             if cleaned_count > 0:
                 print(f"🧹 런타임 파일 {cleaned_count}개 정리 완료")
@@ -368,9 +711,7 @@ class TTSModelLoader:
         except Exception as e:
             print(f"⚠️ 런타임 파일 정리 실패: {e}")
 
-    def __del__(self):
-        """소멸자 - 런타임 파일 자동 정리"""
-        try:
-            self.cleanup_runtime_files()
-        except:
-            pass  # 소멸자에서는 예외 무시
\ No newline at end of file
+
+# 환경 변수로 경로가 지정되면 import 시점에 체크포인트 미리 로드
+if os.environ.get('TTS_PRELOAD_DATA_PATH'):
+    TTSModelLoader.preload(os.environ['TTS_PRELOAD_DATA_PATH'])
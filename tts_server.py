@@ -0,0 +1,371 @@
+"""
+로컬 HTTP 합성 서버 모듈 (asyncio 기반, 동일 요청 병합 + 마이크로 배치)
+"""
+import io
+import json
+import time
+import wave
+import asyncio
+from urllib.parse import urlsplit, parse_qs
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+HTTP_STATUS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+               413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+MAX_BODY_BYTES = 64 * 1024
+
+
+def wav_bytes(wav, sample_rate):
+    """float 파형 → 16비트 PCM WAV 바이트"""
+    pcm = (np.clip(np.asarray(wav, dtype=np.float32), -1.0, 1.0) * 32767).astype('<i2')
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm.tobytes())
+    return buffer.getvalue()
+
+
+def pcm_bytes(wav):
+    """float 파형 → audio/L16 PCM 바이트 (RFC 2586: 네트워크 바이트 순서, 빅엔디언)"""
+    return (np.clip(np.asarray(wav, dtype=np.float32), -1.0, 1.0) * 32767).astype('>i2').tobytes()
+
+
+class SynthesisScheduler:
+    """문장 합성 요청 스케줄러
+
+    - 같은 정규화 문장이 처리 중이면 새로 합성하지 않고 그 결과를 함께 기다립니다 (병합).
+    - 서로 다른 문장은 batch_window 동안 모아 synthesize_normalized_batch 한 번으로 합성합니다 (마이크로 배치).
+    모델은 스레드 안전하지 않으므로 합성은 전용 스레드 하나에서만 실행합니다.
+    정규화(g2pK 사용 시 MeCab 형태소 분석)도 이벤트 루프를 막지 않도록 별도 스레드 하나에서 실행합니다.
+    """
+
+    def __init__(self, loader, max_batch_size=8, batch_window=0.01):
+        self.loader = loader
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+
+        self._queue = None
+        self._inflight = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts-synthesis")
+        self._normalize_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts-normalize")
+        self._worker = None
+
+        self.stats = {'requests': 0, 'coalesced': 0, 'batches': 0, 'batched_sentences': 0,
+                      'queue_wait_sec': 0.0, 'compute_sec': 0.0}
+
+    def start(self):
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._executor.shutdown(wait=False)
+        self._normalize_executor.shutdown(wait=False)
+
+    async def synthesize(self, text):
+        """문장 하나 합성 후 (파형, 타이밍 dict) 반환"""
+        arrival = time.perf_counter()
+        key = await asyncio.get_running_loop().run_in_executor(
+            self._normalize_executor, self.loader.normalize_text, text)
+        self.stats['requests'] += 1
+
+        future = self._inflight.get(key)
+        coalesced = future is not None
+        if coalesced:
+            self.stats['coalesced'] += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            await self._queue.put((key, future))
+
+        wav, batch_start, batch_end, batch_size = await asyncio.shield(future)
+
+        # 병합된 요청은 자신이 도착한 시점부터 계산
+        queue_wait = max(0.0, batch_start - arrival)
+        compute = batch_end - max(batch_start, arrival)
+        self.stats['queue_wait_sec'] += queue_wait
+        self.stats['compute_sec'] += compute
+        return wav, {'queue_wait': queue_wait, 'compute': compute,
+                     'coalesced': coalesced, 'batch_size': batch_size}
+
+    async def _collect_batch(self):
+        """첫 요청 이후 batch_window 동안 들어온 요청을 최대 max_batch_size까지 모음"""
+        batch = [await self._queue.get()]
+        deadline = time.perf_counter() + self.batch_window
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect_batch()
+            keys = [key for key, _ in batch]
+
+            batch_start = time.perf_counter()
+            try:
+                wavs = await loop.run_in_executor(
+                    self._executor, self.loader.synthesize_normalized_batch, keys, self.max_batch_size)
+                error = None
+            except Exception as e:
+                wavs, error = None, e
+            batch_end = time.perf_counter()
+
+            self.stats['batches'] += 1
+            self.stats['batched_sentences'] += len(batch)
+
+            for i, (key, future) in enumerate(batch):
+                self._inflight.pop(key, None)
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                elif wavs[i] is None:
+                    future.set_exception(RuntimeError(f"합성 실패: {key}"))
+                else:
+                    future.set_result((wavs[i], batch_start, batch_end, len(batch)))
+
+    def get_stats(self):
+        stats = dict(self.stats)
+        requests = max(stats['requests'], 1)
+        stats['avg_queue_wait_ms'] = stats['queue_wait_sec'] / requests * 1000
+        stats['avg_compute_ms'] = stats['compute_sec'] / requests * 1000
+        stats['avg_batch_size'] = stats['batched_sentences'] / max(stats['batches'], 1)
+        stats['pending'] = self._queue.qsize() if self._queue is not None else 0
+        return stats
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class TTSServer:
+    """TTSModelLoader 위의 경량 HTTP 서버
+
+    GET/POST /synthesize          → audio/wav (전체 파형)
+    GET/POST /synthesize/stream   → chunked audio/L16 (문장 단위 PCM, 타이밍은 트레일러)
+    GET      /stats               → 스케줄러 통계 JSON
+    텍스트는 ?text= 쿼리 또는 {"text": ...} JSON 본문으로 전달합니다.
+    """
+
+    def __init__(self, loader, host='127.0.0.1', port=8000, max_batch_size=8, batch_window=0.01):
+        self.loader = loader
+        self.host = host
+        self.port = port
+        self.scheduler = SynthesisScheduler(loader, max_batch_size, batch_window)
+        self.server = None
+
+    @property
+    def sample_rate(self):
+        return self.loader.synthesizer.output_sample_rate
+
+    async def start(self):
+        self.scheduler.start()
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        print(f"🌐 TTS 서버 시작: http://{self.host}:{self.port}")
+        return self.server
+
+    async def stop(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        await self.scheduler.stop()
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def read_request(self, reader):
+        """요청 줄/헤더/본문 파싱 → (메서드, 경로, 쿼리 dict, 헤더 dict, 본문)"""
+        request_line = (await reader.readline()).decode('latin-1').strip()
+        if not request_line:
+            return None
+        try:
+            method, target, _ = request_line.split(' ', 2)
+        except ValueError:
+            raise HTTPError(400, "잘못된 요청 줄")
+
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode('latin-1')
+            if line in ('\r\n', '\n', ''):
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get('content-length', 0) or 0)
+        except ValueError:
+            raise HTTPError(400, "잘못된 Content-Length")
+        if length < 0:
+            raise HTTPError(400, "잘못된 Content-Length")
+        if length > MAX_BODY_BYTES:
+            raise HTTPError(413, "본문이 너무 큽니다")
+        body = await reader.readexactly(length) if length else b''
+
+        url = urlsplit(target)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        return method.upper(), url.path.rstrip('/') or '/', query, headers, body
+
+    @staticmethod
+    def get_text(query, headers, body):
+        text = query.get('text')
+        if text is None and body:
+            if 'json' in headers.get('content-type', 'application/json'):
+                try:
+                    text = json.loads(body.decode('utf-8')).get('text')
+                except (ValueError, AttributeError):
+                    raise HTTPError(400, "JSON 본문 파싱 실패")
+            else:
+                text = body.decode('utf-8')
+        if not text or not text.strip():
+            raise HTTPError(400, "text가 비어 있습니다")
+        return text
+
+    async def send_response(self, writer, status, body, content_type='application/json', headers=None):
+        lines = [f"HTTP/1.1 {status} {HTTP_STATUS.get(status, '')}",
+                 f"Content-Type: {content_type}",
+                 f"Content-Length: {len(body)}",
+                 "Connection: close"]
+        lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+        await writer.drain()
+
+    async def send_json(self, writer, status, data):
+        await self.send_response(writer, status, json.dumps(data, ensure_ascii=False).encode('utf-8'),
+                                 'application/json; charset=utf-8')
+
+    async def handle_connection(self, reader, writer):
+        try:
+            request = await self.read_request(reader)
+            if request is None:
+                return
+            method, path, query, headers, body = request
+
+            if method not in ('GET', 'POST'):
+                raise HTTPError(405, "GET 또는 POST만 지원합니다")
+            if path == '/stats':
+                await self.send_json(writer, 200, self.scheduler.get_stats())
+            elif path in ('/synthesize', '/synthesize/stream'):
+                if not self.loader.models_loaded:
+                    raise HTTPError(503, "TTS 모델이 로드되지 않았습니다")
+                text = self.get_text(query, headers, body)
+                if path == '/synthesize':
+                    await self.handle_synthesize(writer, text)
+                else:
+                    await self.handle_stream(writer, text)
+            else:
+                raise HTTPError(404, f"알 수 없는 경로: {path}")
+
+        except HTTPError as e:
+            await self.send_json(writer, e.status, {'error': e.message})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as e:
+            print(f"❌ 요청 처리 실패: {e}")
+            try:
+                await self.send_json(writer, 500, {'error': str(e)})
+            except ConnectionError:
+                pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def timing_headers(timings):
+        """문장별 타이밍 합계 → 응답 헤더"""
+        return {
+            'X-Queue-Wait-Ms': f"{sum(t['queue_wait'] for t in timings) * 1000:.1f}",
+            'X-Compute-Ms': f"{sum(t['compute'] for t in timings) * 1000:.1f}",
+            'X-Coalesced': str(sum(t['coalesced'] for t in timings)),
+            'X-Batch-Size': str(max((t['batch_size'] for t in timings), default=0)),
+            'X-Sentences': str(len(timings)),
+        }
+
+    async def handle_synthesize(self, writer, text):
+        sentences = self.loader.split_text(text) or [text]
+        results = await asyncio.gather(*[self.scheduler.synthesize(s) for s in sentences])
+
+        wav = np.concatenate([np.asarray(w, dtype=np.float32) for w, _ in results])
+        await self.send_response(writer, 200, wav_bytes(wav, self.sample_rate), 'audio/wav',
+                                 self.timing_headers([timing for _, timing in results]))
+
+    async def handle_stream(self, writer, text):
+        """문장을 모두 스케줄러에 넣고, 입력 순서대로 완성되는 즉시 청크 전송"""
+        sentences = self.loader.split_text(text) or [text]
+        tasks = [asyncio.ensure_future(self.scheduler.synthesize(s)) for s in sentences]
+
+        header = ["HTTP/1.1 200 OK",
+                  f"Content-Type: audio/L16; rate={self.sample_rate}; channels=1",
+                  "Transfer-Encoding: chunked",
+                  "Trailer: X-Queue-Wait-Ms, X-Compute-Ms, X-Coalesced, X-Batch-Size, X-Sentences",
+                  "Connection: close"]
+        writer.write(('\r\n'.join(header) + '\r\n\r\n').encode('latin-1'))
+        await writer.drain()
+
+        timings = []
+        try:
+            for task in tasks:
+                wav, timing = await task
+                timings.append(timing)
+                chunk = pcm_bytes(wav)
+                writer.write(f"{len(chunk):X}\r\n".encode('latin-1') + chunk + b"\r\n")
+                await writer.drain()
+        except ConnectionError:
+            return
+        except Exception as e:
+            # 헤더를 이미 보냈으므로 종료 청크 없이 연결을 끊어 실패를 알림
+            print(f"❌ 스트리밍 합성 실패: {e}")
+            return
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        trailers = ''.join(f"{name}: {value}\r\n" for name, value in self.timing_headers(timings).items())
+        writer.write(("0\r\n" + trailers + "\r\n").encode('latin-1'))
+        await writer.drain()
+
+
+if __name__ == "__main__":
+    import argparse
+    from tts_model_loader import TTSModelLoader
+
+    parser = argparse.ArgumentParser(description="로컬 TTS HTTP 서버")
+    parser.add_argument('data_path', nargs='?', default='data')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--batch-size', type=int, default=8)
+    parser.add_argument('--batch-window-ms', type=float, default=10.0)
+    options = parser.parse_args()
+
+    tts_loader = TTSModelLoader(options.data_path)
+    if tts_loader.load_models():
+        server = TTSServer(tts_loader, options.host, options.port,
+                           options.batch_size, options.batch_window_ms / 1000)
+        try:
+            asyncio.run(server.serve_forever())
+        except KeyboardInterrupt:
+            print("\n👋 TTS 서버 종료")
+    else:
+        print("❌ TTS 모델을 로드할 수 없어 서버를 시작하지 않습니다.")
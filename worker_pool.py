@@ -0,0 +1,259 @@
+"""
+멀티프로세스 합성 워커 풀 모듈 (fork 전 로드한 모델 가중치를 공유 메모리로 공유)
+"""
+import os
+import time
+import multiprocessing
+from multiprocessing.connection import wait
+
+import numpy as np
+import torch
+
+# fork로 자식 프로세스에 전달할 로더 (피클링 없이 부모 메모리를 그대로 상속)
+_worker_loader = None
+
+# 결과 대기 중 워커 생존 확인 간격 (초)
+RESULT_POLL_SECONDS = 0.5
+
+
+def share_model_memory(synthesizer):
+    """모델 텐서를 공유 메모리로 옮겨 워커가 가중치를 복사하지 않도록 함"""
+    shared_bytes = 0
+    for name in ('tts_model', 'vocoder_model'):
+        model = getattr(synthesizer, name, None)
+        if isinstance(model, torch.nn.Module):
+            model.share_memory()
+            shared_bytes += sum(t.element_size() * t.nelement()
+                                for t in list(model.parameters()) + list(model.buffers()))
+    return shared_bytes
+
+
+def process_memory(pid):
+    """프로세스 메모리 (Linux smaps_rollup 기준 rss/pss/uss 바이트, 없으면 None)"""
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", 'r') as f:
+            values = {}
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0].endswith(':') and parts[1].isdigit():
+                    values[parts[0][:-1]] = int(parts[1]) * 1024
+    except OSError:
+        return None
+
+    return {
+        'rss': values.get('Rss', 0),
+        'pss': values.get('Pss', 0),
+        'uss': values.get('Private_Clean', 0) + values.get('Private_Dirty', 0),
+    }
+
+
+def _worker_main(task_queue, result_connection, threads):
+    """워커 프로세스: 정규화된 문장을 받아 합성 결과를 돌려줌
+
+    결과는 전용 파이프로 바로 보내므로(Queue의 백그라운드 전송 스레드 없음),
+    다음 문장 합성 중에 죽어도 이전 결과가 중간까지만 전송되는 일이 없습니다.
+    """
+    torch.set_num_threads(threads)
+    synthesizer = _worker_loader.synthesizer
+    result_connection.send(('ready', os.getpid(), None))
+
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+
+        task_id, normalized_text = task
+        start = time.perf_counter()
+        try:
+            with torch.no_grad():
+                wav = np.asarray(synthesizer.tts(normalized_text, None, None), dtype=np.float32)
+            result_connection.send((task_id, wav, time.perf_counter() - start))
+        except Exception as e:
+            result_connection.send((task_id, None, f"{type(e).__name__}: {e}"))
+
+
+class SynthesisWorkerPool:
+    """문장별로 여러 프로세스에서 동시에 합성하는 워커 풀
+
+    부모 프로세스에서 모델을 로드한 뒤 fork하므로 워커마다 모델을 다시 로드하지 않고,
+    모델 텐서는 공유 메모리에 두어 워커 수만큼 가중치 사본이 생기지 않습니다.
+    워커별 torch 스레드 수는 기본적으로 (CPU 코어 수 / 워커 수)입니다.
+    워커가 비정상 종료되면 남은 문장은 실패로 돌려주고, 이후 풀은 사용 불가(broken)로 표시됩니다.
+    """
+
+    def __init__(self, loader, num_workers=None, threads_per_worker=None):
+        if not loader.models_loaded:
+            raise RuntimeError("워커 풀을 만들기 전에 모델을 로드해야 합니다.")
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("이 플랫폼은 fork를 지원하지 않아 워커 풀을 사용할 수 없습니다.")
+
+        cpu_count = os.cpu_count() or 1
+        self.loader = loader
+        self.num_workers = num_workers or cpu_count
+        self.threads_per_worker = threads_per_worker or max(1, cpu_count // self.num_workers)
+        self.shared_bytes = share_model_memory(loader.synthesizer)
+
+        global _worker_loader
+        _worker_loader = loader
+
+        context = multiprocessing.get_context('fork')
+        self.task_queue = context.Queue()
+        self.processes = []
+        self._result_connections = []
+        for i in range(self.num_workers):
+            reader, writer = context.Pipe(duplex=False)
+            process = context.Process(target=_worker_main, name=f"tts-worker-{i}",
+                                      args=(self.task_queue, writer, self.threads_per_worker), daemon=True)
+            process.start()
+            # 부모 쪽 쓰기 끝을 닫아야 워커가 죽었을 때 읽기 끝이 EOF가 됨
+            writer.close()
+            self.processes.append(process)
+            self._result_connections.append(reader)
+
+        # 모든 워커가 준비될 때까지 대기 (시작 중 종료된 워커가 있으면 풀을 닫고 실패)
+        self.broken = None
+        self.worker_pids = []
+        try:
+            for _ in self.processes:
+                self.worker_pids.append(self._get_result()[1])
+        except RuntimeError:
+            self.close()
+            raise
+        self._next_task_id = 0
+        print(f"👷 합성 워커 {self.num_workers}개 시작 (워커당 스레드 {self.threads_per_worker}, "
+              f"공유 가중치 {self.shared_bytes / 1024 / 1024:.1f}MB)")
+
+    def dead_workers(self):
+        return [process for process in self.processes if process.exitcode is not None]
+
+    def _get_result(self):
+        """결과 하나 대기 (받을 결과 없이 종료된 워커가 있으면 풀을 broken으로 표시하고 RuntimeError)"""
+        while True:
+            for connection in wait(self._result_connections, timeout=RESULT_POLL_SECONDS):
+                try:
+                    return connection.recv()
+                except EOFError:
+                    self._result_connections.remove(connection)  # 워커가 종료되어 닫힌 파이프
+
+            dead = self.dead_workers()
+            if dead:
+                self.broken = ", ".join(f"{process.name}(exitcode {process.exitcode})" for process in dead)
+                raise RuntimeError(f"합성 워커 종료: {self.broken}")
+
+    def synthesize_normalized(self, normalized_texts):
+        """정규화된 문장 목록을 워커에 나누어 합성하고 입력 순서대로 (파형 목록, 워커 합성 시간 목록) 반환
+
+        워커가 죽으면 아직 결과가 없는 문장은 None으로 돌려줍니다.
+        """
+        if self.broken:
+            raise RuntimeError(f"워커 풀 사용 불가: {self.broken}")
+
+        task_ids = []
+        for text in normalized_texts:
+            task_ids.append(self._next_task_id)
+            self.task_queue.put((self._next_task_id, text))
+            self._next_task_id += 1
+
+        index = {task_id: i for i, task_id in enumerate(task_ids)}
+        wavs = [None] * len(normalized_texts)
+        elapsed = [0.0] * len(normalized_texts)
+        remaining = set(task_ids)
+        while remaining:
+            try:
+                task_id, wav, info = self._get_result()
+            except RuntimeError as e:
+                print(f"❌ {e} - 남은 문장 {len(remaining)}개 실패 처리")
+                break
+            if task_id not in remaining:
+                continue  # 이전 호출에서 실패 처리한 작업의 늦은 결과
+            remaining.discard(task_id)
+            i = index[task_id]
+            if wav is None:
+                print(f"❌ 워커 합성 실패: {normalized_texts[i]} ({info})")
+            else:
+                wavs[i], elapsed[i] = wav, info
+        return wavs, elapsed
+
+    def memory_report(self):
+        """부모/워커 프로세스 메모리 (USS는 프로세스 고유, PSS는 공유분을 나눈 값)"""
+        report = {'parent': process_memory(os.getpid())}
+        for i, pid in enumerate(self.worker_pids):
+            report[f"worker_{i}"] = process_memory(pid)
+        return report
+
+    def close(self):
+        for _ in self.processes:
+            self.task_queue.put(None)
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for connection in self._result_connections:
+            connection.close()
+        self.processes = []
+        self._result_connections = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def benchmark_worker_scaling(loader, texts, worker_counts=None, repeats=2):
+    """워커 수(1 ~ 전체 코어)에 따른 처리량과 메모리 비교"""
+    cpu_count = os.cpu_count() or 1
+    if worker_counts is None:
+        worker_counts = sorted({1, cpu_count} | {2 ** i for i in range(1, cpu_count.bit_length())
+                                                 if 2 ** i < cpu_count})
+
+    normalized_texts = [loader.normalize_text(text) for text in texts]
+    results = []
+    for num_workers in worker_counts:
+        with SynthesisWorkerPool(loader, num_workers) as pool:
+            pool.synthesize_normalized(normalized_texts[:num_workers])  # 워밍업
+
+            best = float('inf')
+            samples = 0
+            for _ in range(repeats):
+                start = time.perf_counter()
+                wavs, _ = pool.synthesize_normalized(normalized_texts)
+                best = min(best, time.perf_counter() - start)
+                samples = sum(len(wav) for wav in wavs if wav is not None)
+
+            memory = pool.memory_report()
+            worker_memory = [info for name, info in memory.items() if name != 'parent' and info]
+            results.append({
+                'workers': num_workers,
+                'threads_per_worker': pool.threads_per_worker,
+                'seconds': best,
+                'sentences_per_sec': len(texts) / best,
+                'rtf': best / (samples / loader.synthesizer.output_sample_rate),
+                'worker_uss_bytes': sum(info['uss'] for info in worker_memory),
+                'worker_pss_bytes': sum(info['pss'] for info in worker_memory),
+            })
+
+    print(f"📊 워커 풀 확장성 ({len(texts)}문장, CPU {cpu_count}개)")
+    for result in results:
+        print(f"   워커 {result['workers']:2d} x 스레드 {result['threads_per_worker']:2d}: "
+              f"{result['sentences_per_sec']:.2f} 문장/초, RTF {result['rtf']:.3f}, "
+              f"워커 고유 메모리 {result['worker_uss_bytes'] / 1024 / 1024:.0f}MB")
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+    from tts_model_loader import TTSModelLoader
+
+    tts_loader = TTSModelLoader(sys.argv[1] if len(sys.argv) > 1 else "data", use_cache=False)
+    if tts_loader.load_models():
+        benchmark_worker_scaling(tts_loader, [
+            "안녕하세요.",
+            "오늘 날씨가 정말 좋네요.",
+            "간장 공장 공장장은 강 공장장이고 된장 공장 공장장은 공 공장장이다.",
+            "저는 음성 합성 시스템입니다.",
+            "내일 다시 만나요!",
+            "경찰청 철창살은 외철창살이냐 쌍철창살이냐.",
+            "감사합니다.",
+            "이 문장은 워커 수에 따른 처리량을 측정하기 위한 조금 더 긴 문장입니다.",
+        ] * 2)